@@ -1,7 +1,8 @@
 import sqlite3
+import numpy as np
 import pandas as pd
-from typing import Dict, List, Tuple
-from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass, fields
 
 @dataclass
 class RouteAnalysis:
@@ -18,6 +19,45 @@ class RouteAnalysis:
     salary_cost_rail: float  # EUR
     salary_cost_bus: float  # EUR
 
+def solve_mode_knapsack(weights: np.ndarray, values: np.ndarray, budget: int) -> np.ndarray:
+    """
+    Exact multiple-choice knapsack: pick at most one option per match.
+
+    Args:
+        weights: (matches, options) integer cost of each option in budget units
+        values: (matches, options) value of each option; -inf marks an infeasible option
+        budget: Total budget in the same units as weights
+
+    Returns:
+        Chosen option per match: 0 for none (stay with air), j for option j - 1
+    """
+    n_matches, n_options = weights.shape
+    best = np.zeros(budget + 1)  # best[c] = best value using at most c budget
+    picks = np.zeros((n_matches, budget + 1), dtype=np.int8)
+
+    for i in range(n_matches):
+        new_best = best.copy()
+        for j in range(n_options):
+            weight, value = int(weights[i, j]), values[i, j]
+            if not np.isfinite(value) or value <= 0 or weight > budget:
+                continue
+            candidate = np.full(budget + 1, -np.inf)
+            candidate[weight:] = best[:budget + 1 - weight] + value
+            better = candidate > new_best
+            new_best[better] = candidate[better]
+            picks[i, better] = j + 1
+        best = new_best
+
+    # Walk the decisions back from the full budget
+    choice = np.zeros(n_matches, dtype=np.int8)
+    capacity = budget
+    for i in reversed(range(n_matches)):
+        choice[i] = picks[i, capacity]
+        if choice[i]:
+            capacity -= int(weights[i, choice[i] - 1])
+    return choice
+
+
 class ModeShiftAnalyzer:
     def __init__(self, db_path: str = 'data/routes.db', min_distance: float = 50.0):
         self.db_path = db_path
@@ -104,40 +144,233 @@ class ModeShiftAnalyzer:
             salary_cost_bus=salary_cost_bus
         )
 
+    def analyze_routes_frame(self) -> pd.DataFrame:
+        """
+        Vectorized analyze_route over every loaded route.
+
+        Returns one row per analyzed route with the RouteAnalysis fields plus
+        the rail/bus viability flags and time differences against air.
+        """
+        df = self.routes_df[~(self.routes_df['driving_km'] < self.min_distance)]
+
+        driving_km = df['driving_km']
+        air_time = 30 + (driving_km / 8)  # Approx 800 km/h + 30 min ground ops
+        rail_time = df['transit_duration'] / 60
+        bus_time = df['driving_duration'] / 60
+
+        # Combined team salary costs; teams without salary data cost nothing
+        home_rate = df['home_team'].map(self.salary_data).where(df['home_team'].isin(self.salary_data.keys()), 0)
+        away_rate = df['away_team'].map(self.salary_data).where(df['away_team'].isin(self.salary_data.keys()), 0)
+        combined_rate = home_rate + away_rate
+
+        salary_cost_air = air_time * combined_rate
+        # A zero travel time has no salary cost estimate, as in analyze_route
+        salary_cost_rail = (rail_time * combined_rate).where(rail_time.notna() & (rail_time != 0))
+        salary_cost_bus = (bus_time * combined_rate).where(bus_time.notna() & (bus_time != 0))
+
+        analysis = pd.DataFrame({
+            'home_team': df['home_team'],
+            'away_team': df['away_team'],
+            'distance_km': driving_km,
+            'air_time': air_time,
+            'rail_time': rail_time,
+            'bus_time': bus_time,
+            'air_emissions': driving_km * 0.15,  # ~150g CO2 per km
+            'rail_emissions': df['transit_km'] * 0.04,
+            'bus_emissions': driving_km * 0.03,
+            'salary_cost_air': salary_cost_air,
+            'salary_cost_rail': salary_cost_rail,
+            'salary_cost_bus': salary_cost_bus
+        }).reset_index(drop=True)
+
+        # One mask per viability condition; NaN comparisons are False
+        analysis['rail_viable'] = (
+            (analysis['rail_time'] < analysis['air_time']) &
+            (analysis['salary_cost_rail'] < analysis['salary_cost_air'])
+        )
+        analysis['bus_viable'] = (
+            (analysis['bus_time'] < analysis['air_time']) &
+            (analysis['salary_cost_bus'] < analysis['salary_cost_air'])
+        )
+        analysis['time_difference_rail'] = analysis['rail_time'] - analysis['air_time']
+        analysis['time_difference_bus'] = analysis['bus_time'] - analysis['air_time']
+
+        return analysis
+
+    @staticmethod
+    def route_analyses(analysis: pd.DataFrame) -> List[RouteAnalysis]:
+        """RouteAnalysis records for analyze_routes_frame rows, with missing values as None like analyze_route."""
+        columns = [field.name for field in fields(RouteAnalysis)]
+        records = analysis[columns].astype(object).where(analysis[columns].notna(), None)
+        return [RouteAnalysis(*row) for row in records.itertuples(index=False, name=None)]
+
     def analyze_all_routes(self) -> Dict:
-        """Analyze all routes and generate summary statistics."""
-        results = []
-        for _, row in self.routes_df.iterrows():
-            analysis = self.analyze_route(row)
-            if analysis:
-                results.append(analysis)
+        """
+        Analyze all routes and generate summary statistics.
+
+        'detailed_routes' is the list of RouteAnalysis records; 'detailed_frame'
+        holds the same routes as a DataFrame with the viability flags and time
+        differences added.
+        """
+        analysis = self.analyze_routes_frame()
 
         summary = {
-            'total_routes': len(results),
-            'rail_viable': len([r for r in results
-                                if (r.rail_time is not None and
-                                    r.rail_time < r.air_time and
-                                    r.salary_cost_rail is not None and
-                                    r.salary_cost_rail < r.salary_cost_air)]),
-            'bus_viable': len([r for r in results
-                               if (r.bus_time is not None and
-                                   r.bus_time < r.air_time and
-                                   r.salary_cost_bus is not None and
-                                   r.salary_cost_bus < r.salary_cost_air)]),
-            'total_air_emissions': sum(r.air_emissions for r in results),
-            'potential_rail_savings': sum(
-                r.air_emissions - r.rail_emissions
-                for r in results if r.rail_emissions is not None
-            ),
-            'potential_bus_savings': sum(
-                r.air_emissions - r.bus_emissions
-                for r in results if r.bus_emissions is not None
-            ),
-            'detailed_routes': results
+            'total_routes': len(analysis),
+            'rail_viable': int(analysis['rail_viable'].sum()),
+            'bus_viable': int(analysis['bus_viable'].sum()),
+            # Series.sum skips routes without a rail or bus option
+            'total_air_emissions': float(analysis['air_emissions'].sum()),
+            'potential_rail_savings': float((analysis['air_emissions'] - analysis['rail_emissions']).sum()),
+            'potential_bus_savings': float((analysis['air_emissions'] - analysis['bus_emissions']).sum()),
+            'detailed_routes': self.route_analyses(analysis),
+            'detailed_frame': analysis
         }
 
         return summary
 
+    def sweep_min_distance(self, thresholds) -> pd.DataFrame:
+        """
+        Summarize viability and savings for several minimum distances in one pass.
+
+        Routes are sorted by distance once; every threshold's totals are read
+        from suffix cumulative sums at its position in the sorted distances.
+
+        Args:
+            thresholds: Minimum distances in km; none may be below self.min_distance,
+                since shorter routes were never loaded
+
+        Returns:
+            One row per threshold with the analyze_all_routes summary figures
+        """
+        thresholds = np.sort(np.asarray(list(thresholds), dtype=float))
+        if len(thresholds) and thresholds[0] < self.min_distance:
+            raise ValueError(
+                f"Threshold {thresholds[0]} km is below the loaded minimum of {self.min_distance} km")
+
+        analysis = self.analyze_routes_frame().sort_values('distance_km', kind='stable')
+        distances = analysis['distance_km'].to_numpy()
+
+        def suffix_sums(values):
+            # suffix[i] = sum of values[i:], with a trailing 0 for thresholds past every route
+            values = np.nan_to_num(np.asarray(values, dtype=float))
+            return np.concatenate([np.cumsum(values[::-1])[::-1], [0.0]])
+
+        rail_viable = suffix_sums(analysis['rail_viable'])
+        bus_viable = suffix_sums(analysis['bus_viable'])
+        air_emissions = suffix_sums(analysis['air_emissions'])
+        rail_savings = suffix_sums(analysis['air_emissions'] - analysis['rail_emissions'])
+        bus_savings = suffix_sums(analysis['air_emissions'] - analysis['bus_emissions'])
+
+        start = np.searchsorted(distances, thresholds, side='left')
+        total_routes = len(distances) - start
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            sweep = pd.DataFrame({
+                'min_distance': thresholds,
+                'total_routes': total_routes,
+                'rail_viable': rail_viable[start].astype(int),
+                'bus_viable': bus_viable[start].astype(int),
+                'rail_viable_pct': rail_viable[start] / total_routes * 100,
+                'bus_viable_pct': bus_viable[start] / total_routes * 100,
+                'total_air_emissions': air_emissions[start],
+                'potential_rail_savings': rail_savings[start],
+                'potential_bus_savings': bus_savings[start]
+            })
+
+        return sweep
+
+    def optimize_season(self, max_extra_hours: float = 10.0, carbon_value: Optional[float] = None) -> Dict:
+        """
+        Choose air, rail or bus for every fixture to maximize the season's emissions cut.
+
+        The travelling (away) team may spend at most `max_extra_hours` more than
+        flying across its away fixtures. Each team's choice is solved exactly as
+        a multiple-choice knapsack over whole minutes; extra time is rounded up
+        to the minute so the cap always holds. A mode that is faster than air
+        costs no budget.
+
+        The extra time is costed at the combined home and away gross_per_minute
+        rate, as in analyze_routes_frame. With `carbon_value` (EUR per ton of
+        CO2 saved) the objective is the net saving: tons saved minus the salary
+        cost converted to tons at that price, so a shift whose salary cost
+        exceeds the value of its emissions cut is never chosen. Without it,
+        only emissions count and the salary cost is reported.
+
+        Returns:
+            Dictionary with per-match choices, per-team usage and season totals
+        """
+        analysis = self.analyze_routes_frame()
+        budget = int(max_extra_hours * 60)
+        modes = ['rail', 'bus']
+
+        extra_minutes = np.column_stack([
+            (analysis[f'{mode}_time'] - analysis['air_time']).clip(lower=0).to_numpy(dtype=float)
+            for mode in modes
+        ])
+        savings = np.column_stack([
+            (analysis['air_emissions'] - analysis[f'{mode}_emissions']).to_numpy(dtype=float)
+            for mode in modes
+        ])
+        # Salary cost of the extra time, at the analysis' combined team rate
+        combined_rate = sum(
+            analysis[side].map(self.salary_data).where(analysis[side].isin(self.salary_data.keys()), 0).fillna(0)
+            for side in ('home_team', 'away_team')
+        ).to_numpy(dtype=float)
+        extra_salary = np.nan_to_num(extra_minutes) * combined_rate[:, None]
+
+        # Same feasibility as the analysis: a mode needs a positive travel time and emissions
+        feasible = np.column_stack([
+            (analysis[f'{mode}_time'] > 0).to_numpy() & analysis[f'{mode}_emissions'].notna().to_numpy()
+            for mode in modes
+        ])
+        objective = savings if carbon_value is None else savings - extra_salary / carbon_value
+        values = np.where(feasible, objective, -np.inf)
+        weights = np.ceil(np.nan_to_num(extra_minutes)).astype(np.int64)
+
+        choice = np.zeros(len(analysis), dtype=np.int8)
+        for rows in analysis.groupby('away_team').indices.values():
+            choice[rows] = solve_mode_knapsack(weights[rows], values[rows], budget)
+
+        shifted = choice > 0
+        option = np.maximum(choice - 1, 0)
+        row_index = np.arange(len(analysis))
+        chosen_minutes = np.where(shifted, extra_minutes[row_index, option], 0.0)
+
+        matches = pd.DataFrame({
+            'home_team': analysis['home_team'],
+            'away_team': analysis['away_team'],
+            'distance_km': analysis['distance_km'],
+            'mode': np.where(shifted, np.array(modes)[option], 'air'),
+            'extra_hours': chosen_minutes / 60,
+            'emissions_saved': np.where(shifted, savings[row_index, option], 0.0),
+            'salary_cost': np.where(shifted, extra_salary[row_index, option], 0.0)
+        })
+
+        teams = matches.groupby('away_team').agg(
+            matches_shifted=('mode', lambda m: int((m != 'air').sum())),
+            extra_hours=('extra_hours', 'sum'),
+            emissions_saved=('emissions_saved', 'sum'),
+            salary_cost=('salary_cost', 'sum')
+        ).sort_values('emissions_saved', ascending=False)
+
+        total_air = float(analysis['air_emissions'].sum())
+        total_saved = float(matches['emissions_saved'].sum())
+        return {
+            'max_extra_hours': max_extra_hours,
+            'carbon_value': carbon_value,
+            'total_matches': len(matches),
+            'matches_shifted': int(shifted.sum()),
+            'rail_matches': int((matches['mode'] == 'rail').sum()),
+            'bus_matches': int((matches['mode'] == 'bus').sum()),
+            'total_air_emissions': total_air,
+            'emissions_saved': total_saved,
+            'emissions_saved_pct': total_saved / total_air * 100 if total_air else 0.0,
+            'extra_hours': float(matches['extra_hours'].sum()),
+            'salary_cost': float(matches['salary_cost'].sum()),
+            'matches': matches,
+            'teams': teams
+        }
+
     def generate_report(self):
         """Generate a detailed report of mode shift analysis."""
         summary = self.analyze_all_routes()
@@ -157,32 +390,73 @@ class ModeShiftAnalyzer:
         print(f"Potential Bus Savings: {summary['potential_bus_savings']:.1f} tons CO2")
 
         # Export detailed results
-        results_list = []
-        for r in summary['detailed_routes']:
-            data = vars(r)
-            data['rail_viable'] = bool(
-                r.rail_time is not None and
-                r.rail_time < r.air_time and
-                r.salary_cost_rail is not None and
-                r.salary_cost_rail < r.salary_cost_air
-            )
-            data['bus_viable'] = bool(
-                r.bus_time is not None and
-                r.bus_time < r.air_time and
-                r.salary_cost_bus is not None and
-                r.salary_cost_bus < r.salary_cost_air
-            )
-            data['time_difference_rail'] = (r.rail_time - r.air_time) if r.rail_time is not None else None
-            data['time_difference_bus'] = (r.bus_time - r.air_time) if r.bus_time is not None else None
-            results_list.append(data)
-
-        detailed_df = pd.DataFrame(results_list)
+        detailed_df = summary['detailed_frame']
         detailed_df.to_csv('mode_shift_analysis.csv', index=False)
         print("\nDetailed analysis exported to mode_shift_analysis.csv")
 
+def parse_thresholds(args: List[str]) -> List[float]:
+    """Parse sweep thresholds given as numbers or start:stop:step ranges (stop inclusive)."""
+    thresholds = []
+    for arg in args:
+        if ':' in arg:
+            start, stop, step = (float(part) for part in arg.split(':'))
+            thresholds.extend(np.arange(start, stop + step / 2, step).tolist())
+        else:
+            thresholds.append(float(arg))
+    return thresholds
+
+
 if __name__ == '__main__':
     # Allow configurable minimum distance via command-line argument or default to 50 km
     import sys
+
+    # Sweep mode: python Cost_comparison.py --sweep 0 50 100:500:100
+    if len(sys.argv) > 1 and sys.argv[1] == '--sweep':
+        try:
+            thresholds = parse_thresholds(sys.argv[2:]) or [0.0, 50.0, 100.0, 200.0, 500.0]
+        except ValueError:
+            print("Invalid thresholds. Use numbers or start:stop:step ranges.")
+            sys.exit(1)
+
+        analyzer = ModeShiftAnalyzer(min_distance=min(thresholds))
+        sweep = analyzer.sweep_min_distance(thresholds)
+        print("\nMode Shift Threshold Sweep")
+        print("=" * 80)
+        print(sweep.to_string(index=False, float_format=lambda v: f"{v:,.1f}"))
+        sweep.to_csv('mode_shift_sweep.csv', index=False)
+        print("\nSweep exported to mode_shift_sweep.csv")
+        sys.exit(0)
+
+    # Optimizer mode: python Cost_comparison.py --optimize 10 [200]
+    # (extra hours per team, optional EUR value of a ton of CO2 saved)
+    if len(sys.argv) > 1 and sys.argv[1] == '--optimize':
+        try:
+            max_extra_hours = float(sys.argv[2]) if len(sys.argv) > 2 else 10.0
+        except ValueError:
+            print("Invalid hours. Using default 10 hours.")
+            max_extra_hours = 10.0
+        try:
+            carbon_value = float(sys.argv[3]) if len(sys.argv) > 3 else None
+        except ValueError:
+            print("Invalid carbon value. Optimizing emissions only.")
+            carbon_value = None
+
+        analyzer = ModeShiftAnalyzer(min_distance=0.0)
+        plan = analyzer.optimize_season(max_extra_hours, carbon_value)
+        print("\nSeason Mode Optimization")
+        print("=" * 80)
+        print(f"Extra Travel Cap: {max_extra_hours} hours per team")
+        if carbon_value is not None:
+            print(f"Carbon Value: €{carbon_value:,.0f} per ton CO2, net of salary cost")
+        print(f"Matches Shifted: {plan['matches_shifted']}/{plan['total_matches']} "
+              f"(rail {plan['rail_matches']}, bus {plan['bus_matches']})")
+        print(f"Emissions Saved: {plan['emissions_saved']:.1f} of {plan['total_air_emissions']:.1f} tons CO2 "
+              f"({plan['emissions_saved_pct']:.1f}%)")
+        print(f"Extra Travel: {plan['extra_hours']:.1f} hours, salary cost €{plan['salary_cost']:,.0f}")
+        plan['matches'].to_csv('mode_shift_plan.csv', index=False)
+        print("\nMatch plan exported to mode_shift_plan.csv")
+        sys.exit(0)
+
     min_distance = 50.0
     if len(sys.argv) > 1:
         try:
@@ -1,24 +1,26 @@
-import sqlite3
 
 import numpy as np
-import pandas as pd
-import plotly.express as px
 import streamlit as st
 
 from src.config.constants import SOCIAL_CARBON_COSTS
-from src.data.team_data import get_all_teams, get_team_airport, get_airport_coordinates, TEAM_COUNTRIES
-from src.models.emissions import EmissionsCalculator
+from src.data.team_data import get_team_airport, get_airport_coordinates, TEAM_COUNTRIES
 from src.utils.calculations import (
     calculate_transport_emissions,
     calculate_equivalencies,
     calculate_flight_time, format_time_duration
 )
-from src.utils.carbon_pricing.enhanced_calculator import EnhancedCarbonPricingCalculator
-from src.utils.logo_manager import FootballLogoManager
+from src.utils.carbon_pricing.financial_analysis import npv_components, solve_break_even
+from src.utils.carbon_pricing.forecast import growth_factors, project_components
+from src.utils.carbon_pricing.monte_carlo import CostMonteCarlo
+from src.utils.carbon_pricing.price_table import get_price_table
+from src.utils.streamlit_cache import (
+    get_data_version, get_emissions_calculator, get_logo_manager, get_pricing_calculator,
+    get_sorted_teams, load_route_emissions, load_team_salary
+)
 
-# Initialize calculator
-calculator = EmissionsCalculator()
-logo_manager = FootballLogoManager()
+# Shared calculator instances (built once per server process)
+calculator = get_emissions_calculator()
+logo_manager = get_logo_manager()
 # Set page config
 st.set_page_config(
     page_title="Football Team Flight Emissions Calculator",
@@ -134,6 +136,71 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 
+def match_memo(name, compute, *args):
+    """
+    Intermediate result for the current match, computed on first use.
+
+    Kept in last_calculation, so reruns for other widgets (section toggles,
+    tabs, sliders) reuse it and a new calculation starts from scratch.
+    """
+    memo = st.session_state.last_calculation.setdefault('memo', {})
+    key = (name,) + args
+    if key not in memo:
+        memo[key] = compute(*args)
+    return memo[key]
+
+
+def transport_emissions(mode, distance_km, passengers=30, is_round_trip=False, home_team=None, away_team=None):
+    """calculate_transport_emissions for the current match (each call reads the routes database)."""
+    return match_memo('transport_emissions', calculate_transport_emissions,
+                      mode, distance_km, passengers, is_round_trip, home_team, away_team)
+
+
+def lazy_section(label, key):
+    """Toggle standing in for an expander: its content is only computed while it is open."""
+    return st.toggle(label, key=key)
+
+
+# Fuel mix of the Operational Costs tab; the projections use it too
+FUEL_MIX_DEFAULTS = {
+    'fuel_saf_percentage': 2,
+    'fuel_conventional_price': 2.5,
+    'fuel_saf_price': 7.5
+}
+
+
+def fuel_mix_costs(total_fuel, saf_percentage, conventional_price, saf_price):
+    """Volumes and costs of a conventional/SAF fuel mix."""
+    conventional_percentage = 100 - saf_percentage
+    conventional_volume = total_fuel * (conventional_percentage/100)
+    saf_volume = total_fuel * (saf_percentage/100)
+    conventional_cost = conventional_volume * conventional_price
+    saf_cost = saf_volume * saf_price
+    return {
+        'conventional_percentage': conventional_percentage,
+        'conventional_volume': conventional_volume,
+        'saf_volume': saf_volume,
+        'conventional_cost': conventional_cost,
+        'saf_cost': saf_cost,
+        'total': conventional_cost + saf_cost
+    }
+
+
+def price_projections(home_country, base_year=2024, projection_years=10):
+    """Projected fuel and carbon unit prices for the visualization and break-even sections."""
+    import pandas as pd
+    prices = get_price_table()
+    unit_prices = np.array([2.5, 7.5, prices.ets_price(), prices.national_tax(home_country)])
+    price_paths = unit_prices * growth_factors([0.05, -0.03, 0.08, 0.06], projection_years)
+    return pd.DataFrame({
+        'Year': list(range(base_year, base_year + projection_years)),
+        'Conventional Fuel': [round(price, 2) for price in price_paths[:, 0]],
+        'Sustainable Aviation Fuel': [round(price, 2) for price in price_paths[:, 1]],
+        'EU ETS': [round(price, 2) for price in price_paths[:, 2]],
+        'National Carbon Tax': [round(price, 2) for price in price_paths[:, 3]]
+    })
+
+
 def display_results(result, rail_emissions=None, bus_emissions=None,
                     flight_salary_impact=None, rail_salary_impact=None, bus_salary_impact=None):
     """Display calculation results with collapsible sections"""
@@ -227,8 +294,8 @@ def display_results(result, rail_emissions=None, bus_emissions=None,
             st.markdown(f"• {impact['propane_cylinders']:,.0f} Propane cylinders for BBQ")
             st.markdown(f"• {impact['oil_barrels']:.2f} Barrels of oil")
 
-    # Economic Impact Analysis as a separate top-level expander
-    with st.expander("💸 Economic Impact Analysis", expanded=False):
+    # Economic Impact Analysis as a separate top-level section, computed only while open
+    if lazy_section("💸 Economic Impact Analysis", 'show_economic_impacts'):
         display_economic_impacts(
             result=result,
             home_team=st.session_state.form_state['home_team'],
@@ -238,8 +305,8 @@ def display_results(result, rail_emissions=None, bus_emissions=None,
             bus_salary_impact=bus_salary_impact
         )
 
-        # Cost Analysis (collapsible)
-    with st.expander("💰 Carbon Price Breakdown", expanded=False):
+    # Cost Analysis (collapsible)
+    if lazy_section("💰 Carbon Price Breakdown", 'show_carbon_breakdown'):
         display_carbon_price_analysis(
             air_emissions=result.total_emissions,
             rail_emissions=rail_emissions,
@@ -342,7 +409,7 @@ def display_transport_comparison(result):
     is_derby = result.distance_km == 0
     home_team = st.session_state.form_state['home_team']
     away_team = st.session_state.form_state['away_team']
-    rail_feasible = calculate_transport_emissions(
+    rail_feasible = transport_emissions(
         'rail',
         result.distance_km,
         st.session_state.form_state['passengers'],
@@ -351,7 +418,7 @@ def display_transport_comparison(result):
         away_team
     ) is not None
 
-    bus_feasible = calculate_transport_emissions(
+    bus_feasible = transport_emissions(
         'bus',
         result.distance_km,
         st.session_state.form_state['passengers'],
@@ -376,34 +443,10 @@ def display_transport_comparison(result):
         flight_emissions = result.total_emissions
 
     try:
-        conn = sqlite3.connect('data/routes.db')
-        cursor = conn.cursor()
-
-        # Get route data
-        cursor.execute("""
-            SELECT 
-                transit_duration,
-                transit_distance,
-                rail_emissions,
-                driving_duration,
-                driving_distance,
-                bus_emissions
-            FROM match_emissions
-            WHERE distance_km = ? 
-            ORDER BY last_updated DESC
-            LIMIT 1
-        """, (result.distance_km / (2 if result.is_round_trip else 1),))
-
-        route_data = cursor.fetchone()
-
-        # Get salary data
-        cursor.execute("""
-            SELECT gross_per_minute
-            FROM team_salaries
-            WHERE team = ?
-        """, (home_team,))
-        salary_data = cursor.fetchone()
-        team_salary = salary_data[0] if salary_data else None
+        # Cached per data version; reruns for other widgets skip the database
+        data_version = get_data_version()
+        route_data = load_route_emissions(result.distance_km / (2 if result.is_round_trip else 1), data_version)
+        team_salary = load_team_salary(home_team, data_version)
 
         if route_data:
             multiplier = 2 if result.is_round_trip else 1
@@ -414,7 +457,7 @@ def display_transport_comparison(result):
                 transit_time_str = format_time_duration(transit_time_seconds)
                 transit_time_diff = format_time_diff(transit_time_seconds - flight_time_seconds)
                 transit_distance = route_data[1] * multiplier if route_data[1] else (15 if is_derby else result.distance_km)
-                rail_emissions = route_data[2] * multiplier if route_data[2] else calculate_transport_emissions(
+                rail_emissions = route_data[2] * multiplier if route_data[2] else transport_emissions(
                     'rail',
                     15 if is_derby else result.distance_km,
                     st.session_state.form_state['passengers'],
@@ -433,7 +476,7 @@ def display_transport_comparison(result):
                 driving_time_str = format_time_duration(driving_time_seconds)
                 driving_time_diff = format_time_diff(driving_time_seconds - flight_time_seconds)
                 driving_distance = route_data[4] * multiplier if route_data[4] else (15 if is_derby else result.distance_km)
-                bus_emissions = route_data[5] * multiplier if route_data[5] else calculate_transport_emissions(
+                bus_emissions = route_data[5] * multiplier if route_data[5] else transport_emissions(
                     'bus',
                     15 if is_derby else result.distance_km,
                     st.session_state.form_state['passengers'],
@@ -453,7 +496,7 @@ def display_transport_comparison(result):
                 transit_time_diff = "-"
                 transit_distance = 15 if is_derby else result.distance_km
                 transit_time_seconds = 1800 if is_derby else 0
-                rail_emissions = calculate_transport_emissions(
+                rail_emissions = transport_emissions(
                     'rail',
                     5 if is_derby else result.distance_km,
                     st.session_state.form_state['passengers'],
@@ -471,7 +514,7 @@ def display_transport_comparison(result):
                 driving_time_diff = "-"
                 driving_distance = 5 if is_derby else result.distance_km
                 driving_time_seconds = 2700 if is_derby else 0
-                bus_emissions = calculate_transport_emissions(
+                bus_emissions = transport_emissions(
                     'bus',
                     5 if is_derby else result.distance_km,
                     st.session_state.form_state['passengers'],
@@ -494,9 +537,6 @@ def display_transport_comparison(result):
         return
 
     finally:
-        if 'conn' in locals():
-            conn.close()
-
         st.markdown("""
             <style>
             .styled-table {
@@ -598,7 +638,11 @@ def display_transport_comparison(result):
 
 def display_economic_impacts(result, home_team, away_team,flight_salary_impact, rail_salary_impact, bus_salary_impact):
     """Display economic impact analysis with costs summary and all optimization options."""
-    calculator = EnhancedCarbonPricingCalculator()
+    # Charting and table libraries are only loaded once this section is opened
+    import pandas as pd
+    import plotly.express as px
+
+    prices = get_price_table()
     home_country = TEAM_COUNTRIES.get(home_team, 'EU')
     away_country = TEAM_COUNTRIES.get(away_team, 'EU')
 
@@ -610,7 +654,7 @@ def display_economic_impacts(result, home_team, away_team,flight_salary_impact,
     flight_hours = flight_time_seconds / 3600
 
     # Alternative transport emissions
-    rail_emissions = calculate_transport_emissions(
+    rail_emissions = transport_emissions(
         'rail',
         result.distance_km,
         st.session_state.form_state['passengers'],
@@ -618,7 +662,7 @@ def display_economic_impacts(result, home_team, away_team,flight_salary_impact,
         home_team,
         away_team
     )
-    bus_emissions = calculate_transport_emissions(
+    bus_emissions = transport_emissions(
         'bus',
         result.distance_km,
         st.session_state.form_state['passengers'],
@@ -637,8 +681,8 @@ def display_economic_impacts(result, home_team, away_team,flight_salary_impact,
     total_fuel_cost = conventional_fuel_cost + saf_fuel_cost
 
     # Carbon costs calculation
-    eu_ets_cost = result.total_emissions * calculator.EU_ETS_PRICE
-    national_carbon_tax = result.total_emissions * calculator.CARBON_PRICES.get(home_country, 0)
+    eu_ets_cost = result.total_emissions * prices.ets_price()
+    national_carbon_tax = result.total_emissions * prices.national_tax(home_country)
     total_carbon_cost = eu_ets_cost + national_carbon_tax
 
     # Social costs calculation
@@ -702,7 +746,7 @@ def display_economic_impacts(result, home_team, away_team,flight_salary_impact,
     if rail_emissions:
         alternatives['rail'] = {
             'operational': total_operational * 0.1,
-            'carbon': rail_emissions * calculator.EU_ETS_PRICE,
+            'carbon': rail_emissions * prices.ets_price(),
             'social': rail_emissions * (sum(SOCIAL_CARBON_COSTS.values()) / len(SOCIAL_CARBON_COSTS)),
             'salary': rail_salary_impact
 
@@ -711,7 +755,7 @@ def display_economic_impacts(result, home_team, away_team,flight_salary_impact,
     if bus_emissions:
         alternatives['bus'] = {
             'operational': total_operational * 0.2,
-            'carbon': bus_emissions * calculator.EU_ETS_PRICE,
+            'carbon': bus_emissions * prices.ets_price(),
             'social': bus_emissions * (sum(SOCIAL_CARBON_COSTS.values()) / len(SOCIAL_CARBON_COSTS)),
             'salary': bus_salary_impact
         }
@@ -743,8 +787,30 @@ def display_economic_impacts(result, home_team, away_team,flight_salary_impact,
         }
     }
 
-    # Create tabs
-    summary_tab, ops_tab, carbon_tab, viz_tab,advanced_tab = st.tabs(["Summary", "Operational Costs", "Carbon Costs", "Visualizations", "Advanced Analysis"])
+    # Fuel mix chosen in the Operational Costs tab; the widget state is kept while
+    # the tab is closed, since the projections are based on it as well
+    for key, default in FUEL_MIX_DEFAULTS.items():
+        st.session_state[key] = st.session_state.get(key, default)
+    fuel_mix = fuel_mix_costs(
+        result.fuel_consumption,
+        st.session_state.fuel_saf_percentage,
+        st.session_state.fuel_conventional_price,
+        st.session_state.fuel_saf_price
+    )
+    mix_operational = total_charter + fuel_mix['total']
+
+    # Combined fuel and carbon price projections (Visualizations and Advanced Analysis)
+    base_year = 2024
+    combined_df = match_memo('price_projections', price_projections, home_country, base_year)
+
+    # Section selector; only the selected section is computed
+    selected_tab = st.radio(
+        "Economic analysis section",
+        ["Summary", "Operational Costs", "Carbon Costs", "Visualizations", "Advanced Analysis"],
+        horizontal=True,
+        key='economic_tab',
+        label_visibility="collapsed"
+    )
 
     # Custom CSS for centered tables
     st.markdown("""
@@ -791,7 +857,7 @@ def display_economic_impacts(result, home_team, away_team,flight_salary_impact,
         )
         return table_html % (header_cols, data_rows)
 
-    with summary_tab:
+    if selected_tab == "Summary":
         with st.markdown("Flight Impact Summary", ):
             # Economic Impact Table
             headers = ["Cost Category", "Amount (€)"]
@@ -898,7 +964,7 @@ def display_economic_impacts(result, home_team, away_team,flight_salary_impact,
         💡 **Recommendation:** Consider your priorities (cost vs. time vs. flexibility) when choosing an option.
         """, unsafe_allow_html=True)
 
-    with ops_tab:
+    if selected_tab == "Operational Costs":
         col1, col2 = st.columns(2)
         with col1:
             st.markdown("#### Base Charter Costs")
@@ -921,40 +987,40 @@ def display_economic_impacts(result, home_team, away_team,flight_salary_impact,
                 "SAF Percentage in Fuel Mix",
                 min_value=0,
                 max_value=100,
-                value=2,
+                key='fuel_saf_percentage',
                 help="Percentage of Sustainable Aviation Fuel in the total fuel mix"
             )
 
             # Add price adjustments
             col_conv, col_saf = st.columns(2)
             with col_conv:
-                conventional_price = st.number_input(
+                st.number_input(
                     "Conventional Fuel Price (€/L)",
                     min_value=1.0,
                     max_value=10.0,
-                    value=2.5,
-                    step=0.1
+                    step=0.1,
+                    key='fuel_conventional_price'
                 )
 
             with col_saf:
-                saf_price = st.number_input(
+                st.number_input(
                     "SAF Price (€/L)",
                     min_value=1.0,
                     max_value=20.0,
-                    value=7.5,
-                    step=0.1
+                    step=0.1,
+                    key='fuel_saf_price'
                 )
 
-            # Calculate volumes and costs based on user inputs
-            conventional_percentage = 100 - saf_percentage
+            # Volumes and costs based on user inputs (computed with the fuel mix above)
+            conventional_percentage = fuel_mix['conventional_percentage']
             total_fuel = result.fuel_consumption  # Total fuel volume in liters
 
-            conventional_volume = total_fuel * (conventional_percentage/100)
-            saf_volume = total_fuel * (saf_percentage/100)
+            conventional_volume = fuel_mix['conventional_volume']
+            saf_volume = fuel_mix['saf_volume']
 
-            conventional_cost = conventional_volume * conventional_price
-            saf_cost = saf_volume * saf_price
-            total_cost = conventional_cost + saf_cost
+            conventional_cost = fuel_mix['conventional_cost']
+            saf_cost = fuel_mix['saf_cost']
+            total_cost = fuel_mix['total']
 
             # Display fuel breakdown
             st.markdown("#### Fuel Breakdown")
@@ -990,22 +1056,21 @@ def display_economic_impacts(result, home_team, away_team,flight_salary_impact,
 
         st.markdown("---")
         st.markdown("#### Total Operational Costs")
-        total_operational = total_charter + total_cost
         st.markdown(f"""
         <div style='padding: 15px; background-color: transparent; border-radius: 5px;'>
             Charter Costs: {format_currency(total_charter)}<br>
             Fuel Costs: {format_currency(total_cost)}<br>
-            <strong>Total: {format_currency(total_operational)}</strong>
+            <strong>Total: {format_currency(mix_operational)}</strong>
         </div>
         """, unsafe_allow_html=True)
 
-    with carbon_tab:
+    if selected_tab == "Carbon Costs":
         st.markdown("### Carbon Price Analysis")
         st.markdown("#### Carbon Price Components")
         st.markdown(f"""
         <div style='padding: 15px; background-color: transparent; border-radius: 5px;'>
-            EU ETS Cost (€{calculator.EU_ETS_PRICE:.2f}/ton): {format_currency(cost_data['carbon']['eu_ets'])}<br>
-            National Carbon Tax (€{calculator.CARBON_PRICES.get(home_country, 0):.2f}/ton): {format_currency(cost_data['carbon']['national'])}
+            EU ETS Cost (€{prices.ets_price():.2f}/ton): {format_currency(cost_data['carbon']['eu_ets'])}<br>
+            National Carbon Tax (€{prices.national_tax(home_country):.2f}/ton): {format_currency(cost_data['carbon']['national'])}
         </div>
         """, unsafe_allow_html=True)
 
@@ -1039,25 +1104,15 @@ def display_economic_impacts(result, home_team, away_team,flight_salary_impact,
         """, unsafe_allow_html=True)
 
 
-    with viz_tab:
+    if selected_tab == "Visualizations":
         st.markdown("### 📈 Future Cost Projections")
 
         # Generate projection data
-        projection_years = 10
-        base_year = 2024
-        years = list(range(base_year, base_year + projection_years))
-
-        # Combined fuel and carbon price projections
-        combined_df = pd.DataFrame({
-            'Year': years,
-            'Conventional Fuel': [round(2.5 * (1.05)**i, 2) for i in range(projection_years)],
-            'Sustainable Aviation Fuel': [round(7.5 * (0.97)**i, 2) for i in range(projection_years)],
-            'EU ETS': [round(calculator.EU_ETS_PRICE * (1.08)**i, 2) for i in range(projection_years)],
-            'National Carbon Tax': [round(calculator.CARBON_PRICES.get(home_country, 0) * (1.06)**i, 2) for i in range(projection_years)]
-        })
+        projection_years = len(combined_df)
+        years = list(combined_df['Year'])
 
         # Check if national carbon tax is 0
-        if calculator.CARBON_PRICES.get(home_country, 0) == 0:
+        if prices.national_tax(home_country) == 0:
             st.info(f"""
             📝 **Note on National Carbon Tax:**  
             {home_team} is based in {home_country}, which currently does not have a national carbon tax 
@@ -1099,10 +1154,22 @@ def display_economic_impacts(result, home_team, away_team,flight_salary_impact,
         # Cumulative Cost Impact
         st.markdown("### 📊 Cumulative Cost Impact")
 
-        # Calculate cumulative costs with rounded values
-        operational_costs = [round(total_operational * (1.04)**i) for i in range(projection_years)]
-        carbon_costs = [round(total_carbon_cost * (1.08)**i) for i in range(projection_years)]
-        fuel_costs = [round(total_fuel_cost * (1.05)**i) for i in range(projection_years)]
+        # Cost components grown under each scenario: (1, years, scenarios) arrays
+        scenarios = {
+            'Base Case': {'operational': 0.04, 'carbon': 0.08, 'fuel': 0.05},
+            'High Growth': {'operational': 0.06, 'carbon': 0.12, 'fuel': 0.08},
+            'Low Growth': {'operational': 0.02, 'carbon': 0.05, 'fuel': 0.03}
+        }
+        projections = project_components(
+            {'operational': mix_operational, 'carbon': total_carbon_cost, 'fuel': total_fuel_cost},
+            scenarios,
+            projection_years
+        )
+
+        # Calculate cumulative costs with rounded values (Base Case growth rates)
+        operational_costs = [round(cost) for cost in projections['operational'][0, :, 0]]
+        carbon_costs = [round(cost) for cost in projections['carbon'][0, :, 0]]
+        fuel_costs = [round(cost) for cost in projections['fuel'][0, :, 0]]
 
         cumulative_df = pd.DataFrame({
             'Year': years,
@@ -1191,39 +1258,16 @@ def display_economic_impacts(result, home_team, away_team,flight_salary_impact,
         - Operational costs: 2% annual increase
         """)
 
-        scenarios = {
-            'Base Case': {
-                'fuel_increase': 0.05,
-                'carbon_increase': 0.08,
-                'operational_increase': 0.04
-            },
-            'High Growth': {
-                'fuel_increase': 0.08,
-                'carbon_increase': 0.12,
-                'operational_increase': 0.06
-            },
-            'Low Growth': {
-                'fuel_increase': 0.03,
-                'carbon_increase': 0.05,
-                'operational_increase': 0.02
+        scenario_totals = projections['total'][0]
+        scenario_df = pd.DataFrame([
+            {
+                'Year': base_year + year,
+                'Scenario': scenario,
+                'Total Cost': round(scenario_totals[year, s])
             }
-        }
-
-        scenario_data = []
-        for scenario, rates in scenarios.items():
-            for year in range(projection_years):
-                total_cost = round(
-                    total_operational * (1 + rates['operational_increase'])**year +
-                    total_carbon_cost * (1 + rates['carbon_increase'])**year +
-                    total_fuel_cost * (1 + rates['fuel_increase'])**year
-                )
-                scenario_data.append({
-                    'Year': base_year + year,
-                    'Scenario': scenario,
-                    'Total Cost': total_cost
-                })
-
-        scenario_df = pd.DataFrame(scenario_data)
+            for s, scenario in enumerate(scenarios)
+            for year in range(projection_years)
+        ])
 
         fig_scenarios = px.line(
             scenario_df,
@@ -1252,7 +1296,7 @@ def display_economic_impacts(result, home_team, away_team,flight_salary_impact,
         3. **Investment Planning**: Understanding potential cost ranges aids in making decisions about 
            fleet modernization and sustainable aviation fuel adoption.
         """)
-    with advanced_tab:
+    if selected_tab == "Advanced Analysis":
         st.markdown("### 📊 Advanced Economic Analysis")
         # Add explanation at the top
         st.info("""
@@ -1305,19 +1349,17 @@ def display_economic_impacts(result, home_team, away_team,flight_salary_impact,
 
         # NPV Calculation (Flight Costs Only)
         scenario = scenario_config[selected_scenario]
-        npv = 0
-        cost_breakdown = []
-
+        base_costs = {
+            'operational': mix_operational,
+            'carbon': total_carbon_cost,
+            'salary': total_flight_salary_impact
+        }
+        npv = float(npv_components(base_costs, scenario, discount_rate, projection_years))
 
-        for year in range(projection_years):
-            year_cost = (
-                    total_operational * (1 + scenario['operational'])**year +
-                    total_carbon_cost * (1 + scenario['carbon'])**year +
-                    total_flight_salary_impact * (1 + scenario['salary'])**year
-            )
-            present_value = year_cost / (1 + discount_rate)**year
-            npv += present_value
-            cost_breakdown.append((year+1, present_value))
+        # Per-year present values for the chart
+        year_costs = project_components(base_costs, {selected_scenario: scenario}, projection_years)['total'][0, :, 0]
+        present_values = year_costs / (1 + discount_rate) ** np.arange(projection_years)
+        cost_breakdown = list(zip(range(1, projection_years + 1), present_values))
 
         # Display Results
         st.markdown(f"## Projected NPV: €{npv:,.0f}")
@@ -1358,9 +1400,10 @@ def display_economic_impacts(result, home_team, away_team,flight_salary_impact,
         saf_prices = [7.5*(0.97**i) + combined_df['EU ETS'][min(i, projection_years-1)] for i in range(extended_years)]
         conv_prices = [2.5*(1.05**i) + combined_df['EU ETS'][min(i, projection_years-1)] for i in range(extended_years)]
 
-        # Find break-even point
-        try:
-            break_even_year = next(i for i in range(extended_years) if saf_prices[i] < conv_prices[i])
+        # Find break-even point (both trajectories carry the same carbon cost, so it cancels)
+        break_even = solve_break_even(7.5, 2.5, -0.03, 0.05, horizon=extended_years)
+        if break_even['year'] >= 0:
+            break_even_year = int(break_even['year'])
             years_to_breakeven = break_even_year
             break_even_price = saf_prices[break_even_year]
 
@@ -1430,7 +1473,7 @@ def display_economic_impacts(result, home_team, away_team,flight_salary_impact,
                 - Slower conventional fuel price increase
             """)
 
-        except StopIteration:
+        else:
             st.warning("""
             **No Break-even Point Found:**
             Even with a 30-year projection, SAF does not become cost-competitive under current assumptions.
@@ -1458,34 +1501,49 @@ def display_economic_impacts(result, home_team, away_team,flight_salary_impact,
         # Monte Carlo Simulation
         st.markdown("#### 🎲 Monte Carlo Simulation")
 
-        n_simulations = 1000
+        n_simulations = st.select_slider(
+            "Simulated Price Paths",
+            options=[1_000, 10_000, 100_000],
+            value=1_000,
+            format_func=lambda n: f"{n:,}",
+            help="More paths give steadier percentiles but take longer to compute"
+        )
 
         @st.cache_data
-        def run_monte_carlo(n_sims, base_cost, mean_growth, std_dev):
-            np.random.seed(42)  # For reproducibility
-            fuel_growth_dist = np.random.normal(loc=mean_growth, scale=std_dev, size=n_sims)
-            results = []
-            for growth_rate in fuel_growth_dist:
-                final_year_cost = base_cost * (1 + growth_rate)**projection_years
-                results.append(final_year_cost)
-            return results
-
-        # Run simulation for total costs
-        simulation_results = run_monte_carlo(
+        def run_monte_carlo(n_sims, base_costs, fixed_cost, years):
+            return CostMonteCarlo(years=years, seed=42).run(base_costs, fixed_cost, n_paths=n_sims)
+
+        # Correlated fuel, SAF and EU ETS price paths; charter and salary costs stay fixed
+        trip_factor = 2 if result.is_round_trip else 1
+        simulation = run_monte_carlo(
             n_simulations,
-            total_cost,
-            0.05,  # mean growth rate
-            0.02   # standard deviation
+            {
+                'fuel': conventional_fuel_cost * trip_factor,
+                'saf': saf_fuel_cost * trip_factor,
+                'ets': total_carbon_cost
+            },
+            total_charter + total_flight_salary_impact,
+            int(projection_years)
         )
 
-        # Create histogram using plotly
-        fig_monte_carlo = px.histogram(
-            simulation_results,
-            nbins=50,
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("5th Percentile", f"€{simulation['quantiles'][0.05][-1]:,.0f}")
+        with col2:
+            st.metric("Median", f"€{simulation['quantiles'][0.5][-1]:,.0f}")
+        with col3:
+            st.metric("95th Percentile", f"€{simulation['quantiles'][0.95][-1]:,.0f}")
+
+        # Plot the pre-binned final-year histogram
+        edges = simulation['histogram']['edges']
+        fig_monte_carlo = px.bar(
+            x=(edges[:-1] + edges[1:]) / 2,
+            y=simulation['histogram']['counts'],
             title='Cost Distribution (Monte Carlo Simulation)',
-            labels={'value': 'Total Cost (€)', 'count': 'Frequency'},
+            labels={'x': 'Total Cost (€)', 'y': 'Frequency'},
             template='plotly_dark'
         )
+        fig_monte_carlo.update_traces(width=edges[1] - edges[0])
         st.plotly_chart(fig_monte_carlo, use_container_width=True)
         # Monte Carlo Simulation with explanation
         st.markdown("""
@@ -1524,10 +1582,13 @@ def display_economic_impacts(result, home_team, away_team,flight_salary_impact,
 
 def display_carbon_price_analysis(air_emissions, rail_emissions, bus_emissions, away_team, home_team):
     """Display carbon price analysis with proper formatting"""
+    import pandas as pd
+
     st.markdown("### 💰 Carbon Price Analysis")
 
     # Get carbon prices
-    calculator = EnhancedCarbonPricingCalculator()
+    calculator = get_pricing_calculator()
+    prices = get_price_table()
     home_country = TEAM_COUNTRIES.get(home_team, 'EU')
     away_country = TEAM_COUNTRIES.get(away_team, 'EU')
     flight_type = calculator.classify_flight(home_country, away_country)
@@ -1538,9 +1599,9 @@ def display_carbon_price_analysis(air_emissions, rail_emissions, bus_emissions,
 
     # For air transport
     if flight_type in ['intra_eea', 'eea_outbound']:
-        eu_ets_cost = air_emissions * calculator.EU_ETS_PRICE
+        eu_ets_cost = air_emissions * prices.ets_price()
 
-    origin_tax = calculator.CARBON_PRICES.get(home_country, 0)
+    origin_tax = prices.national_tax(home_country)
     if origin_tax > 0:
         national_cost = air_emissions * origin_tax
 
@@ -1548,15 +1609,15 @@ def display_carbon_price_analysis(air_emissions, rail_emissions, bus_emissions,
     total_air_cost = eu_ets_cost + national_cost
 
     # Calculate costs for rail and bus (using EU ETS price for intra-EU journeys)
-    rail_cost = rail_emissions * calculator.EU_ETS_PRICE if rail_emissions else None
-    bus_cost = bus_emissions * calculator.EU_ETS_PRICE if bus_emissions else None
+    rail_cost = rail_emissions * prices.ets_price() if rail_emissions else None
+    bus_cost = bus_emissions * prices.ets_price() if bus_emissions else None
 
     # Display total and breakdown
     st.markdown(f"**Total Carbon Price for Air Transport: €{total_air_cost:.2f}**")
     st.markdown("#### Carbon Price Components")
 
     if eu_ets_cost > 0:
-        st.markdown(f"• EU ETS Cost (€{calculator.EU_ETS_PRICE}/ton): €{eu_ets_cost:.2f}")
+        st.markdown(f"• EU ETS Cost (€{prices.ets_price()}/ton): €{eu_ets_cost:.2f}")
     if national_cost > 0:
         st.markdown(f"• National Carbon Tax (€{origin_tax}/ton): €{national_cost:.2f}")
 
@@ -1575,9 +1636,9 @@ def display_carbon_price_analysis(air_emissions, rail_emissions, bus_emissions,
         "Mode": ["Air", "Rail", "Bus"],
         "Emissions (tons CO₂)": [air_emissions, rail_emissions, bus_emissions],
         "Applicable Price (€/ton)": [
-            origin_tax if national_cost > 0 else calculator.EU_ETS_PRICE,
-            calculator.EU_ETS_PRICE,
-            calculator.EU_ETS_PRICE
+            origin_tax if national_cost > 0 else prices.ets_price(),
+            prices.ets_price(),
+            prices.ets_price()
         ],
         "Carbon Cost (€)": [
             total_air_cost,
@@ -1741,7 +1802,7 @@ with st.sidebar:
     """)
 
 try:
-    all_teams = sorted(get_all_teams())  # Sort teams alphabetically
+    all_teams = get_sorted_teams()  # Sorted alphabetically, cached per process
 except Exception as e:
     st.error(f"Error loading team data: {str(e)}")
     all_teams = []  # Fallback to empty list
@@ -1,18 +1,291 @@
+import argparse
+import hashlib
+import json
+import os
+import queue
 import sqlite3
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
 import pandas as pd
-from datetime import datetime
-from typing import Union
+from src.config import constants
+from src.config.constants import TRANSPORT_MODES
 from src.models.emissions import EmissionsCalculator
+from src.models.icao_calculator import ICAOEmissionsCalculator
 from src.data.team_data import get_team_airport, get_airport_coordinates, TEAM_COUNTRIES
+from src.data.world_snapshot import SNAPSHOT_PATH, load_world_snapshot, open_world_snapshot
 from src.utils.calculations import (
-    calculate_distance, calculate_transport_emissions,
-    calculate_equivalencies, get_carbon_price
+    calculate_transport_emissions,
+    calculate_equivalencies, calculate_flight_time, get_carbon_price,
+    EQUIVALENCY_FACTORS
 )
+from src.utils.route_reader import ensure_team_indexes
+from src.utils.route_scheduler import ensure_freshness_column, epoch_now
+from src.utils.run_metrics import RunMetrics
+
+# Column order of match_emissions rows written by the processor
+MATCH_COLUMNS = [
+    'home_team', 'away_team', 'distance_km', 'flight_type',
+    'total_emissions', 'per_passenger_emissions',
+    'rail_emissions', 'bus_emissions', 'rail_saved', 'bus_saved',
+    'carbon_price', 'carbon_cost_air', 'carbon_cost_rail', 'carbon_cost_bus',
+    'flight_duration', 'driving_duration', 'transit_duration',
+    'driving_distance', 'transit_distance'
+]
+
+# Bookkeeping columns used by incremental runs
+VERSION_COLUMNS = ['computed_epoch', 'constants_fingerprint']
+
+INSERT_MATCH_SQL = f"""
+INSERT OR REPLACE INTO match_emissions ({', '.join(MATCH_COLUMNS + VERSION_COLUMNS)})
+VALUES ({', '.join('?' * len(MATCH_COLUMNS + VERSION_COLUMNS))})
+"""
+
+ROUTES_SQL = """
+    SELECT 
+        home_team, away_team, 
+        driving_duration, transit_duration,
+        driving_distance, transit_distance
+    FROM routes
+"""
+
+# Routes with no emissions row, a route update since the row was computed,
+# or a row computed under different constants
+STALE_ROUTES_SQL = """
+    SELECT 
+        r.home_team, r.away_team, 
+        r.driving_duration, r.transit_duration,
+        r.driving_distance, r.transit_distance
+    FROM routes r
+    LEFT JOIN match_emissions m
+        ON m.home_team = r.home_team AND m.away_team = r.away_team
+    WHERE m.id IS NULL
+        OR m.computed_epoch IS NULL
+        OR r.updated_epoch >= m.computed_epoch
+        OR m.constants_fingerprint IS NOT ?
+"""
+
+
+def _equivalency_sql(operation: str, factor: float) -> str:
+    """SQL expression applying one EQUIVALENCY_FACTORS entry to total_emissions."""
+    return f"total_emissions {'/' if operation == 'divide' else '*'} {factor!r}"
+
+
+def create_environmental_impact_views(conn: sqlite3.Connection) -> None:
+    """
+    Create the environmental impact views over match_emissions, or recreate
+    them when their stored definition differs from the generated SQL.
+
+    Equivalencies are total_emissions times a fixed factor, so they are
+    computed on read instead of being stored:
+      - match_environmental_impact: one row per match, one column per equivalency
+      - environmental_impact: the previous long (match_id, impact_type, value, unit) layout
+    """
+    wide_columns = ",\n        ".join(
+        f"{_equivalency_sql(operation, factor)} AS {name}"
+        for name, (operation, factor) in EQUIVALENCY_FACTORS.items()
+    )
+    long_rows = "\n    UNION ALL\n    ".join(
+        f"SELECT id AS match_id, '{name}' AS impact_type, "
+        f"{_equivalency_sql(operation, factor)} AS value, 'metric' AS unit FROM match_emissions"
+        for name, (operation, factor) in EQUIVALENCY_FACTORS.items()
+    )
+
+    views = {
+        'match_environmental_impact': f"""CREATE VIEW match_environmental_impact AS
+    SELECT
+        id AS match_id,
+        home_team,
+        away_team,
+        {wide_columns}
+    FROM match_emissions""",
+        'environmental_impact': f"CREATE VIEW environmental_impact AS\n    {long_rows}"
+    }
+
+    # Views already matching the generated SQL are left alone, so an unchanged
+    # database is never rewritten
+    changed = False
+    for name, sql in views.items():
+        row = conn.execute("SELECT sql FROM sqlite_master WHERE type = 'view' AND name = ?", (name,)).fetchone()
+        if row is None or row[0] != sql:
+            conn.execute(f"DROP VIEW IF EXISTS {name}")
+            conn.execute(sql)
+            changed = True
+    if changed:
+        conn.commit()
+
+
+def compact_environmental_impact(conn: sqlite3.Connection) -> None:
+    """
+    One-time migration from the stored environmental_impact table.
+
+    Older versions wrote 20 rows per match into an environmental_impact
+    table, and every INSERT OR REPLACE on match_emissions left the previous
+    rows orphaned. The table is dropped, the file is vacuumed to reclaim the
+    space, and the views from create_environmental_impact_views take its place.
+    """
+    row = conn.execute(
+        "SELECT type FROM sqlite_master WHERE name = 'environmental_impact'"
+    ).fetchone()
+    if row and row[0] == 'table':
+        stored_rows = conn.execute("SELECT COUNT(*) FROM environmental_impact").fetchone()[0]
+        conn.execute("DROP TABLE environmental_impact")
+        conn.commit()
+        conn.execute("VACUUM")
+        print(f"Compacted environmental_impact: removed {stored_rows} stored rows")
+
+    create_environmental_impact_views(conn)
+
+
+def constants_fingerprint(passengers: int = 30) -> str:
+    """Hash of every constant that feeds match_emissions; a change forces recomputation."""
+    from src.data.team_data import TEAM_AIRPORTS, AIRPORT_COORDINATES
+
+    icao = ICAOEmissionsCalculator()
+    inputs = {
+        'passengers': passengers,
+        'eu_ets_price': constants.EU_ETS_PRICE,
+        'default_carbon_price': constants.DEFAULT_CARBON_PRICE,
+        'eur_to_gbp': constants.EUR_TO_GBP,
+        'carbon_prices_eur': constants.CARBON_PRICES_EUR,
+        'transport_modes': constants.TRANSPORT_MODES,
+        'team_countries': TEAM_COUNTRIES,
+        'team_airports': TEAM_AIRPORTS,
+        'airport_coordinates': AIRPORT_COORDINATES,
+        'icao': [icao.GCD_CORRECTIONS, icao.ROUTE_GROUPS, icao.CABIN_FACTORS,
+                 {k: {str(d): f for d, f in v.items()} for k, v in icao.FUEL_CONSUMPTION.items()}],
+    }
+    payload = json.dumps(inputs, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+
+
+def _sql_value(value):
+    """Convert NumPy scalars and NaN to values sqlite3 can bind."""
+    if value is None:
+        return None
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and np.isnan(value):
+        return None
+    return value
+
+
+def compute_emissions_chunk(routes_df: pd.DataFrame, passengers: int = 30, snapshot_path: str = SNAPSHOT_PATH):
+    """
+    Vectorized equivalent of EmissionsProcessor.calculate_match_emissions for a chunk of routes.
+
+    Routes whose teams have no airport or coordinates are dropped, as in the serial path.
+    Distances and carbon prices come from the world snapshot at snapshot_path,
+    which must be current (see load_world_snapshot).
+
+    Returns:
+        DataFrame with the match_emissions columns
+    """
+    snapshot = open_world_snapshot(snapshot_path)
+    home_ids = snapshot.team_ids(routes_df['home_team'])
+    away_ids = snapshot.team_ids(routes_df['away_team'])
+
+    # Great-circle distances were computed per airport pair with the scalar
+    # formula when the snapshot was built, so they match the serial path bit for bit
+    base_distance = snapshot.distances(home_ids, away_ids)
+    resolvable = ~np.isnan(base_distance)
+    routes_df = routes_df[resolvable].reset_index(drop=True)
+    home_ids, away_ids, base_distance = home_ids[resolvable], away_ids[resolvable], base_distance[resolvable]
+
+    # Air emissions (EmissionsCalculator.calculate_flight_emissions defaults)
+    derby = base_distance < 15
+    icao = ICAOEmissionsCalculator().calculate_emissions_batch(
+        base_distance, aircraft_type="A320", cabin_class="business",
+        passengers=passengers, cargo_tons=2.0
+    )
+    distance_km = np.where(derby, 0.0, base_distance)
+    total_emissions = np.where(derby, 0.0, icao["emissions_total_kg"] / 1000)
+    per_passenger = np.where(derby, 0.0, (icao["emissions_total_kg"] / passengers) / 1000)
+    flight_type = np.select(
+        [derby, distance_km < 800, distance_km < 4800],
+        ["N/A: Derby Match", "Short", "Medium"],
+        default="Long"
+    )
+
+    # Flight time in minutes: 800 km/h cruise plus 30 minutes ground ops (see calculate_flight_time)
+    one_leg = np.maximum((distance_km / 800) * 3600 + 1800, 1800)
+    flight_duration = one_leg.astype(np.int64) // 60
+
+    driving_duration = routes_df['driving_duration'].to_numpy(dtype=float)
+    transit_duration = routes_df['transit_duration'].to_numpy(dtype=float)
+    driving_distance = routes_df['driving_distance'].to_numpy(dtype=float) / 1000
+    transit_distance = routes_df['transit_distance'].to_numpy(dtype=float) / 1000
+
+    def surface_emissions(mode, distance, duration):
+        # Same feasibility rules as calculate_transport_emissions
+        mode_config = TRANSPORT_MODES[mode]
+        adjusted_distance = distance * mode_config['distance_multiplier']
+        emissions = (adjusted_distance * mode_config['co2_per_km'] * passengers) / 1000
+        feasible = (distance != 0) & ~np.isnan(duration) & (duration != 0)
+        return np.where(feasible, emissions, np.nan)
+
+    rail_emissions = surface_emissions('rail', transit_distance, transit_duration)
+    bus_emissions = surface_emissions('bus', driving_distance, driving_duration)
+
+    carbon_price = snapshot.carbon_prices(away_ids, home_ids, constants.DEFAULT_CARBON_PRICE)
+
+    basic_df = pd.DataFrame({
+        'home_team': routes_df['home_team'],
+        'away_team': routes_df['away_team'],
+        'distance_km': distance_km,
+        'flight_type': flight_type,
+        'total_emissions': total_emissions,
+        'per_passenger_emissions': per_passenger,
+        'rail_emissions': rail_emissions,
+        'bus_emissions': bus_emissions,
+        'rail_saved': total_emissions - rail_emissions,
+        'bus_saved': total_emissions - bus_emissions,
+        'carbon_price': carbon_price,
+        'carbon_cost_air': total_emissions * carbon_price,
+        'carbon_cost_rail': rail_emissions * carbon_price,
+        'carbon_cost_bus': bus_emissions * carbon_price,
+        'flight_duration': flight_duration,
+        'driving_duration': routes_df['driving_duration'],
+        'transit_duration': routes_df['transit_duration'],
+        'driving_distance': driving_distance,
+        'transit_distance': transit_distance
+    })
+
+    return basic_df
+
+
+def _compute_chunk_timed(args):
+    """
+    Process pool entry point: compute one chunk and report its compute time.
+
+    A chunk that fails is recomputed match by match; matches that still fail
+    are logged and left out, as calculate_match_emissions does in the serial path.
+    """
+    routes_df, passengers, snapshot_path = args
+    start = time.perf_counter()
+    try:
+        basic_df = compute_emissions_chunk(routes_df, passengers, snapshot_path)
+    except Exception:
+        frames = []
+        for i in range(len(routes_df)):
+            route = routes_df.iloc[i:i + 1]
+            try:
+                frames.append(compute_emissions_chunk(route, passengers, snapshot_path))
+            except Exception as e:
+                print(f"Error calculating emissions for {route['home_team'].iloc[0]} vs "
+                      f"{route['away_team'].iloc[0]}: {str(e)}")
+        basic_df = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=MATCH_COLUMNS)
+    return basic_df, time.perf_counter() - start
+
 
 class EmissionsProcessor:
     def __init__(self, db_path='data/routes.db'):
         self.db_path = db_path
         self.calculator = EmissionsCalculator()
+        self.fingerprint = constants_fingerprint()
+        self.metrics = RunMetrics()
         self.setup_database()
 
     def setup_database(self):
@@ -44,20 +317,18 @@ class EmissionsProcessor:
             driving_distance REAL,
             transit_distance REAL,
             last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            computed_epoch INTEGER,
+            constants_fingerprint TEXT,
             FOREIGN KEY(home_team, away_team) REFERENCES routes(home_team, away_team),
             UNIQUE(home_team, away_team)
         )""")
 
-        # Create environmental impact table
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS environmental_impact (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            match_id INTEGER,
-            impact_type TEXT,
-            value REAL,
-            unit TEXT,
-            FOREIGN KEY(match_id) REFERENCES match_emissions(id)
-        )""")
+        # Add incremental bookkeeping columns to databases created before they existed
+        columns = [row[1] for row in cursor.execute("PRAGMA table_info(match_emissions)")]
+        if 'computed_epoch' not in columns:
+            cursor.execute("ALTER TABLE match_emissions ADD COLUMN computed_epoch INTEGER")
+        if 'constants_fingerprint' not in columns:
+            cursor.execute("ALTER TABLE match_emissions ADD COLUMN constants_fingerprint TEXT")
 
         # Create social costs table
         cursor.execute("""
@@ -74,6 +345,14 @@ class EmissionsProcessor:
         )""")
 
         conn.commit()
+
+        # Environmental impact is derived from total_emissions on read
+        compact_environmental_impact(conn)
+
+        # routes.updated_epoch tells incremental runs which routes changed
+        ensure_freshness_column(conn)
+        # Per-team route lookups (RouteViewer) need the away-side index
+        ensure_team_indexes(conn)
         conn.close()
 
 
@@ -84,44 +363,51 @@ class EmissionsProcessor:
             away_team = route_data['away_team']
 
             # Get airports and coordinates
-            home_airport = get_team_airport(home_team)
-            away_airport = get_team_airport(away_team)
+            with self.metrics.stage('coordinates'):
+                home_airport = get_team_airport(home_team)
+                away_airport = get_team_airport(away_team)
 
-            if not home_airport or not away_airport:
-                raise ValueError(f"Airport not found for {home_team} or {away_team}")
+                if not home_airport or not away_airport:
+                    raise ValueError(f"Airport not found for {home_team} or {away_team}")
 
-            home_coords = get_airport_coordinates(home_airport)
-            away_coords = get_airport_coordinates(away_airport)
+                home_coords = get_airport_coordinates(home_airport)
+                away_coords = get_airport_coordinates(away_airport)
 
-            if not home_coords or not away_coords:
-                raise ValueError(f"Coordinates not found for {home_airport} or {away_airport}")
+                if not home_coords or not away_coords:
+                    raise ValueError(f"Coordinates not found for {home_airport} or {away_airport}")
 
             # Calculate air emissions
-            result = self.calculator.calculate_flight_emissions(
-                origin_lat=home_coords['lat'],
-                origin_lon=home_coords['lon'],
-                dest_lat=away_coords['lat'],
-                dest_lon=away_coords['lon'],
-                passengers=passengers,
-                is_round_trip=False
-            )
-
-            # Calculate flight time
-            flight_duration = self.calculate_flight_time(result.distance_km)
+            with self.metrics.stage('icao'):
+                result = self.calculator.calculate_flight_emissions(
+                    origin_lat=home_coords['lat'],
+                    origin_lon=home_coords['lon'],
+                    dest_lat=away_coords['lat'],
+                    dest_lon=away_coords['lon'],
+                    passengers=passengers,
+                    is_round_trip=False
+                )
+
+            # Calculate flight time in minutes
+            flight_duration = calculate_flight_time(result.distance_km) // 60
 
             # Use existing route data for rail/bus calculations
             driving_distance = route_data['driving_distance'] / 1000  # Convert to km
             transit_distance = route_data['transit_distance'] / 1000  # Convert to km
 
-            # Calculate emissions using actual distances
-            rail_emissions = calculate_transport_emissions('rail', transit_distance, passengers, False)
-            bus_emissions = calculate_transport_emissions('bus', driving_distance, passengers, False)
+            # Calculate emissions using actual distances (None when the mode is infeasible);
+            # each call reads the route's durations from SQLite
+            with self.metrics.stage('transport_sqlite'):
+                rail_emissions = calculate_transport_emissions(
+                    'rail', transit_distance, passengers, False, home_team, away_team)
+                bus_emissions = calculate_transport_emissions(
+                    'bus', driving_distance, passengers, False, home_team, away_team)
 
             # Calculate carbon prices
-            carbon_price = get_carbon_price(away_team, home_team)
+            with self.metrics.stage('carbon_price'):
+                carbon_price = get_carbon_price(away_team, home_team)
             carbon_cost_air = result.total_emissions * carbon_price
-            carbon_cost_rail = rail_emissions * carbon_price
-            carbon_cost_bus = bus_emissions * carbon_price
+            carbon_cost_rail = rail_emissions * carbon_price if rail_emissions is not None else None
+            carbon_cost_bus = bus_emissions * carbon_price if bus_emissions is not None else None
 
             return {
                 'basic_data': {
@@ -133,8 +419,8 @@ class EmissionsProcessor:
                     'per_passenger_emissions': result.per_passenger,
                     'rail_emissions': rail_emissions,
                     'bus_emissions': bus_emissions,
-                    'rail_saved': result.total_emissions - rail_emissions,
-                    'bus_saved': result.total_emissions - bus_emissions,
+                    'rail_saved': result.total_emissions - rail_emissions if rail_emissions is not None else None,
+                    'bus_saved': result.total_emissions - bus_emissions if bus_emissions is not None else None,
                     'carbon_price': carbon_price,
                     'carbon_cost_air': carbon_cost_air,
                     'carbon_cost_rail': carbon_cost_rail,
@@ -152,90 +438,240 @@ class EmissionsProcessor:
             print(f"Error calculating emissions for {home_team} vs {away_team}: {str(e)}")
             return None
 
-    def process_all_matches(self):
-        """Process all matches in the database"""
+    def process_all_matches(self, parallel=False, workers=None, chunk_size=250, batch_size=500,
+                            incremental=False, progress_interval=None):
+        """
+        Process all matches in the database.
+
+        Args:
+            parallel: Compute vectorized chunks in a process pool with a single writer
+            workers: Number of worker processes (defaults to the CPU count)
+            chunk_size: Routes per worker chunk in parallel mode
+            batch_size: Matches per commit in parallel mode
+            incremental: Only recompute routes that changed since their emissions
+                row was written, or whose row predates the current constants
+            progress_interval: Seconds between progress lines; replaces the
+                per-match log lines when set
+
+        Returns:
+            Run summary with per-stage timers, match latency percentiles and
+            rows per second (also printed as JSON), or None if the run failed
+        """
+        self.metrics = RunMetrics(progress_interval=progress_interval)
+
+        if parallel:
+            return self._process_all_matches_parallel(workers, chunk_size, batch_size, incremental)
+
         conn = sqlite3.connect(self.db_path)
 
         try:
-            # Get all routes with their existing data
-            routes_df = pd.read_sql_query("""
-                SELECT 
-                    home_team, away_team, 
-                    driving_duration, transit_duration,
-                    driving_distance, transit_distance
-                FROM routes
-            """, conn)
+            # Get the routes to process with their existing data
+            with self.metrics.stage('load'):
+                routes_df = self._load_routes(conn, incremental)
 
             total = len(routes_df)
+            self.metrics.total = total
             print(f"Processing {total} matches...")
 
             for i, row in routes_df.iterrows():
-                print(f"Processing match {i+1}/{total}: {row['home_team']} vs {row['away_team']}")
+                if progress_interval is None:
+                    print(f"Processing match {i+1}/{total}: {row['home_team']} vs {row['away_team']}")
+
+                match_start = time.perf_counter()
 
                 # Calculate emissions using existing route data
                 results = self.calculate_match_emissions(row)
                 if results:
-                    self._save_results(results, conn)
+                    with self.metrics.stage('insert'):
+                        self._save_results(results, conn)
+
+                self.metrics.record_match(time.perf_counter() - match_start, success=bool(results))
+                if results:
+                    self.metrics.add_rows(1)
 
                 # Commit every 100 matches
                 if (i + 1) % 100 == 0:
-                    conn.commit()
-                    print(f"Committed {i+1} matches")
+                    with self.metrics.stage('commit'):
+                        conn.commit()
+                    if progress_interval is None:
+                        print(f"Committed {i+1} matches")
 
-            conn.commit()
+            with self.metrics.stage('commit'):
+                conn.commit()
             print("All matches processed successfully")
 
         except Exception as e:
             print(f"Error processing matches: {str(e)}")
             conn.rollback()
+            return None
         finally:
             conn.close()
 
+        return self.metrics.emit_summary(mode='serial', incremental=incremental)
+
+    def _load_routes(self, conn, incremental=False):
+        """
+        Load the routes to process.
+
+        In incremental mode, emissions rows whose route no longer exists are
+        deleted, and only stale routes are returned. The skipped, recomputed
+        and deleted counts are printed.
+        """
+        if not incremental:
+            return pd.read_sql_query(ROUTES_SQL, conn)
+
+        cursor = conn.cursor()
+        cursor.execute("""
+            DELETE FROM match_emissions WHERE id IN (
+                SELECT m.id FROM match_emissions m
+                LEFT JOIN routes r ON r.home_team = m.home_team AND r.away_team = m.away_team
+                WHERE r.id IS NULL
+            )
+        """)
+        deleted = cursor.rowcount
+        conn.commit()
+
+        routes_df = pd.read_sql_query(STALE_ROUTES_SQL, conn, params=(self.fingerprint,))
+        total_routes = conn.execute("SELECT COUNT(*) FROM routes").fetchone()[0]
+
+        print(f"Incremental run: {total_routes - len(routes_df)} skipped, "
+              f"{len(routes_df)} to recompute, {deleted} deleted")
+        return routes_df
+
+    def _process_all_matches_parallel(self, workers=None, chunk_size=250, batch_size=500,
+                                      incremental=False):
+        """
+        Parallel process_all_matches.
+
+        Route chunks are computed in a process pool; results are consumed in
+        route order through a queue by a single writer thread that owns the
+        SQLite connection and commits every `batch_size` matches. Output is
+        the same as the serial mode, including match_emissions ids.
+
+        Per-match latency is amortized over each worker chunk.
+        """
+        metrics = self.metrics
+
+        with metrics.stage('load'):
+            with sqlite3.connect(self.db_path) as conn:
+                routes_df = self._load_routes(conn, incremental)
+            # Built or validated once here; workers only map it, since the writer
+            # thread's commits would otherwise look like a database change to them
+            snapshot_path = load_world_snapshot(self.db_path).path
+
+        total = len(routes_df)
+        metrics.total = total
+        workers = workers or os.cpu_count() or 1
+        print(f"Processing {total} matches with {workers} workers...")
+
+        chunks = [(routes_df.iloc[i:i + chunk_size], 30, snapshot_path) for i in range(0, total, chunk_size)]
+        results_queue = queue.Queue(maxsize=workers * 2)
+        writer_state = {'written': 0, 'error': None, 'aborted': False}
+
+        def writer():
+            conn = sqlite3.connect(self.db_path)
+            try:
+                pending = 0
+                while True:
+                    item = results_queue.get()
+                    if item is None:
+                        break
+                    basic_df = item
+
+                    with metrics.stage('write'):
+                        self._save_results_batch(basic_df, conn)
+                        pending += len(basic_df)
+                        writer_state['written'] += len(basic_df)
+                        if pending >= batch_size:
+                            conn.commit()
+                            pending = 0
+                            if metrics.progress_interval is None:
+                                print(f"Committed {writer_state['written']} matches")
+                    metrics.add_rows(len(basic_df))
+
+                # A failed run drops its uncommitted batch; earlier commits stay, as in the serial path
+                with metrics.stage('write'):
+                    if writer_state['aborted']:
+                        conn.rollback()
+                    else:
+                        conn.commit()
+            except Exception as e:
+                writer_state['error'] = e
+                conn.rollback()
+                # Keep draining so producers never block on a full queue
+                while results_queue.get() is not None:
+                    pass
+            finally:
+                conn.close()
+
+        writer_thread = threading.Thread(target=writer)
+        writer_thread.start()
+
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                # executor.map yields in submission order, which keeps the output deterministic
+                for (chunk, _, _), (basic_df, seconds) in zip(chunks, executor.map(_compute_chunk_timed, chunks)):
+                    metrics.add_stage_time('compute', seconds, calls=len(chunk))
+                    for _ in range(len(chunk)):
+                        metrics.record_match(seconds / len(chunk))
+                    metrics.failed += len(chunk) - len(basic_df)
+                    results_queue.put(basic_df)
+        except Exception as e:
+            # The pool itself failed (e.g. a worker died); per-match errors are handled in the workers
+            writer_state['aborted'] = True
+            writer_state['error'] = writer_state['error'] or e
+        finally:
+            # Always stop the writer, even when the pool fails
+            results_queue.put(None)
+            writer_thread.join()
+
+        if writer_state['error'] is not None:
+            print(f"Error processing matches: {str(writer_state['error'])}")
+            return None
+
+        print("All matches processed successfully")
+        self._print_throughput_report(total, writer_state['written'], metrics)
+        return metrics.emit_summary(mode='parallel', incremental=incremental, workers=workers)
+
+    @staticmethod
+    def _print_throughput_report(total, written, metrics):
+        """Print matches per second for each pipeline stage."""
+        print("\nThroughput report")
+        print("-" * 50)
+        for stage, matches in [('load', total), ('compute', total), ('write', written), ('total', written)]:
+            seconds = metrics.elapsed() if stage == 'total' else metrics.stage_seconds.get(stage, 0.0)
+            rate = matches / seconds if seconds > 0 else float('inf')
+            print(f"{stage:<8} {matches:>7} matches {seconds:>8.2f}s {rate:>12,.0f} matches/s")
+        print("(compute time is summed across worker processes)")
+
+    def _save_results_batch(self, basic_df, conn):
+        """Save a chunk of vectorized results, matching _save_results row for row"""
+        version = (epoch_now(), self.fingerprint)
+        conn.executemany(INSERT_MATCH_SQL, [
+            tuple(_sql_value(v) for v in basic) + version
+            for basic in basic_df[MATCH_COLUMNS].itertuples(index=False, name=None)
+        ])
+
     def _save_results(self, results, conn):
         """Save calculation results to database"""
         cursor = conn.cursor()
 
-        # Insert basic emissions data
-        cursor.execute("""
-        INSERT OR REPLACE INTO match_emissions (
-            home_team, away_team, distance_km, flight_type,
-            total_emissions, per_passenger_emissions,
-            rail_emissions, bus_emissions, rail_saved, bus_saved,
-            carbon_price, carbon_cost_air, carbon_cost_rail, carbon_cost_bus,
-            flight_duration, driving_duration, transit_duration,
-            driving_distance, transit_distance
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            results['basic_data']['home_team'],
-            results['basic_data']['away_team'],
-            results['basic_data']['distance_km'],
-            results['basic_data']['flight_type'],
-            results['basic_data']['total_emissions'],
-            results['basic_data']['per_passenger_emissions'],
-            results['basic_data']['rail_emissions'],
-            results['basic_data']['bus_emissions'],
-            results['basic_data']['rail_saved'],
-            results['basic_data']['bus_saved'],
-            results['basic_data']['carbon_price'],
-            results['basic_data']['carbon_cost_air'],
-            results['basic_data']['carbon_cost_rail'],
-            results['basic_data']['carbon_cost_bus'],
-            results['basic_data']['flight_duration'],
-            results['basic_data']['driving_duration'],
-            results['basic_data']['transit_duration'],
-            results['basic_data']['driving_distance'],
-            results['basic_data']['transit_distance']
-        ))
-
-        match_id = cursor.lastrowid
-
-        # Save environmental impact data
-        for impact_type, value in results['environmental_impact'].items():
-            cursor.execute("""
-            INSERT INTO environmental_impact (match_id, impact_type, value, unit)
-            VALUES (?, ?, ?, ?)
-            """, (match_id, impact_type, value, "metric"))
+        # Insert basic emissions data; environmental impact is derived on read
+        # through the match_environmental_impact view
+        cursor.execute(INSERT_MATCH_SQL, tuple(
+            results['basic_data'][column] for column in MATCH_COLUMNS
+        ) + (epoch_now(), self.fingerprint))
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compute match emissions for all routes")
+    parser.add_argument('--parallel', action='store_true', help="use a process pool with a single writer")
+    parser.add_argument('--workers', type=int, default=None, help="number of worker processes")
+    parser.add_argument('--incremental', action='store_true',
+                        help="only recompute routes that changed or predate the current constants")
+    parser.add_argument('--progress', type=float, default=None, metavar='SECONDS',
+                        help="print a progress line every SECONDS instead of one line per match")
+    args = parser.parse_args()
+
     processor = EmissionsProcessor()
-    processor.process_all_matches()
+    processor.process_all_matches(parallel=args.parallel, workers=args.workers,
+                                  incremental=args.incremental, progress_interval=args.progress)
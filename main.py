@@ -1,11 +1,4 @@
 # main.py
-import threading
-
-import webbrowser
-
-import requests
-
-from tkinter import ttk, messagebox
 from src.gui.main_window import MainWindow
 
 
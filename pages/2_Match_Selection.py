@@ -1,11 +1,11 @@
 import streamlit as st
 import pandas as pd
-import sqlite3
 import math
 import plotly.express as px
-from src.models.emissions import EmissionsCalculator
-from src.data.team_data import get_team_airport, get_airport_coordinates
-from src.utils.calculations import calculate_distance
+from src.utils.streamlit_cache import (
+    clear_data_caches, get_data_version, get_logo_sprites, load_away_teams, load_competition_summary, load_competitions,
+    load_home_teams, load_match_count, load_match_page
+)
 
 # Page config
 st.set_page_config(
@@ -186,89 +186,33 @@ def format_number(value, decimal_places=0):
     return f"{value:,.0f}"
 
 
-def load_data():
-    """Load data from database"""
-    try:
-        conn = sqlite3.connect('data/routes.db')
-        query = """
-        SELECT 
-            r.home_team as "Home Team",
-            r.away_team as "Away Team",
-            r.competition as "Competition",
-            r.driving_duration/3600.0 as driving_hours,
-            r.transit_duration/3600.0 as transit_hours,
-            r.driving_distance/1000.0 as driving_km,
-            r.transit_distance/1000.0 as transit_km
-        FROM routes r
-        """
-        df = pd.read_sql_query(query, conn)
-        conn.close()
-        return df
-    except Exception as e:
-        st.error(f"Error loading data: {str(e)}")
-        return None
-
-
-def calculate_competition_summary(df):
-    """Calculate summary statistics by competition"""
-    calculator = EmissionsCalculator()
-    summary_data = []
-
-    for competition in df['Competition'].unique():
-        comp_df = df[df['Competition'] == competition]
-        total_matches = len(comp_df)
-        total_distance = 0
-        total_emissions = 0
-
-        for _, row in comp_df.iterrows():
-            home_airport = get_team_airport(row['Home Team'])
-            away_airport = get_team_airport(row['Away Team'])
-
-            if home_airport and away_airport:
-                home_coords = get_airport_coordinates(home_airport)
-                away_coords = get_airport_coordinates(away_airport)
-
-                if home_coords and away_coords:
-                    distance = calculate_distance(
-                        home_coords['lat'], home_coords['lon'],
-                        away_coords['lat'], away_coords['lon']
-                    )
-                    total_distance += distance
-
-                    result = calculator.calculate_flight_emissions(
-                        origin_lat=home_coords['lat'],
-                        origin_lon=home_coords['lon'],
-                        dest_lat=away_coords['lat'],
-                        dest_lon=away_coords['lon'],
-                        passengers=30,
-                        is_round_trip=True
-                    )
-                    total_emissions += result.total_emissions
-
-        if total_matches > 0:
-            summary_data.append({
-                'Competition': competition,
-                'Matches': total_matches,
-                'Total Distance (km)': total_distance,
-                'Total Emissions (tons)': total_emissions,
-                'Avg Distance (km)': total_distance / total_matches,
-                'Avg Emissions (tons)': total_emissions / total_matches
-            })
-
-    return pd.DataFrame(summary_data)
+def filter_value(selection):
+    """Map a filter selection to a query parameter ("All" means no filter)"""
+    return None if selection == "All" else selection
+
+
+def calculate_competition_summary():
+    """Summary statistics by competition (SQL aggregate, cached until the database changes)"""
+    return load_competition_summary(get_data_version())
 
 
 def main():
     st.title('⚽ Football Travel Emissions Analysis')
 
-    # Load data
-    df = load_data()
-    if df is None:
+    if st.sidebar.button("🔄 Reload data", help="Drop cached data and re-read the database"):
+        clear_data_caches()
+
+    # Data version of the database; every cached lookup below is keyed on it
+    try:
+        data_version = get_data_version()
+    except Exception as e:
+        st.error(f"Error loading data: {str(e)}")
         return
 
     # Calculate and display competition summary
-    summary_df = calculate_competition_summary(df)
-    display_summary = summary_df.round(2).sort_values('Total Emissions (tons)', ascending=False)
+    summary_df = calculate_competition_summary()
+    display_summary = (summary_df.drop(columns='Matches With Emissions').round(2)
+                       .sort_values('Total Emissions (tons)', ascending=False))
     # Add this section right after loading the data and calculating summary_df
 
     # Calculate totals
@@ -305,6 +249,12 @@ def main():
                   f"{format_number(avg_emissions)} tons",
                   help="Average emissions per match across all competitions")
 
+    # Totals and averages only cover matches processed by emissions_processor.py
+    covered_matches = int(summary_df['Matches With Emissions'].sum())
+    if covered_matches < summary_df['Matches'].sum():
+        st.caption(f"Emissions figures cover {covered_matches:,} of {int(summary_df['Matches'].sum()):,} matches; "
+                   "run emissions_processor.py to include the rest.")
+
     # Format summary data
     for col in display_summary.columns:
         if col != 'Competition' and col != 'Matches':
@@ -364,17 +314,17 @@ def main():
 
         for col in numeric_cols:
             # Remove commas and convert to float if needed
-            if formatted_df[col].dtype == object:
+            if not pd.api.types.is_numeric_dtype(formatted_df[col]):
                 formatted_df[col] = formatted_df[col].str.replace(',', '', regex=False).astype(float)
-            # Convert to integer
-            formatted_df[col] = formatted_df[col].round().astype(int)
+            # Convert to integer (averages stay empty for competitions without emissions)
+            formatted_df[col] = formatted_df[col].round().astype('Int64')
 
         # Calculate totals from original numeric data (not formatted_df)
         total_distance = summary_df['Total Distance (km)'].sum()
         total_emissions = summary_df['Total Emissions (tons)'].sum()
         total_matches = summary_df['Matches'].sum()
-        avg_distance = total_distance / total_matches
-        avg_emissions = total_emissions / total_matches
+        avg_distance = round(total_distance / covered_matches) if covered_matches else None
+        avg_emissions = round(total_emissions / covered_matches) if covered_matches else None
 
         # Create total row with original values
         total_row = {
@@ -382,8 +332,8 @@ def main():
             'Matches': int(total_matches),
             'Total Distance (km)': int(round(total_distance)),
             'Total Emissions (tons)': int(round(total_emissions)),
-            'Avg Distance (km)': int(round(avg_distance)),
-            'Avg Emissions (tons)': int(round(avg_emissions))
+            'Avg Distance (km)': avg_distance,
+            'Avg Emissions (tons)': avg_emissions
         }
 
         # Append total row
@@ -401,7 +351,7 @@ def main():
                 'Total Emissions (tons)': '{:,}',
                 'Avg Distance (km)': '{:,}',
                 'Avg Emissions (tons)': '{:,}'
-            })
+            }, na_rep='–')
             .set_table_styles([{
                 'selector': 'th, td',
                 'props': [('text-align', 'center')]
@@ -450,32 +400,23 @@ def main():
     with col1:
         competition_filter = st.selectbox(
             "🏆 Select Competition",
-            ["All"] + sorted(df['Competition'].unique().tolist())
+            ["All"] + load_competitions(data_version)
         )
 
     with col2:
-        filtered_df = df if competition_filter == "All" else df[df['Competition'] == competition_filter]
         home_filter = st.selectbox(
             "🏠 Select Home Team",
-            ["All"] + sorted(filtered_df['Home Team'].unique().tolist())
+            ["All"] + load_home_teams(filter_value(competition_filter), data_version)
         )
 
     with col3:
-        away_teams = df['Away Team'].unique() if home_filter == "All" else df[df['Home Team'] == home_filter][
-            'Away Team'].unique()
         away_filter = st.selectbox(
             "✈️ Select Away Team",
-            ["All"] + sorted(away_teams)
+            ["All"] + load_away_teams(filter_value(home_filter), data_version)
         )
 
-    # Apply filters
-    filtered_df = df.copy()
-    if competition_filter != "All":
-        filtered_df = filtered_df[filtered_df['Competition'] == competition_filter]
-    if home_filter != "All":
-        filtered_df = filtered_df[filtered_df['Home Team'] == home_filter]
-    if away_filter != "All":
-        filtered_df = filtered_df[filtered_df['Away Team'] == away_filter]
+    # Filters are applied in SQL
+    filters = (filter_value(competition_filter), filter_value(home_filter), filter_value(away_filter))
 
     # Pagination controls
     matches_per_page = st.select_slider(
@@ -484,7 +425,7 @@ def main():
         value=20
     )
 
-    total_matches = len(filtered_df)
+    total_matches = load_match_count(*filters, data_version)
     total_pages = math.ceil(total_matches / matches_per_page)
 
     if total_pages > 1:
@@ -503,9 +444,15 @@ def main():
 
     st.markdown(f"Showing matches {start_idx + 1}-{end_idx} of {total_matches}")
 
-    # Display matches with pagination
-    for index, row in filtered_df.iloc[start_idx:end_idx].iterrows():
-        match_id = f"match_{index}"
+    # Display matches with pagination; only the visible page is fetched
+    page_df = load_match_page(*filters, matches_per_page, start_idx, data_version)
+
+    # One sprite sheet for every logo on the page
+    sprite_css, team_sprites = get_logo_sprites()
+    st.markdown(sprite_css, unsafe_allow_html=True)
+
+    for _, row in page_df.iterrows():
+        match_id = f"match_{row['id']}"
 
         # Create match card container
         container = st.container()
@@ -517,11 +464,11 @@ def main():
                 st.markdown(f"""
                     <div class="match-card">
                         <div style="display: flex; justify-content: space-between; align-items: center;">
-                            <div class="team-name" style="flex: 2; text-align: center;">{row['Home Team']}</div>
+                            <div class="team-name" style="flex: 2; text-align: center;">{team_sprites.get(row['Home Team'], '')}{row['Home Team']}</div>
                             <div style="flex: 1; text-align: center;">
                                 <span class="vs-text">VS</span>
                             </div>
-                            <div class="team-name" style="flex: 2; text-align: center;">{row['Away Team']}</div>
+                            <div class="team-name" style="flex: 2; text-align: center;">{row['Away Team']}{team_sprites.get(row['Away Team'], '')}</div>
                             <div style="flex: 1; text-align: right;">
                                 <span class="competition-tag">{row['Competition']}</span>
                             </div>
@@ -544,7 +491,7 @@ def main():
                     </style>
                 """, unsafe_allow_html=True)
 
-                if st.button("➡️", key=f"calc_{index}", help="Calculate emissions for this match"):
+                if st.button("➡️", key=f"calc_{row['id']}", help="Calculate emissions for this match"):
                     st.session_state.calculator_input = {
                         'home_team': row['Home Team'],
                         'away_team': row['Away Team'],
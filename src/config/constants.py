@@ -65,6 +65,21 @@ CARBON_PRICES_EUR = {
 
 }
 
+# EU ETS price path (EUR/ton)
+EU_ETS_FORECAST = {
+    2024: 88.46,
+    2025: 95.0,
+    2026: 102.0,
+    2027: 110.0  # Extension to all departing flights
+}
+
+# EEA Countries (EU + Iceland, Liechtenstein, Norway)
+EEA_COUNTRIES = {
+    'AT', 'BE', 'BG', 'HR', 'CY', 'CZ', 'DK', 'EE', 'FI', 'FR',
+    'DE', 'GR', 'HU', 'IS', 'IE', 'IT', 'LV', 'LI', 'LT', 'LU',
+    'MT', 'NL', 'NO', 'PL', 'PT', 'RO', 'SK', 'SI', 'ES', 'SE'
+}
+
 # ============= SOCIAL COST CONSTANTS =============
 SOCIAL_CARBON_COSTS = {
     'synthetic_median': 185.0,
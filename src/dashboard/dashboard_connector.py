@@ -1,27 +1,17 @@
-import sqlite3
-
-from src.dashboard.app import DashboardApp
-from tkinter import ttk
-import webbrowser
 import json
-import tempfile
 import os
+import tempfile
 import threading
 import time
-import requests
+import webbrowser
+from tkinter import ttk
 
+from src.data.world_snapshot import load_world_snapshot
 from src.utils.calculations import calculate_transport_emissions, calculate_equivalencies, format_time_duration, \
     get_carbon_price, calculate_driving_time, calculate_transit_time, calculate_flight_time
 
-import threading
-import webbrowser
-import json
-import tempfile
-import os
-import time
-import requests
-from tkinter import ttk
-from src.dashboard.app import DashboardApp
+# Dash, plotly and requests are imported where they are used: the dashboard
+# server starts in a background thread, so the window opens without them
 
 
 class DashboardConnector:
@@ -39,6 +29,8 @@ class DashboardConnector:
         try:
             def run_server():
                 try:
+                    from src.dashboard.app import DashboardApp
+
                     self.dashboard = DashboardApp()
                     self.dashboard.run_server(debug=False, port=8050)
                     self.server_running = True
@@ -74,6 +66,8 @@ class DashboardConnector:
     def open_dashboard_browser(self):
         """Open the dashboard in the default web browser"""
         try:
+            import requests
+
             # Check if server is running
             response = requests.get('http://127.0.0.1:8050', timeout=1)
             if response.status_code == 200:
@@ -106,17 +100,7 @@ class DashboardConnector:
 
                 # Get route information from database
                 try:
-                    conn = sqlite3.connect(main_window.db_path)
-                    cursor = conn.cursor()
-
-                    cursor.execute("""
-                        SELECT driving_duration, transit_duration, driving_distance, transit_distance
-                        FROM routes 
-                        WHERE home_team = ? AND away_team = ?
-                    """, (home_team, away_team))
-
-                    row = cursor.fetchone()
-                    conn.close()
+                    row = load_world_snapshot(main_window.db_path).route(home_team, away_team)
 
                     if row:
                         driving_duration, transit_duration, driving_distance, transit_distance = row
@@ -186,6 +170,8 @@ class DashboardConnector:
     def update_status(self):
         """Update dashboard status label"""
         try:
+            import requests
+
             response = requests.get('http://127.0.0.1:8050', timeout=1)
             if response.status_code == 200:
                 if self.status_label:
@@ -0,0 +1,326 @@
+# src/data/world_snapshot.py
+"""
+Precompiled snapshot of the reference data every entry point starts from.
+
+Teams, airports, countries, carbon prices, routes, salaries and the airport
+distance matrix are compiled into one versioned binary file: a small JSON
+header (names and array table) followed by 64-byte aligned arrays. Opening
+the snapshot parses the header and memory-maps the arrays read-only, so
+Streamlit, the Tk GUI, the Dash dashboard and batch workers load it in
+milliseconds and share its pages through the OS page cache.
+"""
+import hashlib
+import json
+import math
+import os
+import sqlite3
+import struct
+import sys
+import time
+from contextlib import closing
+from functools import lru_cache
+from typing import Optional
+
+import numpy as np
+
+SNAPSHOT_PATH = 'data/world_snapshot.bin'
+DB_PATH = 'data/routes.db'
+
+MAGIC = b'FBWORLD\x00'
+FORMAT_VERSION = 1
+PREAMBLE = struct.Struct('<8sII')  # magic, format version, header length
+ALIGNMENT = 64
+
+# Modules whose content shapes the snapshot; an edit to any of them forces a rebuild
+_SOURCE_MODULES = (
+    'src/data/team_data.py',
+    'src/config/constants.py',
+    'src/utils/carbon_pricing/price_table.py',
+    'src/utils/calculations.py',
+    'src/data/world_snapshot.py'
+)
+_PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+ROUTE_COLUMNS = ['driving_duration', 'driving_distance', 'transit_duration', 'transit_distance']
+
+
+def _read_sources(db_path: str) -> tuple:
+    """Route and salary rows the snapshot is compiled from, read through a read-only connection."""
+    with closing(sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)) as conn:
+        routes = conn.execute(f"""
+            SELECT home_team, away_team, Competition, {', '.join(ROUTE_COLUMNS)}
+            FROM routes
+            ORDER BY id
+        """).fetchall()
+        try:
+            salary_rows = conn.execute("SELECT team, gross_per_minute FROM team_salaries ORDER BY rowid").fetchall()
+        except sqlite3.OperationalError:
+            # Salaries are optional (update_salary_data.py adds them)
+            salary_rows = []
+    return routes, salary_rows
+
+
+def _fingerprint(routes: list, salary_rows: list) -> str:
+    digest = hashlib.sha1()
+    for module in _SOURCE_MODULES:
+        with open(os.path.join(_PROJECT_ROOT, module), 'rb') as f:
+            digest.update(f.read())
+    # Only the rows the snapshot reads: index builds, emissions writes and
+    # other tables leave it unchanged
+    digest.update(repr(routes).encode('utf-8'))
+    digest.update(repr(salary_rows).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def source_fingerprint(db_path: str = DB_PATH) -> str:
+    """Hash of the snapshot inputs: source module contents and the route and salary rows."""
+    return _fingerprint(*_read_sources(db_path))
+
+
+def _align(offset: int) -> int:
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+def _write_snapshot(path: str, header: dict, arrays: dict) -> None:
+    """Write header and arrays to path atomically (readers never see a partial file)."""
+    # Offsets are relative to the data section, which starts at the first aligned byte after the header
+    table = {}
+    offset = 0
+    for name, array in arrays.items():
+        table[name] = {'dtype': array.dtype.str, 'shape': list(array.shape), 'offset': offset}
+        offset = _align(offset + array.nbytes)
+    header_bytes = json.dumps(dict(header, arrays=table), ensure_ascii=False).encode('utf-8')
+    data_start = _align(PREAMBLE.size + len(header_bytes))
+
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, 'wb') as f:
+        f.write(PREAMBLE.pack(MAGIC, FORMAT_VERSION, len(header_bytes)))
+        f.write(header_bytes)
+        for name, array in arrays.items():
+            f.write(b'\x00' * (data_start + table[name]['offset'] - f.tell()))
+            f.write(np.ascontiguousarray(array).tobytes())
+    os.replace(temp_path, path)
+
+
+def build_snapshot(output_path: str = SNAPSHOT_PATH, db_path: str = DB_PATH) -> 'WorldSnapshot':
+    """
+    Compile the reference data into a snapshot file.
+
+    Distances use the scalar calculate_distance per airport pair, so they are
+    bit-identical to the per-match path.
+
+    Returns:
+        The freshly written snapshot, opened
+    """
+    from src.data.team_data import AIRPORT_COORDINATES, TEAM_AIRPORTS, TEAM_COUNTRIES
+    from src.utils.calculations import calculate_distance
+    from src.utils.carbon_pricing.price_table import get_price_table
+
+    routes, salary_rows = _read_sources(db_path)
+    fingerprint = _fingerprint(routes, salary_rows)
+
+    # Teams known anywhere: reference tables, routes and salaries
+    teams = sorted(set(TEAM_AIRPORTS) | set(TEAM_COUNTRIES)
+                   | {row[0] for row in routes} | {row[1] for row in routes}
+                   | {row[0] for row in salary_rows if row[0] is not None})
+    team_index = {team: i for i, team in enumerate(teams)}
+
+    # Airports with coordinates; teams whose airport has none are unresolvable (-1)
+    airports = sorted(AIRPORT_COORDINATES)
+    airport_index = {code: i for i, code in enumerate(airports)}
+    airport_coordinates = np.array([[AIRPORT_COORDINATES[code]['lat'], AIRPORT_COORDINATES[code]['lon']]
+                                    for code in airports], dtype=np.float64).reshape(-1, 2)
+    team_airport = np.array([airport_index.get(TEAM_AIRPORTS.get(team), -1) for team in teams], dtype=np.int32)
+    airport_distance = np.array([[calculate_distance(lat1, lon1, lat2, lon2)
+                                  for lat2, lon2 in airport_coordinates]
+                                 for lat1, lon1 in airport_coordinates], dtype=np.float64).reshape(len(airports), -1)
+
+    # Carbon prices: the match price table over countries, teams without a country in the unknown slot
+    price_table = get_price_table()
+    team_country = np.array([price_table.country_id(TEAM_COUNTRIES.get(team)) for team in teams], dtype=np.int32)
+    team_has_country = np.array([bool(TEAM_COUNTRIES.get(team)) for team in teams])
+
+    # Salaries: first row per team, as the per-team SQL lookup returns
+    salary = np.full(len(teams), np.nan)
+    seen = set()
+    for team, gross_per_minute in salary_rows:
+        if team is not None and team not in seen:
+            seen.add(team)
+            salary[team_index[team]] = np.nan if gross_per_minute is None else gross_per_minute
+
+    # Routes: columns in route order, plus a (home, away) -> route index matrix
+    competitions = sorted({row[2] for row in routes if row[2] is not None})
+    competition_index = {name: i for i, name in enumerate(competitions)}
+    route_index = np.full((len(teams), len(teams)), -1, dtype=np.int32)
+    for i, row in enumerate(routes):
+        route_index[team_index[row[0]], team_index[row[1]]] = i
+    arrays = {
+        'team_airport': team_airport,
+        'team_country': team_country,
+        'team_has_country': team_has_country,
+        'team_salary': salary,
+        'airport_coordinates': airport_coordinates,
+        'airport_distance': airport_distance,
+        'team_price': np.asarray(price_table.team_price, dtype=np.float64),
+        'route_index': route_index,
+        'route_home': np.array([team_index[row[0]] for row in routes], dtype=np.int32),
+        'route_away': np.array([team_index[row[1]] for row in routes], dtype=np.int32),
+        'route_competition': np.array([competition_index.get(row[2], -1) for row in routes], dtype=np.int32)
+    }
+    for j, column in enumerate(ROUTE_COLUMNS):
+        arrays[f"route_{column}"] = np.array([np.nan if row[3 + j] is None else row[3 + j] for row in routes],
+                                             dtype=np.float64)
+
+    header = {
+        'fingerprint': fingerprint,
+        'built_epoch': int(time.time()),
+        'teams': teams,
+        'airports': airports,
+        'countries': price_table.countries,
+        'competitions': competitions
+    }
+    _write_snapshot(output_path, header, arrays)
+    return WorldSnapshot(output_path)
+
+
+class WorldSnapshot:
+    """
+    Read-only view over a snapshot file.
+
+    Arrays are memory-mapped, never copied; every lookup is plain indexing.
+    Team ids index team_* arrays and both axes of route_index; -1 means
+    unknown (no airport, no route, ...).
+    """
+
+    def __init__(self, path: str = SNAPSHOT_PATH):
+        self.path = path
+        with open(path, 'rb') as f:
+            magic, version, header_length = PREAMBLE.unpack(f.read(PREAMBLE.size))
+            if magic != MAGIC or version != FORMAT_VERSION:
+                raise ValueError(f"{path} is not a version {FORMAT_VERSION} world snapshot")
+            self.header = json.loads(f.read(header_length).decode('utf-8'))
+        data_start = _align(PREAMBLE.size + header_length)
+
+        self.fingerprint = self.header['fingerprint']
+        self.teams = self.header['teams']
+        self.airports = self.header['airports']
+        self.countries = self.header['countries']
+        self.competitions = self.header['competitions']
+        self.team_index = {team: i for i, team in enumerate(self.teams)}
+
+        # One shared mapping; each array is a read-only view into it
+        self._map = np.memmap(path, dtype=np.uint8, mode='r')
+        for name, spec in self.header['arrays'].items():
+            setattr(self, name, np.ndarray(tuple(spec['shape']), dtype=np.dtype(spec['dtype']),
+                                           buffer=self._map, offset=data_start + spec['offset']))
+
+    def team_id(self, team: str) -> int:
+        return self.team_index.get(team, -1)
+
+    def team_ids(self, teams) -> np.ndarray:
+        """Team ids of an array of team names (-1 for unknown teams)."""
+        unique_teams, inverse = np.unique(np.asarray(teams, dtype=object), return_inverse=True)
+        unique_ids = np.array([self.team_id(team) for team in unique_teams], dtype=np.intp)
+        return unique_ids[inverse.reshape(-1)]
+
+    def distances(self, home_ids, away_ids) -> np.ndarray:
+        """Great-circle km between team airports; NaN where either team has no resolvable airport."""
+        home_airports = np.where(np.asarray(home_ids) >= 0, self.team_airport[home_ids], -1)
+        away_airports = np.where(np.asarray(away_ids) >= 0, self.team_airport[away_ids], -1)
+        resolvable = (home_airports >= 0) & (away_airports >= 0)
+        return np.where(resolvable, self.airport_distance[home_airports, away_airports], np.nan)
+
+    def distance(self, home_team: str, away_team: str) -> Optional[float]:
+        """Great-circle km between two teams' airports, or None."""
+        distance = self.distances(np.array([self.team_id(home_team)]), np.array([self.team_id(away_team)]))[0]
+        return None if math.isnan(distance) else float(distance)
+
+    def carbon_prices(self, away_ids, home_ids, default_price: float) -> np.ndarray:
+        """
+        Match carbon prices from CarbonPriceTable.team_price (away country, home country).
+
+        Away teams without a country are charged default_price, as in get_carbon_price.
+        """
+        prices = self.team_price[self.team_country[away_ids], self.team_country[home_ids]]
+        return np.where(self.team_has_country[away_ids], prices, default_price)
+
+    def salary(self, team: str) -> Optional[float]:
+        """Gross salary cost per minute for a team, or None."""
+        team_id = self.team_id(team)
+        if team_id < 0 or math.isnan(self.team_salary[team_id]):
+            return None
+        return float(self.team_salary[team_id])
+
+    def route(self, home_team: str, away_team: str) -> Optional[tuple]:
+        """
+        Stored route between two teams, or None.
+
+        Returns:
+            (driving_duration, transit_duration, driving_distance, transit_distance),
+            None for values the routes table has as NULL
+        """
+        home_id, away_id = self.team_id(home_team), self.team_id(away_team)
+        if home_id < 0 or away_id < 0 or self.route_index[home_id, away_id] < 0:
+            return None
+        i = self.route_index[home_id, away_id]
+        values = (self.route_driving_duration[i], self.route_transit_duration[i],
+                  self.route_driving_distance[i], self.route_transit_distance[i])
+        return tuple(None if math.isnan(value) else int(value) for value in values)
+
+
+@lru_cache(maxsize=None)
+def open_world_snapshot(path: str = SNAPSHOT_PATH) -> WorldSnapshot:
+    """Snapshot file opened once per process, without a freshness check (e.g. in pool workers)."""
+    return WorldSnapshot(path)
+
+
+def snapshot_path_for(db_path: str = DB_PATH) -> str:
+    """Snapshot file kept next to a database (data/routes.db -> data/world_snapshot.bin)."""
+    return os.path.join(os.path.dirname(db_path), os.path.basename(SNAPSHOT_PATH))
+
+
+def load_world_snapshot(db_path: str = DB_PATH, rebuild: bool = True) -> WorldSnapshot:
+    """
+    Snapshot of a database, checked against the database's current rows.
+
+    Args:
+        db_path: Database the snapshot was compiled from
+        rebuild: Rebuild a missing, unreadable or stale snapshot; when False
+            (read-only deployments) raise RuntimeError instead
+
+    Returns:
+        The opened snapshot
+    """
+    path = snapshot_path_for(db_path)
+    fingerprint = source_fingerprint(db_path)
+    try:
+        snapshot = open_world_snapshot(path)
+        if snapshot.fingerprint == fingerprint:
+            return snapshot
+    except (OSError, ValueError, KeyError):
+        pass
+    open_world_snapshot.cache_clear()
+    if not rebuild:
+        raise RuntimeError(f"World snapshot {path} is missing or out of date with {db_path}; "
+                           f"rebuild it with: python -m src.data.world_snapshot {db_path}")
+    build_snapshot(path, db_path)
+    return open_world_snapshot(path)
+
+
+if __name__ == "__main__":
+    # Compile the snapshot, e.g. while building the container image
+    db_path = sys.argv[1] if len(sys.argv) > 1 else DB_PATH
+    output_path = snapshot_path_for(db_path)
+    start = time.perf_counter()
+
+    # The Streamlit pages open the database read-only, so their query indexes
+    # are created here, in the build step
+    from src.utils.match_queries import ensure_match_indexes
+    with closing(sqlite3.connect(db_path)) as conn:
+        ensure_match_indexes(conn)
+
+    snapshot = build_snapshot(output_path, db_path)
+    print(f"World snapshot with {len(snapshot.teams)} teams, {len(snapshot.airports)} airports "
+          f"and {len(snapshot.route_index[snapshot.route_index >= 0])} routes written to {output_path} "
+          f"in {time.perf_counter() - start:.2f}s ({os.path.getsize(output_path) / 1024:.0f} KB)")
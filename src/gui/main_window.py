@@ -5,21 +5,20 @@ import json
 import os
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-import sqlite3
-import pandas as pd
 
 # Application-specific imports
 from src.config.constants import (
-    DEFAULT_PASSENGERS, EMISSION_FACTORS, TRANSPORT_MODES, SOCIAL_CARBON_COSTS,
-    CARBON_PRICES_EUR, EU_ETS_PRICE
+    DEFAULT_PASSENGERS, EMISSION_FACTORS, TRANSPORT_MODES, SOCIAL_CARBON_COSTS
 )
 from src.dashboard.dashboard_connector import DashboardConnector
 from src.data.team_data import get_team_airport, get_airport_coordinates, TEAM_COUNTRIES
+from src.data.world_snapshot import load_world_snapshot
 from src.gui.theme import COLORS
 from src.gui.widgets.auto_complete import TeamAutoComplete, CompetitionAutoComplete
 from src.models.emissions import EmissionsCalculator, EmissionsResult
 from src.utils.calculations import (
-    calculate_transport_emissions, calculate_equivalencies, calculate_distance, determine_mileage_type, calculate_flight_time, format_time_duration
+    calculate_transport_emissions, calculate_equivalencies, calculate_distance, determine_mileage_type, calculate_flight_time, format_time_duration,
+    get_carbon_price
 )
 
 
@@ -424,23 +423,14 @@ class MainWindow(tk.Tk):
         away_team = self.away_team_entry.get()
         home_team = self.home_team_entry.get()
         away_country = TEAM_COUNTRIES.get(away_team, 'EU')
-        carbon_price = CARBON_PRICES_EUR.get(away_country, EU_ETS_PRICE)
+        # Shared price table: away country's price, in GBP for British hosts
+        carbon_price = get_carbon_price(away_team, home_team)
+        currency = '£' if TEAM_COUNTRIES.get(home_team) == 'GB' else '€'
         is_round_trip = self.round_trip_var.get()
 
         # Get stored route information from database
         try:
-            import sqlite3
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            cursor.execute("""
-                SELECT driving_duration, transit_duration, driving_distance, transit_distance
-                FROM routes 
-                WHERE home_team = ? AND away_team = ?
-            """, (home_team, away_team))
-
-            row = cursor.fetchone()
-            conn.close()
+            row = load_world_snapshot(self.db_path).route(home_team, away_team)
 
             if row:
                 driving_duration, transit_duration, driving_distance, transit_distance = row
@@ -534,7 +524,7 @@ class MainWindow(tk.Tk):
         # Carbon Price Analysis with vertical lines
         self.result_text.insert(tk.END, f"\nCarbon Price Analysis ({away_country}):\n")
         self.result_text.insert(tk.END, "=" * 70 + "\n")
-        self.result_text.insert(tk.END, f"Carbon Price: €{carbon_price:.2f}/tCO2\n\n")
+        self.result_text.insert(tk.END, f"Carbon Price: {currency}{carbon_price:.2f}/tCO2\n\n")
 
         # Carbon costs table with vertical lines
         mode_width = 20
@@ -542,7 +532,7 @@ class MainWindow(tk.Tk):
 
         for mode, emissions in [("Air", air_emissions), ("Rail", rail_emissions), ("Bus", bus_emissions)]:
             cost = emissions * carbon_price
-            row = f"| {mode:^{mode_width}} | €{cost:^{cost_width}.2f} |\n"
+            row = f"| {mode:^{mode_width}} | {currency}{cost:^{cost_width}.2f} |\n"
             self.result_text.insert(tk.END, row)
 
         # Social Cost Analysis with vertical lines
@@ -1288,6 +1278,8 @@ class MainWindow(tk.Tk):
             if not file_path:
                 raise ValueError("Please select a CSV file")
 
+            import pandas as pd
+
             data = pd.read_csv(file_path)
 
             required_cols = ['Home Team', 'Away Team', 'Competition']
@@ -1388,6 +1380,8 @@ class MainWindow(tk.Tk):
                     })
 
                 # Write to CSV
+                import pandas as pd
+
                 pd.DataFrame(match_data).to_csv(
                     file_path,
                     index=False
@@ -1,4 +1,5 @@
 """ICAO emissions calculator implementation."""
+import numpy as np
 
 
 class ICAOEmissionsCalculator:
@@ -182,6 +183,70 @@ class ICAOEmissionsCalculator:
         except Exception as e:
             raise ValueError(f"Error calculating emissions: {str(e)}")
 
+    def calculate_emissions_batch(self,
+                                  distance_km,
+                                  aircraft_type: str,
+                                  cabin_class: str = "business",
+                                  route_group: str = "INTRA_EUROPE",
+                                  passengers: int = 30,
+                                  cargo_tons: float = 2.0) -> dict:
+        """
+        Vectorized calculate_emissions over an array of distances.
+
+        Applies the same short-distance and ICAO formulas element-wise.
+
+        Returns:
+            Dictionary of arrays: emissions_total_kg, emissions_per_pax_kg,
+            fuel_consumption_kg and corrected_distance_km
+        """
+        distance_km = np.asarray(distance_km, dtype=float)
+        short = distance_km < 200
+
+        # Short-distance fuel scaling (< 200 km)
+        short_fuel = np.where(
+            distance_km < 100,
+            distance_km * 3.5,
+            distance_km * (3.5 + (distance_km - 100) * 0.02)
+        )
+
+        # ICAO methodology for everything else
+        corrected_distance = self._apply_gcd_correction_batch(distance_km)
+
+        route_factors = self.ROUTE_GROUPS.get(route_group, self.ROUTE_GROUPS["INTRA_EUROPE"])
+        pax_load_factor = route_factors["passenger_load_factor"]
+        pax_cargo_factor = route_factors["passenger_to_cargo_factor"]
+
+        cabin_info = self.CABIN_FACTORS[cabin_class.lower()]
+        surface = cabin_info["abreast_ratio"] * cabin_info["pitch"]
+        min_surface = self.CABIN_FACTORS["economy"]["abreast_ratio"] * self.CABIN_FACTORS["economy"]["pitch"]
+        yseat_factor = surface / min_surface if min_surface > 0 else 1.0
+
+        pax_mass = (passengers * self.PASSENGER_MASS +
+                    passengers * self.EQUIPMENT_MASS) / 1000
+        total_mass = pax_mass + cargo_tons
+        pax_allocation = pax_mass / total_mass if total_mass > 0 else 1.0
+
+        fuel_consumption = self._interpolate_fuel_consumption_batch(
+            aircraft_type,
+            corrected_distance / 1.852
+        )
+
+        total_seats = passengers / pax_load_factor if pax_load_factor > 0 else passengers
+        total_yseat = total_seats * yseat_factor
+        occupied_yseat = total_yseat * pax_load_factor
+
+        co2_per_pax = ((fuel_consumption * pax_cargo_factor * pax_allocation) /
+                       occupied_yseat) * yseat_factor * 3.16
+
+        emissions_total = np.where(short, short_fuel * 3.16, co2_per_pax * passengers)
+
+        return {
+            "emissions_total_kg": emissions_total,
+            "emissions_per_pax_kg": np.where(short, emissions_total / passengers, co2_per_pax),
+            "fuel_consumption_kg": np.where(short, short_fuel, fuel_consumption),
+            "corrected_distance_km": np.where(short, distance_km, corrected_distance)
+        }
+
     def _apply_gcd_correction(self, distance_km: float) -> float:
         """Apply ICAO GCD corrections based on distance."""
         for category in ["short", "medium", "long"]:
@@ -219,6 +284,27 @@ class ICAOEmissionsCalculator:
                 f1, f2 = fuel_table[d1], fuel_table[d2]
                 return f1 + (f2 - f1) * (distance_nm - d1) / (d2 - d1)
 
+    def _apply_gcd_correction_batch(self, distance_km: np.ndarray) -> np.ndarray:
+        """Vectorized _apply_gcd_correction."""
+        thresholds = np.array([self.GCD_CORRECTIONS[c]["threshold"] for c in ["short", "medium"]])
+        corrections = np.array([self.GCD_CORRECTIONS[c]["correction"] for c in ["short", "medium", "long"]])
+        return distance_km + corrections[np.searchsorted(thresholds, distance_km, side='left')]
+
+    def _interpolate_fuel_consumption_batch(self, aircraft: str, distance_nm: np.ndarray) -> np.ndarray:
+        """Vectorized _interpolate_fuel_consumption with the same clamping at the table ends."""
+        if aircraft not in self.FUEL_CONSUMPTION:
+            aircraft = "A320"  # Default to A320 if aircraft not found
+
+        fuel_table = self.FUEL_CONSUMPTION[aircraft]
+        distances = np.array(sorted(fuel_table.keys()), dtype=float)
+        fuels = np.array([fuel_table[d] for d in sorted(fuel_table.keys())], dtype=float)
+
+        clamped = np.clip(distance_nm, distances[0], distances[-1])
+        upper = np.clip(np.searchsorted(distances, clamped, side='left'), 1, len(distances) - 1)
+        d1, d2 = distances[upper - 1], distances[upper]
+        f1, f2 = fuels[upper - 1], fuels[upper]
+        return f1 + (f2 - f1) * (clamped - d1) / (d2 - d1)
+
     def get_route_group_factors(self, origin: str, destination: str) -> dict:
         """Get load factors for a specific route."""
         # Determine route group based on origin/destination
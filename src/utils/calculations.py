@@ -2,12 +2,15 @@ import math
 import sqlite3
 from typing import Dict, Optional
 
+import numpy as np
+
 from src.config.constants import (
     TRANSPORT_MODES,
-    DEFAULT_CARBON_PRICE, EU_ETS_PRICE, CARBON_PRICES_EUR, EUR_TO_GBP
+    DEFAULT_CARBON_PRICE
 )
 from src.data.team_data import get_airport_coordinates, get_team_airport, TEAM_COUNTRIES
 from src.models.icao_calculator import ICAOEmissionsCalculator
+from src.utils.carbon_pricing.price_table import get_price_table
 
 
 def calculate_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
@@ -26,6 +29,25 @@ def calculate_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> fl
     return R * c
 
 
+def calculate_distances(lat1, lon1, lat2, lon2) -> np.ndarray:
+    """Vectorized calculate_distance over arrays of coordinates (km)."""
+    R = 6371  # Earth's radius in kilometers
+
+    lat1, lon1 = np.asarray(lat1, dtype=float), np.asarray(lon1, dtype=float)
+    lat2, lon2 = np.asarray(lat2, dtype=float), np.asarray(lon2, dtype=float)
+
+    phi1, phi2 = np.radians(lat1), np.radians(lat2)
+    delta_phi = np.radians(lat2 - lat1)
+    delta_lambda = np.radians(lon2 - lon1)
+
+    a = (np.sin(delta_phi / 2) ** 2 +
+         np.cos(phi1) * np.cos(phi2) *
+         np.sin(delta_lambda / 2) ** 2)
+    c = 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+
+    return R * c
+
+
 def determine_mileage_type(distance_km: float) -> str:
     """Determine flight type based on distance."""
     if distance_km < 800:  # Changed from 500 miles
@@ -109,62 +131,64 @@ def get_carbon_price(away_team: str, home_team: str) -> float:
     Returns price in EUR or GBP for UK teams.
     """
     away_country = TEAM_COUNTRIES.get(away_team)
-    home_country = TEAM_COUNTRIES.get(home_team)
 
     if not away_country:
         return DEFAULT_CARBON_PRICE
 
-    # Get base price in EUR
-    price_eur = CARBON_PRICES_EUR.get(away_country, EU_ETS_PRICE)
+    # Away country's price (EU ETS when it has none), in GBP for UK home teams
+    table = get_price_table()
+    return float(table.team_price[table.country_id(away_country),
+                                  table.country_id(TEAM_COUNTRIES.get(home_team))])
+
+
+# EPA conversion factors: (operation, factor) applied to metric tons of CO2
+EQUIVALENCY_FACTORS = {
+    # Vehicle emissions
+    'gasoline_vehicles_year': ('divide', 0.233),  # Gasoline vehicles driven for one year
+    'electric_vehicles_year': ('divide', 0.883),  # Electric vehicles driven for one year
+    'gasoline_vehicle_miles': ('multiply', 2547),  # Miles driven by gasoline vehicle
+
+    # Fuel consumption
+    'gasoline_gallons': ('multiply', 113),  # Gallons of gasoline
+    'diesel_gallons': ('multiply', 98.2),  # Gallons of diesel
+    'propane_cylinders': ('multiply', 45.9),  # Propane cylinders for BBQ
+    'oil_barrels': ('multiply', 2.3),  # Barrels of oil
+
+    # Home energy use
+    'homes_energy_year': ('divide', 0.134),  # Homes' energy use for one year
+    'homes_electricity_year': ('divide', 0.208),  # Homes' electricity use for one year
+
+    # Industrial measures
+    'coal_pounds': ('multiply', 1111),  # Pounds of coal burned
+    'coal_railcars': ('multiply', 0.006),  # Railcars of coal
+    'tanker_trucks': ('multiply', 0.013),  # Tanker trucks of gasoline
 
-    # Convert to GBP if home team is from UK
-    if home_country == 'GB':
-        return price_eur * EUR_TO_GBP
+    # Waste and recycling
+    'waste_tons_recycled': ('multiply', 0.353),  # Tons of waste recycled vs landfilled
+    'garbage_trucks_recycled': ('multiply', 0.05),  # Garbage trucks of waste recycled
+    'trash_bags_recycled': ('multiply', 85),  # Trash bags of waste recycled
 
-    return price_eur
+    # Renewable energy
+    'wind_turbines_year': ('multiply', 0.0003),  # Wind turbines running for a year
+
+    # Carbon sequestration
+    'tree_seedlings_10years': ('multiply', 16.5),  # Tree seedlings grown for 10 years
+    'forest_acres_year': ('multiply', 1.0),  # Acres of U.S. forests in one year
+    'forest_preserved_acres': ('multiply', 0.006),  # Acres of U.S. forests preserved
+
+    # Electronic devices
+    'smartphones_charged': ('multiply', 80847)  # Number of smartphones charged
+}
 
 
 def calculate_equivalencies(emissions_mtco2: float) -> Dict[str, float]:
     """
     Calculate environmental equivalencies for given CO2 emissions in metric tons.
-    Based on EPA conversion factors.
+    Based on EPA conversion factors (see EQUIVALENCY_FACTORS).
     """
     return {
-        # Vehicle emissions
-        'gasoline_vehicles_year': emissions_mtco2 / 0.233,  # Gasoline vehicles driven for one year
-        'electric_vehicles_year': emissions_mtco2 / 0.883,  # Electric vehicles driven for one year
-        'gasoline_vehicle_miles': emissions_mtco2 * 2547,  # Miles driven by gasoline vehicle
-
-        # Fuel consumption
-        'gasoline_gallons': emissions_mtco2 * 113,  # Gallons of gasoline
-        'diesel_gallons': emissions_mtco2 * 98.2,  # Gallons of diesel
-        'propane_cylinders': emissions_mtco2 * 45.9,  # Propane cylinders for BBQ
-        'oil_barrels': emissions_mtco2 * 2.3,  # Barrels of oil
-
-        # Home energy use
-        'homes_energy_year': emissions_mtco2 / 0.134,  # Homes' energy use for one year
-        'homes_electricity_year': emissions_mtco2 / 0.208,  # Homes' electricity use for one year
-
-        # Industrial measures
-        'coal_pounds': emissions_mtco2 * 1111,  # Pounds of coal burned
-        'coal_railcars': emissions_mtco2 * 0.006,  # Railcars of coal
-        'tanker_trucks': emissions_mtco2 * 0.013,  # Tanker trucks of gasoline
-
-        # Waste and recycling
-        'waste_tons_recycled': emissions_mtco2 * 0.353,  # Tons of waste recycled vs landfilled
-        'garbage_trucks_recycled': emissions_mtco2 * 0.05,  # Garbage trucks of waste recycled
-        'trash_bags_recycled': emissions_mtco2 * 85,  # Trash bags of waste recycled
-
-        # Renewable energy
-        'wind_turbines_year': emissions_mtco2 * 0.0003,  # Wind turbines running for a year
-
-        # Carbon sequestration
-        'tree_seedlings_10years': emissions_mtco2 * 16.5,  # Tree seedlings grown for 10 years
-        'forest_acres_year': emissions_mtco2 * 1.0,  # Acres of U.S. forests in one year
-        'forest_preserved_acres': emissions_mtco2 * 0.006,  # Acres of U.S. forests preserved
-
-        # Electronic devices
-        'smartphones_charged': emissions_mtco2 * 80847  # Number of smartphones charged
+        name: emissions_mtco2 / factor if operation == 'divide' else emissions_mtco2 * factor
+        for name, (operation, factor) in EQUIVALENCY_FACTORS.items()
     }
 
 
@@ -209,6 +233,37 @@ def calculate_transit_time(distance_km: float) -> int:
     return max(calculated_time, MINIMUM_TRANSIT_TIME)
 
 
+# Speed bands (km/h) used by the time estimates: distances below edges[i] use speeds[i]
+DRIVING_SPEED_BANDS = (np.array([50, 100, 500]), np.array([40, 60, 80, 90]))
+TRANSIT_SPEED_BANDS = (np.array([50, 100]), np.array([30, 45, 60]))
+MAX_TRANSIT_DISTANCE_KM = 500
+
+
+def _banded_times(distance_km: np.ndarray, bands, minimum: int) -> np.ndarray:
+    """Look up the speed band for each distance and return truncated seconds."""
+    edges, speeds = bands
+    speed = speeds[np.searchsorted(edges, distance_km, side='right')]
+    seconds = np.trunc((distance_km / speed) * 3600)
+    return np.maximum(seconds, minimum)
+
+
+def calculate_driving_times(distance_km) -> np.ndarray:
+    """Vectorized calculate_driving_time, returning int64 seconds."""
+    distance_km = np.asarray(distance_km, dtype=float)
+    return _banded_times(distance_km, DRIVING_SPEED_BANDS, 30 * 60).astype(np.int64)
+
+
+def calculate_transit_times(distance_km) -> np.ndarray:
+    """
+    Vectorized calculate_transit_time.
+
+    Returns float seconds with NaN where the distance is beyond transit range.
+    """
+    distance_km = np.asarray(distance_km, dtype=float)
+    times = _banded_times(distance_km, TRANSIT_SPEED_BANDS, 45 * 60)
+    return np.where(distance_km > MAX_TRANSIT_DISTANCE_KM, np.nan, times)
+
+
 def format_time_duration(seconds: int) -> str:
     """
     Format seconds into hours and minutes string.
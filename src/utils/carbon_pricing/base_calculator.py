@@ -1,27 +1,35 @@
 # src/utils/carbon_pricing/base_calculator.py
+from src.config.constants import EEA_COUNTRIES
+from src.utils.carbon_pricing.price_table import get_price_table
+
 
 class CarbonPricingCalculator:
     """Base calculator for aviation carbon pricing schemes"""
 
     def __init__(self):
-        self.EU_ETS_PRICE = 88.0  # EUR/ton CO2 in 2024
         self.CORSIA_CREDIT_PRICE = 2.0  # EUR/ton CO2
 
-        self.EEA_COUNTRIES = {
-            'AT', 'BE', 'BG', 'HR', 'CY', 'CZ', 'DK', 'EE', 'FI', 'FR',
-            'DE', 'GR', 'HU', 'IS', 'IE', 'IT', 'LV', 'LI', 'LT', 'LU',
-            'MT', 'NL', 'NO', 'PL', 'PT', 'RO', 'SK', 'SI', 'ES', 'SE'
-        }
+        self.EEA_COUNTRIES = set(EEA_COUNTRIES)
 
         self.CORSIA_COUNTRIES = set()  # Add participating countries
 
+        # EEA coverage and the EU ETS price come from the shared price table
+        self.price_table = get_price_table()
+
+    @property
+    def EU_ETS_PRICE(self) -> float:
+        """Current EU ETS price in EUR/ton (read-only view of the price table)."""
+        return self.price_table.ets_price()
+
     def is_eea_flight(self, origin: str, destination: str) -> bool:
         """Check if flight is within EEA"""
-        return origin in self.EEA_COUNTRIES and destination in self.EEA_COUNTRIES
+        table = self.price_table
+        return bool(table.in_eea[table.country_id(origin)] and table.in_eea[table.country_id(destination)])
 
     def is_eea_connected(self, origin: str, destination: str) -> bool:
         """Check if flight connects to/from EEA"""
-        return origin in self.EEA_COUNTRIES or destination in self.EEA_COUNTRIES
+        table = self.price_table
+        return bool(table.in_eea[table.country_id(origin)] or table.in_eea[table.country_id(destination)])
 
     def is_corsia_flight(self, origin: str, destination: str) -> bool:
         """Check if flight is covered by CORSIA"""
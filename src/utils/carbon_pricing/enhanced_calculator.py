@@ -1,24 +1,19 @@
 # src/utils/carbon_pricing/enhanced_calculator.py
+from types import MappingProxyType
+
+import numpy as np
+
+from src.config.constants import EEA_COUNTRIES
+from src.utils.carbon_pricing.forecast import CarbonCostForecaster, ForecastScenario
+from src.utils.carbon_pricing.price_table import ETS_FLIGHT_TYPES, FLIGHT_TYPES, get_price_table
+
 
 class EnhancedCarbonPricingCalculator:
     """Enhanced calculator for aviation carbon pricing schemes"""
 
     def __init__(self):
-        # Constants for EU ETS
-        self.EU_ETS_PRICE = 88.46  # EUR/ton
-        self.EU_ETS_FORECAST = {
-            2024: 88.46,
-            2025: 95.0,
-            2026: 102.0,
-            2027: 110.0  # Extension to all departing flights
-        }
-
         # EEA Countries (EU + Iceland, Liechtenstein, Norway)
-        self.EEA_COUNTRIES = {
-            'AT', 'BE', 'BG', 'HR', 'CY', 'CZ', 'DK', 'EE', 'FI', 'FR',
-            'DE', 'GR', 'HU', 'IS', 'IE', 'IT', 'LV', 'LI', 'LT', 'LU',
-            'MT', 'NL', 'NO', 'PL', 'PT', 'RO', 'SK', 'SI', 'ES', 'SE'
-        }
+        self.EEA_COUNTRIES = set(EEA_COUNTRIES)
 
         # Flight Classification
         self.FLIGHT_CATEGORIES = {
@@ -29,33 +24,6 @@ class EnhancedCarbonPricingCalculator:
             'international': {'description': 'Between non-EEA countries'}
         }
 
-        # Carbon Pricing
-        self.CARBON_PRICES = {
-            'AL': 12.19,  # Albania
-            'AT': 45.00,  # Austria
-            'DK': 26.13,  # Denmark
-            'EE': 2.00,  # Estonia
-            'FI': 93.02,  # Finland
-            'FR': 44.60,  # France
-            'DE': 45.00,  # Germany
-            'HU': 36.00,  # Hungary
-            'IS': 33.95,  # Iceland
-            'IE': 56.00,  # Ireland
-            'LV': 15.00,  # Latvia
-            'LI': 122.87,  # Liechtenstein
-            'LU': 46.43,  # Luxembourg
-            'NL': 66.50,  # Netherlands
-            'NO': 99.01,  # Norway
-            'PL': 0.09,  # Poland
-            'PT': 56.25,  # Portugal
-            'SI': 17.30,  # Slovenia
-            'ES': 15.00,  # Spain
-            'SE': 118.35,  # Sweden
-            'CH': 122.87,  # Switzerland
-            'UA': 0.72,  # Ukraine
-            'GB': 21.04,  # United Kingdom
-        }
-
         # Fuel Parameters
         self.FUEL_PARAMS = {
             'conventional': {
@@ -69,17 +37,110 @@ class EnhancedCarbonPricingCalculator:
             }
         }
 
+        # Scheme coverage and prices are looked up in the shared price table
+        self.price_table = get_price_table()
+        self.FLIGHT_TYPES = FLIGHT_TYPES
+        self.ETS_CATEGORY_MASK = np.array([flight_type in ETS_FLIGHT_TYPES for flight_type in FLIGHT_TYPES])
+
+    # Prices are read-only views of the shared price table, never copies
+
+    @property
+    def EU_ETS_PRICE(self) -> float:
+        """Current EU ETS price in EUR/ton."""
+        return self.price_table.ets_price()
+
+    @property
+    def EU_ETS_FORECAST(self):
+        """Read-only {year: EU ETS price in EUR/ton}."""
+        return MappingProxyType(dict(zip(self.price_table.years, self.price_table.ets_prices.tolist())))
+
+    @property
+    def CARBON_PRICES(self):
+        """Read-only {country: national carbon tax in EUR/ton}."""
+        return self.price_table.national_prices
+
     def classify_flight(self, origin: str, destination: str) -> str:
         """Determine flight category based on origin and destination"""
         if origin == destination:
             return 'domestic'
-        elif origin in self.EEA_COUNTRIES and destination in self.EEA_COUNTRIES:
-            return 'intra_eea'
-        elif origin in self.EEA_COUNTRIES:
-            return 'eea_outbound'
-        elif destination in self.EEA_COUNTRIES:
-            return 'eea_inbound'
-        return 'international'
+        table = self.price_table
+        return FLIGHT_TYPES[table.category[table.country_id(origin), table.country_id(destination)]]
+
+    def classify_flights(self, origins, destinations) -> np.ndarray:
+        """
+        Vectorized classify_flight.
+
+        Returns:
+            Array of indices into FLIGHT_TYPES
+        """
+        origins = np.asarray(origins, dtype=object)
+        destinations = np.asarray(destinations, dtype=object)
+        categories = self.price_table.category[
+            self.price_table.country_ids(origins), self.price_table.country_ids(destinations)]
+        return np.where(origins == destinations, FLIGHT_TYPES.index('domestic'), categories)
+
+    def calculate_carbon_costs_batch(self, origins, destinations, emissions, fuel_usage, year: int = 2024) -> dict:
+        """
+        Columnar calculate_carbon_costs (current costs only) for many flights.
+
+        Args:
+            origins: Origin country codes
+            destinations: Destination country codes
+            emissions: Total CO2 emissions in metric tons per flight
+            fuel_usage: Total fuel usage in liters per flight
+            year: Price table year (2024 gives current costs); years after the
+                last forecast year use its prices, earlier years raise ValueError
+
+        Returns:
+            Dictionary of arrays: flight_type, eu_ets, national, fuel,
+            conventional_volume, conventional_cost, conventional_emissions,
+            saf_volume, saf_cost, saf_emissions and total
+        """
+        emissions = np.asarray(emissions, dtype=float)
+        fuel_usage = np.asarray(fuel_usage, dtype=float)
+        origins = np.asarray(origins, dtype=object)
+        destinations = np.asarray(destinations, dtype=object)
+        table = self.price_table
+        origin_ids = table.country_ids(origins)
+        destination_ids = table.country_ids(destinations)
+        year_id = table.year_id(year)
+
+        # Same-country pairs are domestic; the table already prices them without EU ETS
+        flight_types = np.where(origins == destinations, FLIGHT_TYPES.index('domestic'),
+                                table.category[origin_ids, destination_ids])
+
+        # SAF blend split
+        blend = self.FUEL_PARAMS['saf']['blend_requirement']
+        saf_volume = fuel_usage * blend
+        conv_volume = fuel_usage * (1 - blend)
+        conv_cost = conv_volume * self.FUEL_PARAMS['conventional']['price']
+        saf_cost = saf_volume * self.FUEL_PARAMS['saf']['price']
+
+        # Proportional emissions; flights without fuel carry none
+        has_fuel = fuel_usage > 0
+        safe_fuel = np.where(has_fuel, fuel_usage, 1.0)
+        saf_emissions = np.where(has_fuel, emissions * (saf_volume / safe_fuel), 0.0)
+        conv_emissions = np.where(has_fuel, emissions * (conv_volume / safe_fuel), 0.0)
+
+        ets_price = table.eu_ets[origin_ids, destination_ids, year_id]
+        origin_tax = table.national[origin_ids, destination_ids, year_id]
+        eu_ets = np.where(ets_price > 0, emissions * ets_price, 0.0)
+        national = np.where(origin_tax > 0, emissions * origin_tax, 0.0)
+        fuel = conv_cost + saf_cost
+
+        return {
+            'flight_type': np.array(FLIGHT_TYPES, dtype=object)[flight_types],
+            'eu_ets': eu_ets,
+            'national': national,
+            'fuel': fuel,
+            'conventional_volume': conv_volume,
+            'conventional_cost': conv_cost,
+            'conventional_emissions': conv_emissions,
+            'saf_volume': saf_volume,
+            'saf_cost': saf_cost,
+            'saf_emissions': saf_emissions,
+            'total': eu_ets + national + fuel
+        }
 
     def calculate_carbon_costs(self,
                                origin: str,
@@ -139,13 +200,18 @@ class EnhancedCarbonPricingCalculator:
             }
         }
 
+        # Current scheme prices from the shared price table
+        table = self.price_table
+        origin_id = table.country_id(origin)
+        ets_price = float(table.eu_ets[origin_id, table.country_id(destination), table.year_id(2024)])
+
         # Calculate EU ETS costs
-        if flight_type in ['intra_eea', 'eea_outbound']:
-            results['current_costs']['eu_ets'] = emissions * self.EU_ETS_PRICE
+        if ets_price > 0:
+            results['current_costs']['eu_ets'] = emissions * ets_price
             results['applicable_schemes'].append('EU ETS')
 
         # Calculate national carbon costs
-        origin_tax = self.CARBON_PRICES.get(origin, 0)
+        origin_tax = float(table.national_price[origin_id])
         if origin_tax > 0:
             results['current_costs']['national'] = emissions * origin_tax
             results['applicable_schemes'].append(f'{origin} National Carbon Tax')
@@ -166,37 +232,51 @@ class EnhancedCarbonPricingCalculator:
 
         return results
 
-    def _generate_forecast(self, emissions: float, fuel_usage: float, flight_type: str) -> dict:
-        """Generate cost forecasts for next three years"""
-        forecast = {}
-        base_year = 2024
+    def default_scenario(self, name: str = 'Base Case') -> ForecastScenario:
+        """Forecast scenario built from the calculator's current prices and EU ETS path"""
+        return ForecastScenario(
+            name=name,
+            ets_base_price=self.price_table.ets_price(),
+            ets_prices=dict(self.EU_ETS_FORECAST),
+            saf_blend=self.FUEL_PARAMS['saf']['blend_requirement'],
+            conventional_price=self.FUEL_PARAMS['conventional']['price'],
+            saf_price=self.FUEL_PARAMS['saf']['price']
+        )
 
-        for year in range(base_year, base_year + 3):
-            # Adjust EU ETS price
-            ets_price = self.EU_ETS_FORECAST.get(year, self.EU_ETS_FORECAST[base_year])
+    def forecast_batch(self, origins, destinations, emissions, fuel_usage,
+                       scenarios=None, base_year: int = 2024, years: int = 3) -> dict:
+        """
+        Cost forecast tensors (flights × years × scenarios) for many flights.
 
-            # Increase SAF blend requirement
-            saf_requirement = self.FUEL_PARAMS['saf']['blend_requirement'] * (1.25 ** (year - base_year))
+        Args:
+            origins: Origin country codes
+            destinations: Destination country codes
+            emissions: Total CO2 emissions in metric tons per flight
+            fuel_usage: Total fuel usage in liters per flight
+            scenarios: ForecastScenario list (defaults to default_scenario())
+            base_year: First forecast year
+            years: Number of forecast years
+        """
+        forecaster = CarbonCostForecaster(scenarios or [self.default_scenario()], base_year, years)
+        ets_applies = self.ETS_CATEGORY_MASK[self.classify_flights(origins, destinations)]
+        return forecaster.forecast(emissions, fuel_usage, ets_applies)
 
-            # Calculate costs with future parameters
-            conv_fuel = fuel_usage * (1 - saf_requirement)
-            saf_fuel = fuel_usage * saf_requirement
+    def _generate_forecast(self, emissions: float, fuel_usage: float, flight_type: str) -> dict:
+        """Generate cost forecasts for next three years"""
+        forecaster = CarbonCostForecaster([self.default_scenario()], base_year=2024, years=3)
+        tensors = forecaster.forecast(emissions, fuel_usage, flight_type in ['intra_eea', 'eea_outbound'])
 
+        forecast = {}
+        for i, year in enumerate(forecaster.calendar_years):
             forecast[year] = {
-                'eu_ets_price': ets_price,
-                'saf_requirement': saf_requirement,
-                'conventional_fuel_cost': conv_fuel * self.FUEL_PARAMS['conventional']['price'] * 1.05 ** (
-                            year - base_year),
-                'saf_fuel_cost': saf_fuel * self.FUEL_PARAMS['saf']['price'] * 1.03 ** (year - base_year),
-                'carbon_cost': emissions * ets_price if flight_type in ['intra_eea', 'eea_outbound'] else 0
+                'eu_ets_price': float(tensors['eu_ets_price'][i, 0]),
+                'saf_requirement': float(tensors['saf_requirement'][i, 0]),
+                'conventional_fuel_cost': float(tensors['conventional_fuel_cost'][0, i, 0]),
+                'saf_fuel_cost': float(tensors['saf_fuel_cost'][0, i, 0]),
+                'carbon_cost': float(tensors['carbon_cost'][0, i, 0]),
+                'total_cost': float(tensors['total_cost'][0, i, 0])
             }
 
-            forecast[year]['total_cost'] = (
-                    forecast[year]['conventional_fuel_cost'] +
-                    forecast[year]['saf_fuel_cost'] +
-                    forecast[year]['carbon_cost']
-            )
-
         return forecast
 
     def get_pricing_explanation(self, origin: str, destination: str) -> str:
@@ -210,7 +290,7 @@ class EnhancedCarbonPricingCalculator:
         if flight_type in ['intra_eea', 'eea_outbound']:
             explanations.append(f"EU ETS Applies: €{self.EU_ETS_PRICE}/ton CO2")
 
-        origin_tax = self.CARBON_PRICES.get(origin)
+        origin_tax = self.price_table.national_tax(origin)
         if origin_tax:
             explanations.append(f"National Carbon Tax ({origin}): €{origin_tax}/ton CO2")
 
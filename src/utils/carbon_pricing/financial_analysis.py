@@ -0,0 +1,129 @@
+# src/utils/carbon_pricing/financial_analysis.py
+"""Closed-form NPV and SAF break-even analysis, vectorized across scenarios and fixtures."""
+from typing import TYPE_CHECKING, Dict
+
+import numpy as np
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# CO2 per litre burned, in metric tons (same factors as the fuel optimization tab)
+CONVENTIONAL_EMISSION_FACTOR = 3.16 / 1000
+SAF_EMISSION_FACTOR = 0.80 / 1000
+
+
+def npv_geometric(base_cost, growth, discount_rate, years: int) -> np.ndarray:
+    """
+    Present value of a cost growing at a constant rate, paid at years 0..years-1.
+
+    Uses the geometric series sum(C * q**t) = C * (1 - q**n) / (1 - q) with
+    q = (1 + growth) / (1 + discount_rate). All arguments broadcast, so one
+    call covers every scenario and fixture.
+    """
+    base_cost = np.asarray(base_cost, dtype=float)
+    ratio = (1 + np.asarray(growth, dtype=float)) / (1 + np.asarray(discount_rate, dtype=float))
+
+    # q == 1 is the flat case: n equal payments
+    flat = np.isclose(ratio, 1.0)
+    safe_ratio = np.where(flat, 0.0, ratio)
+    series = np.where(flat, float(years), (1 - safe_ratio ** years) / (1 - safe_ratio))
+    return base_cost * series
+
+
+def npv_components(base_costs: Dict[str, float],
+                   growth_rates: Dict[str, float],
+                   discount_rate,
+                   years: int) -> np.ndarray:
+    """
+    NPV of several independently growing cost components.
+
+    Args:
+        base_costs: {component: base-year cost}; values may be arrays of fixtures
+        growth_rates: {component: annual growth}; values may be arrays of scenarios
+        discount_rate: Annual discount rate
+        years: Number of years, starting at the base year
+    """
+    return sum(npv_geometric(base_costs[component], growth_rates[component], discount_rate, years)
+               for component in base_costs)
+
+
+def _price_gap(t, saf_price, conventional_price, saf_growth, conventional_growth,
+               carbon_price, carbon_growth):
+    """SAF minus conventional cost per litre, carbon included, at (fractional) year t."""
+    carbon = carbon_price * (1 + carbon_growth) ** t
+    return (saf_price * (1 + saf_growth) ** t + SAF_EMISSION_FACTOR * carbon -
+            conventional_price * (1 + conventional_growth) ** t - CONVENTIONAL_EMISSION_FACTOR * carbon)
+
+
+def solve_break_even(saf_price, conventional_price, saf_growth, conventional_growth,
+                     carbon_price=0.0, carbon_growth=0.0, horizon: int = 30,
+                     tolerance: float = 1e-6) -> dict:
+    """
+    Find when SAF becomes cheaper than conventional fuel.
+
+    Each cost per litre is the fuel price growing at its own rate plus the
+    carbon price times the fuel's emission factor. The integer years
+    0..horizon-1 are scanned in one vectorized pass to bracket the first
+    crossing, which is then refined by bisection. All arguments broadcast.
+
+    Returns:
+        Dictionary of arrays: 'year' (first whole year with SAF strictly
+        cheaper, -1 if none within the horizon), 'crossing' (fractional year
+        where the costs meet, NaN if none) and 'saf_cost' (SAF cost per litre
+        in the break-even year, NaN if none)
+    """
+    args = np.broadcast_arrays(*(np.asarray(value, dtype=float) for value in (
+        saf_price, conventional_price, saf_growth, conventional_growth, carbon_price, carbon_growth)))
+    args = [arg[..., None] for arg in args]
+
+    years = np.arange(horizon, dtype=float)
+    gaps = _price_gap(years, *args)
+    cheaper = gaps < 0
+    found = cheaper.any(axis=-1)
+    first_year = np.where(found, cheaper.argmax(axis=-1), -1)
+
+    # Bracket the crossing between the year before and the break-even year
+    args = [arg[..., 0] for arg in args]
+    high = np.maximum(first_year, 0).astype(float)
+    low = np.maximum(high - 1, 0)
+    for _ in range(int(np.ceil(np.log2(1 / tolerance)))):
+        mid = (low + high) / 2
+        below = _price_gap(mid, *args) < 0
+        high = np.where(below, mid, high)
+        low = np.where(below, low, mid)
+
+    crossing = np.where(found, high, np.nan)
+    saf_cost = np.where(
+        found,
+        args[0] * (1 + args[2]) ** np.maximum(first_year, 0) +
+        SAF_EMISSION_FACTOR * args[4] * (1 + args[5]) ** np.maximum(first_year, 0),
+        np.nan
+    )
+    return {'year': first_year, 'crossing': crossing, 'saf_cost': saf_cost}
+
+
+def rank_break_even(fixtures: 'pd.DataFrame', saf_price: float, conventional_price: float,
+                    saf_growth: float, conventional_growth: float, carbon_growth: float = 0.0,
+                    horizon: int = 30) -> 'pd.DataFrame':
+    """
+    Rank fixtures by how soon SAF breaks even on their route.
+
+    Args:
+        fixtures: DataFrame with a 'carbon_price' column (EUR/ton applying to the flight)
+        saf_price, conventional_price: Base-year fuel prices in EUR/L
+        saf_growth, conventional_growth, carbon_growth: Annual growth rates
+        horizon: Number of years searched
+
+    Returns:
+        Copy of fixtures with break_even_year, break_even_crossing and
+        break_even_saf_cost columns, earliest break-even first and fixtures
+        that never break even last
+    """
+    result = solve_break_even(saf_price, conventional_price, saf_growth, conventional_growth,
+                              fixtures['carbon_price'].to_numpy(dtype=float), carbon_growth, horizon)
+
+    ranked = fixtures.copy()
+    ranked['break_even_year'] = result['year']
+    ranked['break_even_crossing'] = result['crossing']
+    ranked['break_even_saf_cost'] = result['saf_cost']
+    return ranked.sort_values('break_even_crossing', na_position='last', kind='stable')
@@ -0,0 +1,125 @@
+# src/utils/carbon_pricing/forecast.py
+"""Matrix-form multi-year carbon and fuel cost forecasts."""
+from dataclasses import dataclass, field
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+
+@dataclass
+class ForecastScenario:
+    """Price and policy assumptions for one forecast scenario."""
+    name: str
+    ets_base_price: float = 88.46  # EUR/ton in the base year
+    ets_growth: float = 0.0  # Annual growth applied where ets_prices has no entry
+    ets_prices: Dict[int, float] = field(default_factory=dict)  # Explicit {year: EUR/ton} path
+    saf_blend: float = 0.02  # Base-year SAF blend requirement
+    saf_blend_growth: float = 0.25  # Annual multiplicative growth of the blend requirement
+    conventional_price: float = 1.20  # EUR/L for Jet A-1
+    conventional_escalation: float = 0.05
+    saf_price: float = 2.50  # EUR/L for SAF
+    saf_escalation: float = 0.03
+
+
+def growth_factors(rates: Sequence[float], years: int) -> np.ndarray:
+    """(years, len(rates)) matrix of compound growth factors (1 + rate) ** year."""
+    offsets = np.arange(years)[:, None]
+    return (1 + np.asarray(rates, dtype=float))[None, :] ** offsets
+
+
+def project_components(base_costs: Dict[str, float],
+                       scenario_rates: Dict[str, Dict[str, float]],
+                       years: int) -> Dict[str, np.ndarray]:
+    """
+    Grow base cost components under several growth scenarios.
+
+    Args:
+        base_costs: {component: base-year cost}; values may be arrays of flights
+        scenario_rates: {scenario: {component: annual growth rate}}
+        years: Number of years to project, starting at the base year
+
+    Returns:
+        {component: (flights, years, scenarios) array} plus a 'total' entry
+        summing the components in the order given
+    """
+    projections = {}
+    for component, base in base_costs.items():
+        factors = growth_factors([rates[component] for rates in scenario_rates.values()], years)
+        base = np.atleast_1d(np.asarray(base, dtype=float))
+        projections[component] = base[:, None, None] * factors[None, :, :]
+
+    total = None
+    for projection in projections.values():
+        total = projection if total is None else total + projection
+    projections['total'] = total
+    return projections
+
+
+class CarbonCostForecaster:
+    """Forecasts fuel and carbon costs for many flights under many scenarios at once."""
+
+    def __init__(self, scenarios: List[ForecastScenario], base_year: int = 2024, years: int = 3):
+        """
+        Args:
+            scenarios: Scenarios forming the last tensor axis
+            base_year: First forecast year
+            years: Number of forecast years
+        """
+        self.scenarios = scenarios
+        self.base_year = base_year
+        self.years = years
+
+    @property
+    def calendar_years(self) -> List[int]:
+        return list(range(self.base_year, self.base_year + self.years))
+
+    def ets_price_paths(self) -> np.ndarray:
+        """(years, scenarios) EU ETS prices; explicit path entries override the grown base price."""
+        grown = np.array([s.ets_base_price for s in self.scenarios]) * \
+            growth_factors([s.ets_growth for s in self.scenarios], self.years)
+        explicit = np.array([[s.ets_prices.get(year, np.nan) for s in self.scenarios]
+                             for year in self.calendar_years]).reshape(self.years, len(self.scenarios))
+        return np.where(np.isnan(explicit), grown, explicit)
+
+    def forecast(self, emissions, fuel_usage, ets_applies=None) -> Dict[str, np.ndarray]:
+        """
+        Build the (flights × years × scenarios) cost tensors.
+
+        Args:
+            emissions: CO2 emissions in metric tons per flight
+            fuel_usage: Fuel usage in liters per flight
+            ets_applies: Boolean per flight, True where EU ETS is charged (default all)
+
+        Returns:
+            Dictionary with (years, scenarios) 'eu_ets_price' and 'saf_requirement'
+            paths and (flights, years, scenarios) 'conventional_fuel_cost',
+            'saf_fuel_cost', 'carbon_cost' and 'total_cost' tensors
+        """
+        emissions = np.atleast_1d(np.asarray(emissions, dtype=float))[:, None, None]
+        fuel_usage = np.atleast_1d(np.asarray(fuel_usage, dtype=float))[:, None, None]
+        if ets_applies is None:
+            ets_applies = np.ones(emissions.shape[0], dtype=bool)
+        ets_applies = np.atleast_1d(np.asarray(ets_applies, dtype=bool))[:, None, None]
+
+        scenarios = self.scenarios
+        offsets = np.arange(self.years)[:, None]
+        ets_price = self.ets_price_paths()
+        saf_requirement = np.array([s.saf_blend for s in scenarios]) * \
+            np.array([1 + s.saf_blend_growth for s in scenarios]) ** offsets
+        conventional_escalation = np.array([1 + s.conventional_escalation for s in scenarios]) ** offsets
+        saf_escalation = np.array([1 + s.saf_escalation for s in scenarios]) ** offsets
+        conventional_price = np.array([s.conventional_price for s in scenarios])
+        saf_price = np.array([s.saf_price for s in scenarios])
+
+        conventional_fuel_cost = fuel_usage * (1 - saf_requirement) * conventional_price * conventional_escalation
+        saf_fuel_cost = fuel_usage * saf_requirement * saf_price * saf_escalation
+        carbon_cost = np.where(ets_applies, emissions * ets_price, 0.0)
+
+        return {
+            'eu_ets_price': ets_price,
+            'saf_requirement': saf_requirement,
+            'conventional_fuel_cost': conventional_fuel_cost,
+            'saf_fuel_cost': saf_fuel_cost,
+            'carbon_cost': carbon_cost,
+            'total_cost': conventional_fuel_cost + saf_fuel_cost + carbon_cost
+        }
@@ -0,0 +1,110 @@
+# src/utils/carbon_pricing/price_table.py
+"""Precomputed carbon prices indexed by (origin country, destination country, year)."""
+from functools import lru_cache
+from types import MappingProxyType
+
+import numpy as np
+
+from src.config.constants import (
+    CARBON_PRICES_EUR, EEA_COUNTRIES, EU_ETS_FORECAST, EU_ETS_PRICE, EUR_TO_GBP
+)
+from src.data.team_data import TEAM_COUNTRIES
+
+# Flight categories, in CATEGORY order
+FLIGHT_TYPES = ['domestic', 'intra_eea', 'eea_outbound', 'eea_inbound', 'international']
+
+# Categories charged under the EU ETS
+ETS_FLIGHT_TYPES = ['intra_eea', 'eea_outbound']
+
+
+class CarbonPriceTable:
+    """
+    Dense carbon price tensors shared by every pricing path.
+
+    Countries are numbered once; any code the table does not know maps to a
+    trailing "unknown" slot (non-EEA, no national tax). Lookups are plain
+    array indexing. Years after the last forecast year are priced at that
+    year's prices; years before the first raise ValueError.
+
+    Attributes:
+        category: (origin, destination) index into FLIGHT_TYPES for different-country pairs
+        eu_ets: (origin, destination, year) EU ETS price in EUR/ton, 0 where not covered
+        national: (origin, destination, year) origin country's carbon tax in EUR/ton
+        national_prices: read-only {country: national tax in EUR/ton}
+        ets_prices: EU ETS price in EUR/ton per table year
+        total: eu_ets + national
+        team_price: (away, home) price charged on a match, in GBP when the home team is British
+    """
+
+    def __init__(self):
+        self.countries = sorted(EEA_COUNTRIES | set(CARBON_PRICES_EUR) | set(TEAM_COUNTRIES.values()))
+        self.country_index = {code: i for i, code in enumerate(self.countries)}
+        self.unknown = len(self.countries)
+        self.years = sorted(EU_ETS_FORECAST)
+        self.year_index = {year: i for i, year in enumerate(self.years)}
+
+        # Scheme coverage
+        self.in_eea = np.array([code in EEA_COUNTRIES for code in self.countries] + [False])
+        origin_eea = self.in_eea[:, None]
+        destination_eea = self.in_eea[None, :]
+        self.category = np.select(
+            [origin_eea & destination_eea, origin_eea, destination_eea],
+            [FLIGHT_TYPES.index('intra_eea'), FLIGHT_TYPES.index('eea_outbound'), FLIGHT_TYPES.index('eea_inbound')],
+            default=FLIGHT_TYPES.index('international')
+        ).astype(np.int8)
+        ets_covered = np.isin(self.category, [FLIGHT_TYPES.index(t) for t in ETS_FLIGHT_TYPES])
+        # Same-country pairs are domestic, which the EU ETS does not charge here
+        np.fill_diagonal(ets_covered[:-1, :-1], False)
+
+        # Price tensors
+        n = len(self.countries) + 1
+        self.ets_prices = np.array([EU_ETS_FORECAST[year] for year in self.years])
+        self.national_price = np.array([CARBON_PRICES_EUR.get(code, 0) for code in self.countries] + [0], dtype=float)
+        # Read-only {country: national tax} for the countries that levy one
+        self.national_prices = MappingProxyType(
+            {code: float(self.national_price[i]) for i, code in enumerate(self.countries) if code in CARBON_PRICES_EUR})
+        self.eu_ets = np.where(ets_covered[:, :, None], self.ets_prices[None, None, :], 0.0)
+        self.national = np.broadcast_to(self.national_price[:, None, None], (n, n, len(self.years)))
+        self.total = self.eu_ets + self.national
+
+        # Match pricing: away country's tax (EU ETS when it has none), converted to GBP for British hosts
+        away_price = np.array([CARBON_PRICES_EUR.get(code, EU_ETS_PRICE) for code in self.countries] +
+                              [EU_ETS_PRICE], dtype=float)
+        gbp_host = np.array([code == 'GB' for code in self.countries] + [False])
+        self.team_price = np.where(gbp_host[None, :], away_price[:, None] * EUR_TO_GBP, away_price[:, None])
+
+    def country_id(self, code) -> int:
+        """Table index of a country code."""
+        return self.country_index.get(code, self.unknown)
+
+    def country_ids(self, codes) -> np.ndarray:
+        """Table indices of an array of country codes."""
+        # A season has thousands of flights but only a few dozen distinct codes
+        unique_codes, inverse = np.unique(np.asarray(codes, dtype=str), return_inverse=True)
+        unique_ids = np.array([self.country_id(code) for code in unique_codes], dtype=np.intp)
+        return unique_ids[inverse.reshape(-1)]
+
+    def year_id(self, year: int) -> int:
+        """Table index of a year, clamped to the last forecast year."""
+        if year < self.years[0]:
+            raise ValueError(f"No carbon prices before {self.years[0]}; the table covers "
+                             f"{self.years[0]}-{self.years[-1]} and later years use {self.years[-1]} prices")
+        return self.year_index[min(int(year), self.years[-1])]
+
+    def ets_price(self, year: int = None) -> float:
+        """EU ETS price in EUR/ton for a year (the first table year by default)."""
+        return float(self.ets_prices[0 if year is None else self.year_id(year)])
+
+    def national_tax(self, country) -> float:
+        """A country's national carbon tax in EUR/ton, 0 where it has none."""
+        return float(self.national_price[self.country_id(country)])
+
+    def price(self, origin: str, destination: str, year: int) -> float:
+        """Total EUR/ton carbon price (EU ETS + national) for a flight in a given year."""
+        return float(self.total[self.country_id(origin), self.country_id(destination), self.year_id(year)])
+
+
+@lru_cache(maxsize=None)
+def get_price_table() -> CarbonPriceTable:
+    """Shared CarbonPriceTable, built on first use."""
+    return CarbonPriceTable()
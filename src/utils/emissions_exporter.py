@@ -0,0 +1,105 @@
+# src/utils/emissions_exporter.py
+import os
+import sqlite3
+from typing import List, Optional
+
+import pandas as pd
+
+from src.data.team_data import TEAM_COUNTRIES
+
+
+def _require_pyarrow():
+    """Import pyarrow lazily; it is only needed for Parquet exports."""
+    try:
+        import pyarrow as pa
+        import pyarrow.dataset as ds
+    except ImportError:
+        raise ImportError("Parquet export requires pyarrow: pip install pyarrow")
+    return pa, ds
+
+
+class EmissionsExporter:
+    """Columnar Parquet export of match_emissions for analysis notebooks."""
+
+    def __init__(self, db_path: Optional[str] = None):
+        # Get project root directory
+        self.project_root = os.path.abspath(os.path.join(
+            os.path.dirname(__file__),
+            "..",
+            ".."
+        ))
+        self.db_path = db_path or os.path.join(self.project_root, "data", "routes.db")
+        self.default_output_dir = os.path.join(self.project_root, "data", "match_emissions_parquet")
+
+    def read_match_emissions(self) -> pd.DataFrame:
+        """Read match_emissions joined with the route's competition and both teams' countries."""
+        with sqlite3.connect(self.db_path) as conn:
+            route_columns = [row[1] for row in conn.execute("PRAGMA table_info(routes)")]
+            # Competition is added to routes by update_database.py
+            competition = "COALESCE(r.Competition, 'Unknown')" if 'Competition' in route_columns else "'Unknown'"
+
+            df = pd.read_sql_query(f"""
+                SELECT m.*, {competition} AS competition
+                FROM match_emissions m
+                LEFT JOIN routes r
+                    ON r.home_team = m.home_team AND r.away_team = m.away_team
+                ORDER BY m.id
+            """, conn)
+
+        df['home_country'] = df['home_team'].map(TEAM_COUNTRIES)
+        df['away_country'] = df['away_team'].map(TEAM_COUNTRIES)
+        return df
+
+    def export_parquet(self, output_dir: Optional[str] = None) -> str:
+        """
+        Write match_emissions to a Parquet dataset partitioned by competition.
+
+        Files are laid out as competition=<name>/part-0.parquet with column
+        statistics (min/max/null count) so readers can skip row groups.
+        Partitions present in the new export are replaced.
+
+        Returns:
+            Path of the dataset directory
+        """
+        pa, ds = _require_pyarrow()
+        output_dir = output_dir or self.default_output_dir
+
+        df = self.read_match_emissions()
+        table = pa.Table.from_pandas(df, preserve_index=False)
+
+        file_format = ds.ParquetFileFormat()
+        ds.write_dataset(
+            table,
+            output_dir,
+            format=file_format,
+            file_options=file_format.make_write_options(write_statistics=True, compression='snappy'),
+            partitioning=ds.partitioning(pa.schema([('competition', pa.string())]), flavor='hive'),
+            existing_data_behavior='delete_matching',
+            basename_template='part-{i}.parquet'
+        )
+
+        print(f"Exported {len(df)} matches in {df['competition'].nunique()} competitions to: {output_dir}")
+        return output_dir
+
+    def load_parquet(self,
+                     columns: Optional[List[str]] = None,
+                     competitions: Optional[List[str]] = None,
+                     output_dir: Optional[str] = None) -> pd.DataFrame:
+        """
+        Load an exported dataset, reading only the requested columns and partitions.
+
+        Args:
+            columns: Columns to read (all columns when omitted)
+            competitions: Competition partitions to read (all when omitted)
+            output_dir: Dataset directory written by export_parquet
+        """
+        _, ds = _require_pyarrow()
+        dataset = ds.dataset(output_dir or self.default_output_dir, format='parquet', partitioning='hive')
+
+        # Filtering on the partition key prunes whole directories before any file is opened
+        partition_filter = ds.field('competition').isin(competitions) if competitions else None
+        return dataset.to_table(columns=columns, filter=partition_filter).to_pandas()
+
+
+if __name__ == "__main__":
+    EmissionsExporter().export_parquet()
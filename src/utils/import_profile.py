@@ -0,0 +1,144 @@
+# src/utils/import_profile.py
+"""Import-time profile and cold-start budget check for the application entry points."""
+import argparse
+import ast
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+# Cold-start budget per entry point: time to run its top-level imports, in ms
+COLD_START_BUDGET_MS = {
+    'app.py': 750,
+    'main.py': 250
+}
+
+# Modules an entry point must only import on first use (inside the cached
+# factories); the check fails when they load with its top-level imports.
+# PIL and numpy are not listed for app.py: streamlit imports them itself.
+DEFERRED_MODULES = {
+    'app.py': (
+        'src.data.world_snapshot',
+        'src.models.emissions',
+        'src.utils.carbon_pricing.enhanced_calculator',
+        'src.utils.logo_manager',
+        'src.utils.logo_store'
+    )
+}
+
+
+def entry_point_imports(script: str) -> str:
+    """Top-level import statements of a script, as source (the script itself is not run)."""
+    with open(os.path.join(PROJECT_ROOT, script), encoding='utf-8') as f:
+        tree = ast.parse(f.read())
+    return "\n".join(ast.unparse(node) for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom)))
+
+
+def profile_imports(code: str) -> List[Tuple[str, int, float, float]]:
+    """
+    Run code in a fresh interpreter under -X importtime.
+
+    Returns:
+        (module, depth, self ms, cumulative ms) per imported module, in the
+        order the interpreter reports them (children before their parent)
+    """
+    env = dict(os.environ, PYTHONPATH=PROJECT_ROOT)
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        cwd=PROJECT_ROOT, env=env, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        # Names are indented one space at the top level and two more per nesting level
+        depth = (len(name) - len(name.lstrip()) + 1) // 2
+        rows.append((name.strip(), depth, int(self_us) / 1000, int(cumulative_us) / 1000))
+    return rows
+
+
+def package_times(rows) -> Dict[str, float]:
+    """Self time summed per top-level package, in ms, slowest first."""
+    totals = {}
+    for module, _, self_ms, _ in rows:
+        package = module.split('.')[0]
+        totals[package] = totals.get(package, 0.0) + self_ms
+    return dict(sorted(totals.items(), key=lambda item: -item[1]))
+
+
+def profile_entry_point(script: str, repeat: int = 3) -> dict:
+    """
+    Profile an entry point's imports several times; keep the median run.
+
+    Returns:
+        Dictionary with 'total_ms', 'budget_ms', 'packages' {package: ms},
+        'imports' {direct import: cumulative ms} and 'eager_deferred' (the
+        DEFERRED_MODULES the imports loaded)
+    """
+    code = entry_point_imports(script)
+    # Modules the bare interpreter loads anyway (site, encodings, ...) are not the script's cost
+    startup = {module for module, _, _, _ in profile_imports('pass')}
+    runs = [[row for row in profile_imports(code) if row[0] not in startup] for _ in range(repeat)]
+    totals = [sum(cumulative for _, depth, _, cumulative in rows if depth == 1) for rows in runs]
+    median = statistics.median(totals)
+    rows = runs[totals.index(min(totals, key=lambda total: abs(total - median)))]
+    deferred = DEFERRED_MODULES.get(script, ())
+    eager_deferred = sorted({module for module, _, _, _ in rows
+                             if any(module == name or module.startswith(name + '.') for name in deferred)})
+
+    return {
+        'script': script,
+        'total_ms': median,
+        'budget_ms': COLD_START_BUDGET_MS.get(script),
+        'packages': package_times(rows),
+        'imports': {module: cumulative for module, depth, _, cumulative in rows if depth == 1},
+        'eager_deferred': eager_deferred
+    }
+
+
+def print_report(profile: dict, top: int = 15) -> None:
+    """Print an import-time report: direct imports and the slowest packages."""
+    budget = profile['budget_ms']
+    status = "" if budget is None else f" (budget {budget:.0f} ms: {'OK' if profile['total_ms'] <= budget else 'OVER'})"
+    print(f"\n{profile['script']}: {profile['total_ms']:.0f} ms{status}")
+    for module in profile['eager_deferred']:
+        print(f"  Imported eagerly, should load on first use: {module}")
+
+    print("  Direct imports (cumulative ms):")
+    for module, ms in sorted(profile['imports'].items(), key=lambda item: -item[1])[:top]:
+        print(f"    {module:<50} {ms:>8.1f}")
+
+    print("  Packages (self ms):")
+    for package, ms in list(profile['packages'].items())[:top]:
+        print(f"    {package:<50} {ms:>8.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import-time profile of the application entry points")
+    parser.add_argument('scripts', nargs='*', default=list(COLD_START_BUDGET_MS),
+                        help="Entry point scripts relative to the project root")
+    parser.add_argument('--repeat', type=int, default=3, help="Runs per entry point (median is reported)")
+    parser.add_argument('--top', type=int, default=15, help="Rows per table")
+    args = parser.parse_args()
+
+    failed = False
+    for script in args.scripts:
+        profile = profile_entry_point(script, args.repeat)
+        print_report(profile, args.top)
+        if profile['budget_ms'] is not None and profile['total_ms'] > profile['budget_ms']:
+            failed = True
+        if profile['eager_deferred']:
+            failed = True
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,44 +1,32 @@
+import os
+
 import streamlit as st
 from PIL import Image
 
+from src.data.team_data import get_all_teams
+from src.utils.logo_store import get_logo_store
+
+# Logo width on match cards, served from a sprite sheet
+SPRITE_WIDTH = 32
+
 
 # In logo_manager.py
 
 @st.cache_data
 def get_resized_logo(_logo_path: str, team_name: str, width: int = 100) -> Image.Image:
     """Get resized logo image with team-specific caching."""
-
     try:
-
-        # Create a cache key from the combination of path and team name
-
-        base_url = "https://raw.githubusercontent.com/samali323/carbonemissioncalc/master/logos/"
-
-        full_url = base_url + _logo_path
-
-        response = requests.get(full_url)
-
-        img = Image.open(BytesIO(response.content))
-
-        aspect_ratio = img.height / img.width
-
-        height = int(width * aspect_ratio)
-
-        return img.resize((width, height))
-
+        store = get_logo_store()
+        source = store.resolve(_logo_path)
+        if source is None:
+            print(f"No logo file for {team_name}: {_logo_path}")
+            return None
+        return store.load_thumbnail(source, width)
     except Exception as e:
-
         print(f"Error processing logo for {team_name}: {str(e)}")
-
         return None
 
 
-import requests
-from PIL import Image
-from io import BytesIO
-import streamlit as st
-
-
 class FootballLogoManager:
     def __init__(self):
         # Initialize logo mapping
@@ -278,11 +266,11 @@ class FootballLogoManager:
 
             # Other European Teams
 
-            'Celtic': 'Other%20European%20Teams/Celtic.png',
+            'Celtic': 'Other%20European%20Teams/Celtic%20FC.png',
 
-            'Hearts': 'Other%20European%20Teams/Heart%20of%20Midlothian.png',
+            'Hearts': 'Other%20European%20Teams/Heart%20of%20Midlothian%20FC.png',
 
-            'Rangers': 'Other%20European%20Teams/Rangers.png',
+            'Rangers': 'Other%20European%20Teams/Rangers%20FC.png',
 
             'Besiktas': 'Other%20European%20Teams/Besiktas%20JK.png',
 
@@ -290,15 +278,15 @@ class FootballLogoManager:
 
             'Galatasaray': 'Other%20European%20Teams/Galatasaray.png',
 
-            'Istanbul Basaksehir': 'Other%20European%20Teams/Istanbul%20Basaksehir.png',
+            'Istanbul Basaksehir': 'Other%20European%20Teams/Basaksehir%20FK.png',
 
             'Olympiacos': 'Other%20European%20Teams/Olympiacos%20Piraeus.png',
 
             'PAOK': 'Other%20European%20Teams/PAOK%20Thessaloniki.png',
 
-            'Panathinaikos': 'Other%20European%20Teams/Panathinaikos.png',
+            'Panathinaikos': 'Other%20European%20Teams/Panathinaikos%20FC.png',
 
-            'Red Bull Salzburg': 'Other%20European%20Teams/Red%20Bull%20Salzburg.png',
+            'Red Bull Salzburg': 'Austria%20-%20Bundesliga/Red%20Bull%20Salzburg.png',
 
             'Shakhtar Donetsk': 'Other%20European%20Teams/Shakhtar%20Donetsk.png',
 
@@ -308,7 +296,7 @@ class FootballLogoManager:
 
             'Copenhagen': 'Other%20European%20Teams/FC%20Copenhagen.png',
 
-            'Malmo FF': 'Other%20European%20Teams/Malmo%20FF.png',
+            'Malmo FF': 'Other%20European%20Teams/Malm%C3%B6%20FF.png',
 
             'Slavia Prague': 'Other%20European%20Teams/SK%20Slavia%20Prague.png',
 
@@ -320,34 +308,84 @@ class FootballLogoManager:
 
     @st.cache_data
     def get_logo_image(_self, team_name: str, logo_path: str, width: int = 80):
-        """Cached function to get and process the logo image."""
+        """Cached function to get the logo thumbnail from the local logo store."""
         try:
-            base_url = "https://raw.githubusercontent.com/samali323/carbonemissioncalc/master/logos/"
-            full_url = base_url + logo_path
-
-            response = requests.get(full_url)
-            if response.status_code == 200:
-                img = Image.open(BytesIO(response.content))
-                aspect_ratio = img.height / img.width
-                height = int(width * aspect_ratio)
-                return img.resize((width, height))
-            return None
+            store = get_logo_store()
+            source = store.resolve(logo_path)
+            if source is None:
+                return None
+            return store.load_thumbnail(source, width)
         except Exception as e:
             print(f"Error loading logo for {team_name}: {str(e)}")
             return None
 
+    def logo_source(self, team_name: str):
+        """Logo file for a team, or None."""
+        store = get_logo_store()
+        logo_path = self.logo_mapping.get(team_name)
+        return store.resolve(logo_path) if logo_path else store.find(team_name)
+
     def get_logo(self, team_name: str, width: int = 80):
         """Get team logo."""
         try:
-            # Check if team exists in mapping
-            if team_name in self.logo_mapping:
-                logo_path = self.logo_mapping[team_name]
-                return self.get_logo_image(team_name, logo_path, width)
-            return None
+            # Check if team exists in mapping, else look for a file named after the team
+            logo_path = self.logo_mapping.get(team_name)
+            if logo_path is None:
+                source = get_logo_store().find(team_name)
+                if source is None:
+                    return None
+                logo_path = os.path.relpath(source, get_logo_store().logo_dir)
+            return self.get_logo_image(team_name, logo_path, width)
         except Exception as e:
             print(f"Error getting logo for {team_name}: {str(e)}")
             return None
 
+    def get_logo_atlas(self, teams=None, width: int = SPRITE_WIDTH) -> dict:
+        """Sprite sheet index for the given teams (default: all teams), built if needed."""
+        sources = {}
+        missing = []
+        for team in teams if teams is not None else get_all_teams():
+            source = self.logo_source(team)
+            if source:
+                sources[team] = source
+            else:
+                missing.append(team)
+        if missing:
+            print(f"No logo for {len(missing)} of {len(sources) + len(missing)} teams: {', '.join(sorted(missing))}")
+        return get_logo_store().load_atlas(sources, width)
+
+    def get_logo_sprites(self, teams=None, width: int = SPRITE_WIDTH):
+        """
+        Sprite sheet CSS and a {team: HTML} map of logo elements.
+
+        The CSS references the sheet by its static URL, so the browser fetches
+        and caches it once instead of receiving it on every rerun; each logo
+        is an element showing its slice of the sheet.
+        """
+        try:
+            atlas = self.get_logo_atlas(teams, width)
+        except Exception as e:
+            print(f"Error building logo sprites: {str(e)}")
+            return "", {}
+
+        css = f"""
+            <style>
+            .logo-sprite {{
+                display: inline-block;
+                vertical-align: middle;
+                margin: 0 8px;
+                background-image: url({atlas['url']});
+                background-repeat: no-repeat;
+            }}
+            </style>
+        """
+        sprites = {
+            team: (f'<span class="logo-sprite" style="width: {w}px; height: {h}px; '
+                   f'background-position: -{x}px -{y}px;"></span>')
+            for team, (x, y, w, h) in atlas['logos'].items()
+        }
+        return css, sprites
+
     def display_match_logos(self, home_team: str, away_team: str, width: int = 80):
         """Display match logos in columns with team names."""
         col1, col2, col3 = st.columns([2, 1, 2])
@@ -403,3 +441,9 @@ class FootballLogoManager:
                 if away_logo:
                     st.image(away_logo)
                 st.markdown(f"<p style='text-align: center;'>{away_team}</p>", unsafe_allow_html=True)
+
+
+if __name__ == "__main__":
+    # Build the match card sprite sheet, e.g. while building the container image
+    atlas = FootballLogoManager().get_logo_atlas()
+    print(f"Sprite sheet with {len(atlas['logos'])} team logos: {atlas['image']}")
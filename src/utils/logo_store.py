@@ -0,0 +1,193 @@
+# src/utils/logo_store.py
+"""Team logos served from the local logos/ tree, with cached pre-resized thumbnails."""
+import glob
+import hashlib
+import json
+import os
+import sys
+import unicodedata
+from functools import lru_cache
+from typing import Dict, Optional
+from urllib.parse import unquote
+
+from PIL import Image
+
+LOGO_DIR = 'logos'
+THUMBNAIL_DIR = 'data/logo_thumbnails'
+
+# Sprite sheets go to the app's static directory, which Streamlit serves at
+# app/static/ (server.enableStaticServing in .streamlit/config.toml)
+STATIC_DIR = 'static'
+STATIC_URL = 'app/static'
+
+# Widths the pages render logos at
+THUMBNAIL_WIDTHS = (60, 80, 100)
+
+# Width of a sprite sheet in pixels
+ATLAS_ROW_WIDTH = 1024
+
+
+def _normalize(path: str) -> str:
+    """Lookup key independent of path separators and Unicode form ('é' vs 'e' + accent)."""
+    return unicodedata.normalize('NFC', path.replace(os.sep, '/')).casefold()
+
+
+class LogoStore:
+    """
+    Resolves logos on disk and serves resized thumbnails without network access.
+
+    Thumbnails are written to thumbnail_dir as <sha1 of source>_<width>.png,
+    so replacing a logo file produces new thumbnails and the old ones are
+    simply never read again.
+    """
+
+    def __init__(self, logo_dir: str = LOGO_DIR, thumbnail_dir: str = THUMBNAIL_DIR, static_dir: str = STATIC_DIR):
+        self.logo_dir = logo_dir
+        self.thumbnail_dir = thumbnail_dir
+        self.static_dir = static_dir
+        self._digests = {}
+
+        # Index the tree once: relative path -> file, file name -> file
+        self.files = {}
+        self.names = {}
+        for root, _, names in sorted(os.walk(logo_dir)):
+            for name in sorted(names):
+                if name.lower().endswith('.png'):
+                    path = os.path.join(root, name)
+                    self.files[_normalize(os.path.relpath(path, logo_dir))] = path
+                    self.names.setdefault(_normalize(os.path.splitext(name)[0]), path)
+
+    def resolve(self, logo_path: str) -> Optional[str]:
+        """File for a path relative to the logo directory (URL-encoded paths accepted)."""
+        return self.files.get(_normalize(unquote(logo_path)))
+
+    def find(self, team_name: str) -> Optional[str]:
+        """File whose name matches the team name, for teams without a mapping entry."""
+        return self.names.get(_normalize(team_name))
+
+    def _digest(self, source: str) -> str:
+        """Content hash of a logo file, recomputed only when the file changes."""
+        stat = os.stat(source)
+        key = (source, stat.st_mtime_ns, stat.st_size)
+        if key not in self._digests:
+            with open(source, 'rb') as f:
+                self._digests[key] = hashlib.sha1(f.read()).hexdigest()
+        return self._digests[key]
+
+    def thumbnail_path(self, source: str, width: int) -> str:
+        """Cached thumbnail of a logo file at a given width, generated on first use."""
+        path = os.path.join(self.thumbnail_dir, f"{self._digest(source)}_{width}.png")
+        if not os.path.exists(path):
+            with Image.open(source) as img:
+                aspect_ratio = img.height / img.width
+                thumbnail = img.resize((width, int(width * aspect_ratio)))
+
+            # Write then rename, so concurrent sessions never read a partial file
+            os.makedirs(self.thumbnail_dir, exist_ok=True)
+            temp_path = f"{path}.{os.getpid()}.tmp"
+            thumbnail.save(temp_path, format='PNG')
+            os.replace(temp_path, path)
+        return path
+
+    def load_thumbnail(self, source: str, width: int) -> Image.Image:
+        """Thumbnail of a logo file as a PIL image."""
+        with Image.open(self.thumbnail_path(source, width)) as img:
+            return img.copy()
+
+    def build_thumbnails(self, widths=THUMBNAIL_WIDTHS) -> int:
+        """Pre-generate thumbnails of every logo at the given widths; returns the number of logos."""
+        for source in self.files.values():
+            for width in widths:
+                self.thumbnail_path(source, width)
+        return len(self.files)
+
+    def _atlas_version(self, sources: Dict[str, str], width: int) -> str:
+        """Hash of everything an atlas is built from: keys, logo contents and width."""
+        content = json.dumps([width, sorted((key, self._digest(source)) for key, source in sources.items())])
+        return hashlib.sha1(content.encode('utf-8')).hexdigest()
+
+    def build_atlas(self, sources: Dict[str, str], width: int) -> dict:
+        """
+        Pack thumbnails of several logos into one sprite sheet.
+
+        Identical logos share one slot. The sheet is written to the static
+        directory as logo_atlas_<width>_<version>.png, so its URL changes
+        whenever its content does and browsers can cache it; the index is
+        written to atlas_<width>.json in the thumbnail directory.
+
+        Args:
+            sources: {key: logo file}, e.g. team name -> file
+            width: Thumbnail width in pixels
+
+        Returns:
+            Index with 'image' (sheet file), 'url' (its static URL), 'version',
+            the sheet 'size' and 'logos' {key: [x, y, width, height]}
+        """
+        digests = {key: self._digest(source) for key, source in sources.items()}
+        thumbnails = {}
+        for key, source in sources.items():
+            if digests[key] not in thumbnails:
+                thumbnails[digests[key]] = self.load_thumbnail(source, width).convert('RGBA')
+
+        # Shelf packing: tallest first, left to right, a new row when one fills up
+        slots = {}
+        x = y = row_height = 0
+        for digest, thumbnail in sorted(thumbnails.items(), key=lambda item: -item[1].height):
+            if x + thumbnail.width > ATLAS_ROW_WIDTH:
+                x, y, row_height = 0, y + row_height, 0
+            slots[digest] = [x, y, thumbnail.width, thumbnail.height]
+            x += thumbnail.width
+            row_height = max(row_height, thumbnail.height)
+
+        sheet = Image.new('RGBA', (ATLAS_ROW_WIDTH if y else max(x, 1), max(y + row_height, 1)))
+        for digest, (left, top, _, _) in slots.items():
+            sheet.paste(thumbnails[digest], (left, top))
+
+        version = self._atlas_version(sources, width)
+        image_name = f"logo_atlas_{width}_{version[:16]}.png"
+        image_path = os.path.join(self.static_dir, image_name)
+        os.makedirs(self.static_dir, exist_ok=True)
+        sheet.save(image_path, format='PNG', optimize=True)
+        # Sheets of earlier versions are never referenced again
+        for old_path in glob.glob(os.path.join(self.static_dir, f"logo_atlas_{width}_*.png")):
+            if old_path != image_path:
+                os.remove(old_path)
+
+        os.makedirs(self.thumbnail_dir, exist_ok=True)
+        index = {
+            'image': image_path,
+            'url': f"{STATIC_URL}/{image_name}",
+            'version': version,
+            'size': list(sheet.size),
+            'logos': {key: slots[digests[key]] for key in sources}
+        }
+        with open(os.path.join(self.thumbnail_dir, f"atlas_{width}.json"), 'w', encoding='utf-8') as f:
+            json.dump(index, f, ensure_ascii=False)
+        return index
+
+    def load_atlas(self, sources: Dict[str, str], width: int) -> dict:
+        """Index of the sprite sheet for these logos, rebuilt when missing or out of date."""
+        index_path = os.path.join(self.thumbnail_dir, f"atlas_{width}.json")
+        try:
+            with open(index_path, encoding='utf-8') as f:
+                index = json.load(f)
+            if (index['version'] == self._atlas_version(sources, width) and 'url' in index
+                    and os.path.exists(index['image'])):
+                return index
+        except (OSError, ValueError, KeyError):
+            pass
+        return self.build_atlas(sources, width)
+
+
+@lru_cache(maxsize=None)
+def get_logo_store() -> LogoStore:
+    """Shared LogoStore over the default directories."""
+    return LogoStore()
+
+
+if __name__ == "__main__":
+    # Pre-generate thumbnails, e.g. while building the container image
+    widths = [int(width) for width in sys.argv[1:]] or THUMBNAIL_WIDTHS
+    count = get_logo_store().build_thumbnails(widths)
+    print(f"Thumbnails for {count} logos at widths {', '.join(map(str, widths))} "
+          f"in {get_logo_store().thumbnail_dir}")
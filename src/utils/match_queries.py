@@ -0,0 +1,115 @@
+# src/utils/match_queries.py
+"""SQL-side aggregates and listings over routes and match_emissions for the Streamlit pages."""
+import sqlite3
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# match_emissions stores one-way flights (one row per route); the summary reports round trips
+COMPETITION_SUMMARY_SQL = """
+    SELECT
+        r.Competition AS "Competition",
+        COUNT(*) AS "Matches",
+        COUNT(m.id) AS "Matches With Emissions",
+        TOTAL(m.distance_km) AS "Total Distance (km)",
+        2 * TOTAL(m.total_emissions) AS "Total Emissions (tons)"
+    FROM routes r
+    LEFT JOIN match_emissions m
+        ON m.home_team = r.home_team AND m.away_team = r.away_team
+    WHERE r.Competition IS NOT NULL
+    GROUP BY r.Competition
+    ORDER BY r.Competition
+"""
+
+
+def competition_summary(conn: sqlite3.Connection) -> 'pd.DataFrame':
+    """
+    Matches, distance and round-trip emissions per competition.
+
+    Aggregated in SQLite from match_emissions, so the figures are as fresh as
+    the last emissions_processor.py run. Totals cover the matches that have an
+    emissions row and averages are taken over those matches only, so routes
+    added since the last run do not pull the averages down; compare
+    "Matches With Emissions" with "Matches" for coverage.
+    """
+    import pandas as pd
+
+    summary = pd.read_sql_query(COMPETITION_SUMMARY_SQL, conn)
+    # Competitions without any emissions rows have no average (NaN)
+    covered = summary['Matches With Emissions'].where(summary['Matches With Emissions'] > 0)
+    summary['Avg Distance (km)'] = summary['Total Distance (km)'] / covered
+    summary['Avg Emissions (tons)'] = summary['Total Emissions (tons)'] / covered
+    return summary
+
+
+def ensure_match_indexes(conn: sqlite3.Connection) -> None:
+    """
+    Create the indexes behind the filtered match listing.
+
+    Home-team filters use UNIQUE(home_team, away_team) and away-team filters
+    use idx_routes_away_team; the competition filter gets its own index.
+    """
+    # route_reader pulls in pandas, which the pages only need for listings
+    from src.utils.route_reader import ensure_team_indexes
+
+    ensure_team_indexes(conn)
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_routes_competition
+        ON routes (Competition, home_team, away_team)
+    """)
+    conn.commit()
+
+
+def _match_filters(competition=None, home_team=None, away_team=None):
+    """WHERE clause and parameters for the listing filters (None means no filter)."""
+    clauses, params = [], []
+    for column, value in (('Competition', competition), ('home_team', home_team), ('away_team', away_team)):
+        if value is not None:
+            clauses.append(f"{column} = ?")
+            params.append(value)
+    return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+
+def count_matches(conn: sqlite3.Connection, competition=None, home_team=None, away_team=None) -> int:
+    """Number of matches passing the filters, counted from an index."""
+    where, params = _match_filters(competition, home_team, away_team)
+    return conn.execute(f"SELECT COUNT(*) FROM routes{where}", params).fetchone()[0]
+
+
+def list_matches(conn: sqlite3.Connection, competition=None, home_team=None, away_team=None,
+                 limit: int = 20, offset: int = 0) -> 'pd.DataFrame':
+    """One page of matches passing the filters, in route order."""
+    import pandas as pd
+
+    where, params = _match_filters(competition, home_team, away_team)
+    return pd.read_sql_query(f"""
+        SELECT
+            id,
+            home_team AS "Home Team",
+            away_team AS "Away Team",
+            Competition AS "Competition"
+        FROM routes{where}
+        ORDER BY id
+        LIMIT ? OFFSET ?
+    """, conn, params=params + [limit, offset])
+
+
+def list_competitions(conn: sqlite3.Connection) -> list:
+    """Sorted competition names."""
+    return [row[0] for row in conn.execute(
+        "SELECT DISTINCT Competition FROM routes WHERE Competition IS NOT NULL ORDER BY Competition")]
+
+
+def list_home_teams(conn: sqlite3.Connection, competition=None) -> list:
+    """Sorted home teams, optionally within one competition."""
+    where, params = _match_filters(competition=competition)
+    return [row[0] for row in conn.execute(
+        f"SELECT DISTINCT home_team FROM routes{where} ORDER BY home_team", params)]
+
+
+def list_away_teams(conn: sqlite3.Connection, home_team=None) -> list:
+    """Sorted away teams, optionally only those visiting one home team."""
+    where, params = _match_filters(home_team=home_team)
+    return [row[0] for row in conn.execute(
+        f"SELECT DISTINCT away_team FROM routes{where} ORDER BY away_team", params)]
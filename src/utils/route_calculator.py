@@ -3,9 +3,10 @@ import pandas as pd
 import sqlite3
 import time
 import os
-from googlemaps import Client
 from typing import Dict, Tuple, Optional
 from src.data.team_data import get_team_airport, get_airport_coordinates
+from src.utils.route_reader import ensure_team_indexes
+from src.utils.route_scheduler import MAX_ROUTE_AGE_DAYS, ensure_freshness_column, epoch_now
 
 
 class RouteCalculator:
@@ -14,6 +15,9 @@ class RouteCalculator:
         Initialize the RouteCalculator with Google Maps API key and database connection.
         Database will be stored in the project root's data directory.
         """
+        # googlemaps is only needed when routes are (re)calculated
+        from googlemaps import Client
+
         self.api_key = " "
         self.gmaps = Client(key=self.api_key)
 
@@ -43,10 +47,13 @@ class RouteCalculator:
                     transit_duration INTEGER,
                     transit_distance INTEGER,
                     last_updated TIMESTAMP,
+                    updated_epoch INTEGER,
                     UNIQUE(home_team, away_team)
                 )
             """)
             conn.commit()
+            ensure_freshness_column(conn)
+            ensure_team_indexes(conn)
 
     def get_cached_route(self, home_team: str, away_team: str) -> Optional[Dict]:
         """Get route information from the database cache."""
@@ -57,8 +64,8 @@ class RouteCalculator:
                        transit_duration, transit_distance, last_updated
                 FROM routes
                 WHERE home_team = ? AND away_team = ?
-                AND last_updated > datetime('now', '-30 days')
-            """, (home_team, away_team))
+                AND updated_epoch > ?
+            """, (home_team, away_team, epoch_now() - MAX_ROUTE_AGE_DAYS * 86400))
 
             result = cursor.fetchone()
             if result:
@@ -112,15 +119,24 @@ class RouteCalculator:
         """Save route information to database."""
         with sqlite3.connect(self.db_path) as conn:
             cursor = conn.cursor()
+            # Upsert so refreshing an existing route keeps its id and Competition
             cursor.execute("""
-                INSERT OR REPLACE INTO routes 
+                INSERT INTO routes 
                 (home_team, away_team, driving_duration, driving_distance,
-                 transit_duration, transit_distance, last_updated)
-                VALUES (?, ?, ?, ?, ?, ?, datetime('now'))
+                 transit_duration, transit_distance, last_updated, updated_epoch)
+                VALUES (?, ?, ?, ?, ?, ?, datetime('now'), ?)
+                ON CONFLICT(home_team, away_team) DO UPDATE SET
+                    driving_duration = excluded.driving_duration,
+                    driving_distance = excluded.driving_distance,
+                    transit_duration = excluded.transit_duration,
+                    transit_distance = excluded.transit_distance,
+                    last_updated = excluded.last_updated,
+                    updated_epoch = excluded.updated_epoch
             """, (
                 home_team, away_team,
                 route_info['driving_duration'], route_info['driving_distance'],
-                route_info['transit_duration'], route_info['transit_distance']
+                route_info['transit_duration'], route_info['transit_distance'],
+                epoch_now()
             ))
             conn.commit()
 
@@ -160,6 +176,32 @@ class RouteCalculator:
             }
         return None
 
+    def refresh_route(self, home_team: str, away_team: str) -> bool:
+        """Fetch route information for a match and store it, ignoring the cache."""
+        # Get airport codes
+        home_airport = get_team_airport(home_team)
+        away_airport = get_team_airport(away_team)
+
+        if not home_airport or not away_airport:
+            print(f"Missing airport data for {home_team} vs {away_team}")
+            return False
+
+        # Get coordinates
+        home_coords = get_airport_coordinates(home_airport)
+        away_coords = get_airport_coordinates(away_airport)
+
+        if not home_coords or not away_coords:
+            print(f"Missing coordinate data for {home_airport} or {away_airport}")
+            return False
+
+        # Fetch new route info
+        route_info = self.fetch_route_info(home_coords, away_coords)
+        if not route_info:
+            return False
+
+        self.save_route_info(home_team, away_team, route_info)
+        return True
+
     def process_matches(self, matches_df: pd.DataFrame,
                         delay: int = 1,
                         batch_size: int = 40):
@@ -174,26 +216,7 @@ class RouteCalculator:
             if cached_route:
                 continue
 
-            # Get airport codes
-            home_airport = get_team_airport(home_team)
-            away_airport = get_team_airport(away_team)
-
-            if not home_airport or not away_airport:
-                print(f"Missing airport data for {home_team} vs {away_team}")
-                continue
-
-            # Get coordinates
-            home_coords = get_airport_coordinates(home_airport)
-            away_coords = get_airport_coordinates(away_airport)
-
-            if not home_coords or not away_coords:
-                print(f"Missing coordinate data for {home_airport} or {away_airport}")
-                continue
-
-            # Fetch new route info
-            route_info = self.fetch_route_info(home_coords, away_coords)
-            if route_info:
-                self.save_route_info(home_team, away_team, route_info)
+            if self.refresh_route(home_team, away_team):
                 processed += 1
                 print(f"Processed {home_team} vs {away_team}")
 
@@ -1,8 +1,14 @@
 import sqlite3
 import os
+import sys
 from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
 from src.data.team_data import get_team_airport, get_airport_coordinates
-from src.utils.calculations import calculate_distance, calculate_driving_time, calculate_transit_time
+from src.utils.calculations import calculate_distances, calculate_driving_times, calculate_transit_times
+from src.utils.route_scheduler import ensure_freshness_column, epoch_now
 
 
 class RouteFixer:
@@ -15,80 +21,76 @@ class RouteFixer:
         ))
         self.db_path = os.path.join(self.project_root, "data", "routes.db")
 
-    def fix_route_times(self) -> None:
-        """Update route times in the SQLite database."""
+    def fix_route_times(self, dry_run: bool = False) -> pd.DataFrame:
+        """
+        Update route times in the SQLite database.
+
+        Candidate rows are corrected in one vectorized pass and written back
+        with a single executemany inside one transaction.
+
+        Args:
+            dry_run: Report the changes without writing them
+
+        Returns:
+            DataFrame with the old and new values of every corrected route
+        """
         print("Starting database update...")
         print(f"Using database at: {self.db_path}")
 
         conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
 
         try:
+            ensure_freshness_column(conn)
+
             # Get all routes that need fixing
-            cursor.execute("""
+            routes_df = pd.read_sql_query("""
                 SELECT home_team, away_team, driving_duration, transit_duration, driving_distance
                 FROM routes 
                 WHERE driving_duration <= 300  -- 5 minutes in seconds
                 OR transit_duration <= 600     -- 10 minutes in seconds
                 OR driving_duration IS NULL 
                 OR transit_duration IS NULL
-            """)
-            routes_to_fix = cursor.fetchall()
-
-            print(f"Found {len(routes_to_fix)} routes to fix")
-            fixed_count = 0
-
-            for home_team, away_team, driving_duration, transit_duration, driving_distance in routes_to_fix:
-                # Get airport codes
-                home_airport = get_team_airport(home_team)
-                away_airport = get_team_airport(away_team)
-
-                if home_airport and away_airport:
-                    # Get coordinates
-                    home_coords = get_airport_coordinates(home_airport)
-                    away_coords = get_airport_coordinates(away_airport)
-
-                    if home_coords and away_coords:
-                        # Calculate distance in meters
-                        distance_km = calculate_distance(
-                            home_coords['lat'], home_coords['lon'],
-                            away_coords['lat'], away_coords['lon']
-                        )
-                        distance_meters = int(distance_km * 1000)
-
-                        # Calculate durations with minimums
-                        new_driving_duration = max(1800, calculate_driving_time(distance_km))  # Minimum 30 minutes
-                        new_transit_duration = transit_duration
-                        if distance_km <= 500:  # Only set transit time if within range
-                            new_transit_duration = max(2700, calculate_transit_time(distance_km))  # Minimum 45 minutes
-
-                        # Update the database
-                        cursor.execute("""
-                            UPDATE routes 
-                            SET driving_duration = ?,
-                                transit_duration = ?,
-                                driving_distance = ?,
-                                transit_distance = ?,
-                                last_updated = ?
-                            WHERE home_team = ? AND away_team = ?
-                        """, (
-                            new_driving_duration,
-                            new_transit_duration,
-                            distance_meters,
-                            distance_meters,
-                            datetime.now().strftime('%m/%d/%Y %H:%M'),
-                            home_team,
-                            away_team
-                        ))
-
-                        fixed_count += 1
-                        if fixed_count % 100 == 0:
-                            print(f"Fixed {fixed_count} routes...")
-                            conn.commit()
-
-            # Final commit
+            """, conn)
+
+            print(f"Found {len(routes_df)} routes to fix")
+
+            diff = self._compute_fixes(routes_df)
+
+            if dry_run:
+                self._print_diff(diff)
+                print(f"Dry run: {len(diff)} routes would be fixed")
+                return diff
+
+            updated_at = datetime.now().strftime('%m/%d/%Y %H:%M')
+            updated_epoch = epoch_now()
+            params = [
+                (
+                    int(row.new_driving_duration),
+                    None if pd.isna(row.new_transit_duration) else int(row.new_transit_duration),
+                    int(row.new_driving_distance),
+                    int(row.new_driving_distance),
+                    updated_at,
+                    updated_epoch,
+                    row.home_team,
+                    row.away_team
+                )
+                for row in diff.itertuples(index=False)
+            ]
+
+            # Single transaction for the whole batch
+            conn.executemany("""
+                UPDATE routes 
+                SET driving_duration = ?,
+                    transit_duration = ?,
+                    driving_distance = ?,
+                    transit_distance = ?,
+                    last_updated = ?,
+                    updated_epoch = ?
+                WHERE home_team = ? AND away_team = ?
+            """, params)
             conn.commit()
-            print(f"Successfully fixed {fixed_count} routes")
+            print(f"Successfully fixed {len(params)} routes")
+            return diff
 
         except Exception as e:
             print(f"Error updating database: {str(e)}")
@@ -98,6 +100,52 @@ class RouteFixer:
         finally:
             conn.close()
 
+    @staticmethod
+    def _compute_fixes(routes_df: pd.DataFrame) -> pd.DataFrame:
+        """Compute corrected distances and durations for all candidate rows at once."""
+        # Resolve team -> airport -> coordinates once per distinct team
+        teams = pd.unique(routes_df[['home_team', 'away_team']].values.ravel())
+        coords = {}
+        for team in teams:
+            airport = get_team_airport(team)
+            airport_coords = get_airport_coordinates(airport) if airport else None
+            if airport_coords:
+                coords[team] = (airport_coords['lat'], airport_coords['lon'])
+
+        # Skip routes where either side has no airport or coordinates
+        resolvable = routes_df['home_team'].isin(coords) & routes_df['away_team'].isin(coords)
+        routes_df = routes_df[resolvable].reset_index(drop=True)
+
+        home = np.array([coords[t] for t in routes_df['home_team']], dtype=float).reshape(-1, 2)
+        away = np.array([coords[t] for t in routes_df['away_team']], dtype=float).reshape(-1, 2)
+
+        distance_km = calculate_distances(home[:, 0], home[:, 1], away[:, 0], away[:, 1])
+
+        # Transit time is only replaced for routes within transit range
+        new_transit = calculate_transit_times(distance_km)
+        old_transit = routes_df['transit_duration'].to_numpy(dtype=float)
+        new_transit = np.where(np.isnan(new_transit), old_transit, new_transit)
+
+        return pd.DataFrame({
+            'home_team': routes_df['home_team'],
+            'away_team': routes_df['away_team'],
+            'old_driving_duration': routes_df['driving_duration'],
+            'new_driving_duration': calculate_driving_times(distance_km),
+            'old_transit_duration': routes_df['transit_duration'],
+            'new_transit_duration': new_transit,
+            'old_driving_distance': routes_df['driving_distance'],
+            'new_driving_distance': (distance_km * 1000).astype(np.int64),
+        })
+
+    @staticmethod
+    def _print_diff(diff: pd.DataFrame) -> None:
+        """Print the route changes a fix would make."""
+        if diff.empty:
+            print("No routes would change")
+            return
+
+        print(diff.to_string(index=False, max_rows=50))
+
     def print_route_summary(self) -> None:
         """Print a summary of routes in the database."""
         conn = sqlite3.connect(self.db_path)
@@ -124,13 +172,14 @@ class RouteFixer:
 
 if __name__ == "__main__":
     fixer = RouteFixer()
+    dry_run = '--dry-run' in sys.argv
 
     # Print summary before fixing
     print("\nBefore fixing:")
     fixer.print_route_summary()
 
     # Fix the routes
-    fixer.fix_route_times()
+    fixer.fix_route_times(dry_run=dry_run)
 
     # Print summary after fixing
     print("\nAfter fixing:")
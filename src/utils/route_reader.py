@@ -1,8 +1,65 @@
 # src/utils/route_viewer.py
+import numpy as np
 import pandas as pd
 import sqlite3
 import os
 from datetime import datetime
+from pathlib import Path
+
+# Rows read from SQLite per chunk when streaming an export
+EXPORT_CHUNK_SIZE = 50_000
+
+ROUTES_QUERY = """
+    SELECT 
+        home_team,
+        away_team,
+        driving_duration,
+        transit_duration,
+        driving_distance / 1000.0 as driving_km,
+        transit_distance / 1000.0 as transit_km,
+        last_updated
+    FROM routes
+    ORDER BY home_team, away_team
+"""
+
+# Routes where the team plays on either side; each branch is served by an index
+TEAM_ROUTES_QUERY = """
+    SELECT 
+        home_team,
+        away_team,
+        driving_duration,
+        transit_duration,
+        driving_distance / 1000.0 as driving_km,
+        transit_distance / 1000.0 as transit_km,
+        last_updated
+    FROM routes
+    WHERE home_team = ? OR away_team = ?
+    ORDER BY home_team, away_team
+"""
+
+# Fixed dtypes so every chunk has the same schema, even when a chunk has no NULLs
+ROUTES_DTYPES = {
+    'driving_duration': 'Int64',
+    'transit_duration': 'Int64',
+    'driving_km': 'float64',
+    'transit_km': 'float64',
+}
+
+
+def ensure_team_indexes(conn):
+    """
+    Create the indexes used for per-team route lookups.
+
+    UNIQUE(home_team, away_team) already covers the home side; the away
+    side needs its own index so neither branch falls back to a full scan.
+    Called by the writers (RouteCalculator, EmissionsProcessor) and the
+    Streamlit setup; RouteViewer only reads.
+    """
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_routes_away_team
+        ON routes (away_team, home_team)
+    """)
+    conn.commit()
 
 
 class RouteViewer:
@@ -15,6 +72,10 @@ class RouteViewer:
         ))
         self.db_path = os.path.join(self.project_root, "data", "routes.db")
 
+    def connect(self):
+        """Read-only connection: the viewer works on read-only mounts and never writes."""
+        return sqlite3.connect(f"{Path(self.db_path).as_uri()}?mode=ro", uri=True)
+
     def format_time(self, seconds):
         """Convert seconds to hours and minutes format with minimums"""
         if pd.isna(seconds):
@@ -38,92 +99,152 @@ class RouteViewer:
                 return f"{hours} hours"
             return f"{hours} hours {minutes} minutes"
 
+    @staticmethod
+    def format_times(seconds: pd.Series) -> pd.Series:
+        """Vectorized format_time over a Series of durations in seconds"""
+        missing = seconds.isna()
+
+        # Enforce the 30 minute minimum, then split into hours and minutes
+        total = seconds.astype('float64').fillna(0).clip(lower=1800).astype('int64')
+        hours = total // 3600
+        minutes = (total % 3600) // 60
+
+        hour_text = pd.Series(
+            np.where(hours == 1, '1 hour', hours.astype(str) + ' hours'),
+            index=seconds.index
+        )
+        minute_text = minutes.astype(str) + ' minutes'
+
+        formatted = hour_text.where(minutes == 0, hour_text + ' ' + minute_text)
+        formatted = formatted.where(hours != 0, minute_text)
+        return formatted.where(~missing, 'N/A')
+
     def get_all_routes(self):
         """Get all routes with formatted times"""
         try:
-            conn = sqlite3.connect(self.db_path)
-
-            query = """
-            SELECT 
-                home_team,
-                away_team,
-                driving_duration,
-                transit_duration,
-                driving_distance / 1000.0 as driving_km,
-                transit_distance / 1000.0 as transit_km,
-                last_updated
-            FROM routes
-            ORDER BY home_team, away_team
-            """
-
-            df = pd.read_sql_query(query, conn)
+            conn = self.connect()
+
+            df = pd.read_sql_query(ROUTES_QUERY, conn)
             conn.close()
 
             # Add formatted columns
-            df['driving_time'] = df['driving_duration'].apply(self.format_time)
-            df['transit_time'] = df['transit_duration'].apply(self.format_time)
+            df['driving_time'] = self.format_times(df['driving_duration'])
+            df['transit_time'] = self.format_times(df['transit_duration'])
 
             return df
         except Exception as e:
             print(f"Error reading database: {str(e)}")
             return pd.DataFrame()
 
-    def export_routes(self, format='readable', output_path=None):
+    def export_routes(self, format='readable', output_path=None,
+                      file_format='csv', chunksize=EXPORT_CHUNK_SIZE):
         """
-        Export routes data to CSV.
+        Export routes data to CSV or Parquet.
+
+        Routes are streamed from SQLite in chunks and appended to the output
+        file, so memory use stays flat regardless of the table size. Raw
+        durations are written as integer seconds, empty where unknown.
 
         Args:
             format: 'readable' for formatted times or 'raw' for seconds
             output_path: Custom path for output file
+            file_format: 'csv' or 'parquet'
+            chunksize: Number of routes read and written per chunk
         """
-        df = self.get_all_routes()
-
-        if df.empty:
-            print("No data to export")
-            return
+        if file_format not in ('csv', 'parquet'):
+            raise ValueError(f"Unsupported export file format: {file_format}")
 
         # Generate default filename with timestamp
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        default_filename = f"routes_export_{timestamp}.csv"
+        default_filename = f"routes_export_{timestamp}.{file_format}"
 
         if not output_path:
             output_path = os.path.join(self.project_root, default_filename)
 
-        # Prepare data for export
         if format == 'readable':
-            export_df = df[[
-                'home_team',
-                'away_team',
-                'driving_time',
-                'transit_time',
-                'driving_km',
-                'transit_km',
-                'last_updated'
-            ]]
+            columns = ['home_team', 'away_team', 'driving_time', 'transit_time',
+                       'driving_km', 'transit_km', 'last_updated']
         else:  # raw format
-            export_df = df[[
-                'home_team',
-                'away_team',
-                'driving_duration',
-                'transit_duration',
-                'driving_km',
-                'transit_km',
-                'last_updated'
-            ]]
-
-        # Export to CSV
-        export_df.to_csv(output_path, index=False)
+            columns = ['home_team', 'away_team', 'driving_duration', 'transit_duration',
+                       'driving_km', 'transit_km', 'last_updated']
+
+        writer = None
+        total_exported = 0
+        conn = self.connect()
+
+        try:
+            chunks = pd.read_sql_query(ROUTES_QUERY, conn, chunksize=chunksize, dtype=ROUTES_DTYPES)
+
+            for chunk in chunks:
+                if format == 'readable':
+                    chunk['driving_time'] = self.format_times(chunk['driving_duration'])
+                    chunk['transit_time'] = self.format_times(chunk['transit_duration'])
+                chunk = chunk[columns]
+
+                if file_format == 'csv':
+                    chunk.to_csv(output_path, index=False, mode='w' if total_exported == 0 else 'a',
+                                 header=total_exported == 0)
+                else:
+                    if writer is None:
+                        writer = self._open_parquet_writer(output_path, columns)
+                    writer.write_table(self._to_arrow(chunk, writer.schema))
+
+                total_exported += len(chunk)
+        finally:
+            if writer is not None:
+                writer.close()
+            conn.close()
+
+        if total_exported == 0:
+            print("No data to export")
+            return
+
         print(f"Data exported to: {output_path}")
-        print(f"Total routes exported: {len(export_df)}")
+        print(f"Total routes exported: {total_exported}")
+
+    @staticmethod
+    def _open_parquet_writer(output_path, columns):
+        """Open an incremental Parquet writer with a fixed routes schema"""
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError("Parquet export requires pyarrow: pip install pyarrow")
+
+        types = {
+            'driving_duration': pa.int64(),
+            'transit_duration': pa.int64(),
+            'driving_km': pa.float64(),
+            'transit_km': pa.float64(),
+        }
+        schema = pa.schema([(column, types.get(column, pa.string())) for column in columns])
+        return pq.ParquetWriter(output_path, schema)
+
+    @staticmethod
+    def _to_arrow(chunk, schema):
+        """Convert a DataFrame chunk to an Arrow table with the writer's schema"""
+        import pyarrow as pa
+        return pa.Table.from_pandas(chunk, schema=schema, preserve_index=False)
+
+    def get_team_routes(self, team_name):
+        """Get all routes for a specific team with formatted times"""
+        try:
+            conn = self.connect()
+            df = pd.read_sql_query(TEAM_ROUTES_QUERY, conn, params=(team_name, team_name))
+            conn.close()
+
+            # Add formatted columns
+            df['driving_time'] = self.format_times(df['driving_duration'])
+            df['transit_time'] = self.format_times(df['transit_duration'])
+
+            return df
+        except Exception as e:
+            print(f"Error reading database: {str(e)}")
+            return pd.DataFrame()
 
     def show_team_routes(self, team_name):
         """Show all routes for a specific team"""
-        df = self.get_all_routes()
-
-        team_matches = df[
-            (df['home_team'] == team_name) |
-            (df['away_team'] == team_name)
-            ]
+        team_matches = self.get_team_routes(team_name)
 
         if team_matches.empty:
             print(f"No matches found for {team_name}")
@@ -0,0 +1,112 @@
+# src/utils/route_scheduler.py
+import sqlite3
+import sys
+import time
+from typing import List, Tuple
+
+
+# Routes older than this are considered stale
+MAX_ROUTE_AGE_DAYS = 30
+
+
+def epoch_now() -> int:
+    """Current time as integer seconds since the Unix epoch."""
+    return int(time.time())
+
+
+def ensure_freshness_column(conn: sqlite3.Connection) -> None:
+    """
+    Add and backfill the integer updated_epoch column on routes.
+
+    Only the first call on a database writes: later calls find the column
+    and the index in place and leave the file untouched.
+
+    last_updated holds a mix of '%Y-%m-%d %H:%M:%S' (RouteCalculator) and
+    '%m/%d/%Y %H:%M' (RouteFixer) strings, which can neither be compared
+    nor indexed reliably. updated_epoch is the normalized form used for
+    freshness checks.
+    """
+    columns = [row[1] for row in conn.execute("PRAGMA table_info(routes)")]
+    if 'updated_epoch' not in columns:
+        conn.execute("ALTER TABLE routes ADD COLUMN updated_epoch INTEGER")
+
+        # Backfill rows that only have a text timestamp, once: every writer
+        # stamps updated_epoch itself from then on
+        conn.execute("""
+            UPDATE routes
+            SET updated_epoch = CAST(strftime('%s',
+                CASE
+                    WHEN last_updated LIKE '__/__/____ %'
+                    THEN substr(last_updated, 7, 4) || '-' || substr(last_updated, 1, 2) || '-' ||
+                         substr(last_updated, 4, 2) || ' ' || substr(last_updated, 12)
+                    ELSE last_updated
+                END) AS INTEGER)
+            WHERE updated_epoch IS NULL AND last_updated IS NOT NULL
+        """)
+
+    # Covering index: stalest-first scans never touch the table rows
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_routes_updated_epoch
+        ON routes (updated_epoch, home_team, away_team)
+    """)
+    conn.commit()
+
+
+class StaleRouteScheduler:
+    """Feeds the stalest cached routes back to the route fetcher."""
+
+    def __init__(self, route_calculator, max_age_days: int = MAX_ROUTE_AGE_DAYS):
+        """
+        Args:
+            route_calculator: RouteCalculator used to fetch and save routes
+            max_age_days: Routes updated more recently than this are skipped
+        """
+        self.route_calculator = route_calculator
+        self.db_path = route_calculator.db_path
+        self.max_age_days = max_age_days
+
+        with sqlite3.connect(self.db_path) as conn:
+            ensure_freshness_column(conn)
+
+    def get_stalest_routes(self, limit: int) -> List[Tuple[str, str]]:
+        """Get the `limit` stalest (home_team, away_team) pairs past the age cutoff."""
+        cutoff = epoch_now() - self.max_age_days * 86400
+
+        with sqlite3.connect(self.db_path) as conn:
+            # Single ordered scan of idx_routes_updated_epoch; NULLs (never stamped) sort first
+            cursor = conn.execute("""
+                SELECT home_team, away_team
+                FROM routes
+                WHERE updated_epoch IS NULL OR updated_epoch < ?
+                ORDER BY updated_epoch
+                LIMIT ?
+            """, (cutoff, limit))
+            return cursor.fetchall()
+
+    def run(self, limit: int = 40, delay: int = 1) -> int:
+        """
+        Refresh up to `limit` stale routes.
+
+        Returns:
+            Number of routes refreshed
+        """
+        stale_routes = self.get_stalest_routes(limit)
+        print(f"Found {len(stale_routes)} stale routes to refresh")
+
+        refreshed = 0
+        for home_team, away_team in stale_routes:
+            if self.route_calculator.refresh_route(home_team, away_team):
+                refreshed += 1
+                print(f"Refreshed {home_team} vs {away_team}")
+                time.sleep(delay)
+
+        print(f"Refreshed {refreshed}/{len(stale_routes)} routes")
+        return refreshed
+
+
+if __name__ == "__main__":
+    from src.utils.route_calculator import RouteCalculator
+
+    batch_size = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    scheduler = StaleRouteScheduler(RouteCalculator())
+    scheduler.run(limit=batch_size)
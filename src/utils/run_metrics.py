@@ -0,0 +1,96 @@
+# src/utils/run_metrics.py
+import json
+import time
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+import numpy as np
+
+
+class RunMetrics:
+    """Cumulative stage timers, per-match latencies and a throughput gauge for batch runs."""
+
+    def __init__(self, total: int = 0, progress_interval: Optional[float] = None):
+        """
+        Args:
+            total: Number of matches the run expects to process
+            progress_interval: Seconds between progress lines (None disables them)
+        """
+        self.total = total
+        self.progress_interval = progress_interval
+        self.stage_seconds: Dict[str, float] = {}
+        self.stage_calls: Dict[str, int] = {}
+        self.latencies = []
+        self.rows = 0
+        self.failed = 0
+        self.start_time = time.perf_counter()
+        self._last_progress = self.start_time
+
+    @contextmanager
+    def stage(self, name: str):
+        """Time a block and add it to the named stage's cumulative total."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_stage_time(name, time.perf_counter() - start)
+
+    def add_stage_time(self, name: str, seconds: float, calls: int = 1) -> None:
+        """Add externally measured time (e.g. from a worker process) to a stage."""
+        self.stage_seconds[name] = self.stage_seconds.get(name, 0.0) + seconds
+        self.stage_calls[name] = self.stage_calls.get(name, 0) + calls
+
+    def record_match(self, seconds: float, success: bool = True) -> None:
+        """Record one match's end-to-end latency."""
+        self.latencies.append(seconds)
+        if not success:
+            self.failed += 1
+
+    def add_rows(self, count: int) -> None:
+        """Count rows written and print a progress line when the interval has elapsed."""
+        self.rows += count
+        if self.progress_interval is None:
+            return
+
+        now = time.perf_counter()
+        if now - self._last_progress >= self.progress_interval:
+            self._last_progress = now
+            print(f"Progress: {self.rows}/{self.total} rows, "
+                  f"{self.rows_per_second():,.0f} rows/s, {now - self.start_time:.1f}s elapsed")
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.start_time
+
+    def rows_per_second(self) -> float:
+        elapsed = self.elapsed()
+        return self.rows / elapsed if elapsed > 0 else 0.0
+
+    def summary(self, **extra) -> dict:
+        """Build the structured end-of-run summary."""
+        latencies_ms = np.array(self.latencies) * 1000
+        if len(latencies_ms):
+            p50, p90, p99 = np.percentile(latencies_ms, [50, 90, 99])
+            latency = {'p50': p50, 'p90': p90, 'p99': p99,
+                       'max': latencies_ms.max(), 'mean': latencies_ms.mean()}
+        else:
+            latency = {}
+
+        return {
+            **extra,
+            'matches': self.total,
+            'rows_written': self.rows,
+            'failed': self.failed,
+            'elapsed_s': round(self.elapsed(), 4),
+            'rows_per_second': round(self.rows_per_second(), 1),
+            'stages': {
+                name: {'seconds': round(seconds, 4), 'calls': self.stage_calls[name]}
+                for name, seconds in self.stage_seconds.items()
+            },
+            'match_latency_ms': {key: round(float(value), 4) for key, value in latency.items()}
+        }
+
+    def emit_summary(self, **extra) -> dict:
+        """Print the summary as one JSON document and return it."""
+        summary = self.summary(**extra)
+        print(json.dumps(summary, indent=2))
+        return summary
@@ -0,0 +1,155 @@
+# src/utils/streamlit_cache.py
+"""
+Process-wide cached resources and versioned data lookups for the Streamlit pages.
+
+Resources (calculators, the database handle, team lists) are built once per
+server process and shared by every session; callers must treat them as
+read-only. Data lookups are cached per data version: any write to the
+database changes the version, so stale results are never served. Heavy
+modules (PIL, numpy, the calculators) are imported by the factories, not
+by this module, to keep the entry points' cold start short.
+"""
+import os
+import sqlite3
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import streamlit as st
+
+from src.data.team_data import get_all_teams
+from src.utils.match_queries import (
+    competition_summary, count_matches, list_away_teams,
+    list_competitions, list_home_teams, list_matches
+)
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from src.data.world_snapshot import WorldSnapshot
+    from src.models.emissions import EmissionsCalculator
+    from src.utils.carbon_pricing.enhanced_calculator import EnhancedCarbonPricingCalculator
+    from src.utils.logo_manager import FootballLogoManager
+
+DB_PATH = 'data/routes.db'
+
+
+@st.cache_resource
+def get_emissions_calculator() -> 'EmissionsCalculator':
+    from src.models.emissions import EmissionsCalculator
+    return EmissionsCalculator()
+
+
+@st.cache_resource
+def get_pricing_calculator() -> 'EnhancedCarbonPricingCalculator':
+    from src.utils.carbon_pricing.enhanced_calculator import EnhancedCarbonPricingCalculator
+    return EnhancedCarbonPricingCalculator()
+
+
+@st.cache_resource
+def get_logo_manager() -> 'FootballLogoManager':
+    from src.utils.logo_manager import FootballLogoManager
+    return FootballLogoManager()
+
+
+@st.cache_resource
+def get_logo_sprites():
+    """Match card sprite sheet CSS and {team: logo HTML}, built once per process."""
+    return get_logo_manager().get_logo_sprites()
+
+
+@st.cache_resource
+def get_sorted_teams() -> list:
+    """All teams, sorted alphabetically."""
+    return sorted(get_all_teams())
+
+
+@st.cache_resource
+def get_db_connection(db_path: str = DB_PATH) -> sqlite3.Connection:
+    """
+    Shared read-only connection; sessions run on different threads.
+
+    The app never writes to the database: its query indexes are created in
+    the build step (python -m src.data.world_snapshot).
+    """
+    return sqlite3.connect(f"{Path(db_path).resolve().as_uri()}?mode=ro", uri=True, check_same_thread=False)
+
+
+@st.cache_resource(max_entries=1)
+def get_world_snapshot(data_version: str) -> 'WorldSnapshot':
+    """Memory-mapped reference data for the current database version, shared by every session."""
+    from src.data.world_snapshot import load_world_snapshot
+    # Compiled in the build step; the app only checks it is current
+    return load_world_snapshot(DB_PATH, rebuild=False)
+
+
+def get_data_version(db_path: str = DB_PATH) -> str:
+    """Token that changes whenever the database file is written."""
+    stat = os.stat(db_path)
+    return f"{stat.st_mtime_ns}-{stat.st_size}"
+
+
+@st.cache_data
+def load_competition_summary(data_version: str) -> 'pd.DataFrame':
+    """Per-competition summary, recomputed only when the database changes."""
+    return competition_summary(get_db_connection())
+
+
+@st.cache_data
+def load_competitions(data_version: str) -> list:
+    return list_competitions(get_db_connection())
+
+
+@st.cache_data
+def load_home_teams(competition, data_version: str) -> list:
+    return list_home_teams(get_db_connection(), competition)
+
+
+@st.cache_data
+def load_away_teams(home_team, data_version: str) -> list:
+    return list_away_teams(get_db_connection(), home_team)
+
+
+@st.cache_data
+def load_match_count(competition, home_team, away_team, data_version: str) -> int:
+    return count_matches(get_db_connection(), competition, home_team, away_team)
+
+
+@st.cache_data
+def load_match_page(competition, home_team, away_team, limit: int, offset: int,
+                    data_version: str) -> 'pd.DataFrame':
+    """Only the rows of the visible page."""
+    return list_matches(get_db_connection(), competition, home_team, away_team, limit, offset)
+
+
+@st.cache_data
+def load_route_emissions(distance_km: float, data_version: str):
+    """Latest stored transport data for a one-way distance, or None."""
+    return get_db_connection().execute("""
+        SELECT
+            transit_duration,
+            transit_distance,
+            rail_emissions,
+            driving_duration,
+            driving_distance,
+            bus_emissions
+        FROM match_emissions
+        WHERE distance_km = ?
+        ORDER BY last_updated DESC
+        LIMIT 1
+    """, (distance_km,)).fetchone()
+
+
+def load_team_salary(team: str, data_version: str):
+    """Gross salary cost per minute for a team, or None."""
+    return get_world_snapshot(data_version).salary(team)
+
+
+def clear_data_caches() -> None:
+    """Explicitly drop every cached data lookup (resources are kept)."""
+    load_competition_summary.clear()
+    load_competitions.clear()
+    load_home_teams.clear()
+    load_away_teams.clear()
+    load_match_count.clear()
+    load_match_page.clear()
+    load_route_emissions.clear()
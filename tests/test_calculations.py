@@ -0,0 +1,43 @@
+import math
+import unittest
+
+import numpy as np
+
+from src.utils.calculations import (
+    calculate_distance, calculate_distances, calculate_driving_time, calculate_driving_times,
+    calculate_transit_time, calculate_transit_times
+)
+
+# Band edges, their neighbours and a spread of ordinary distances
+DISTANCES = np.concatenate([
+    [0.0, 0.4, 49.999, 50.0, 50.001, 99.999, 100.0, 100.001, 499.999, 500.0, 500.001],
+    np.random.default_rng(0).uniform(0, 4000, 500)
+])
+
+
+class TestVectorizedRouteTimes(unittest.TestCase):
+    def test_driving_times(self):
+        times = calculate_driving_times(DISTANCES)
+        self.assertEqual(times.dtype, np.int64)
+        self.assertEqual(times.tolist(), [calculate_driving_time(d) for d in DISTANCES])
+
+    def test_transit_times(self):
+        times = calculate_transit_times(DISTANCES)
+        for distance, time in zip(DISTANCES, times):
+            expected = calculate_transit_time(distance)
+            if expected is None:
+                self.assertTrue(math.isnan(time), distance)
+            else:
+                self.assertEqual(time, expected, distance)
+
+    def test_distances(self):
+        rng = np.random.default_rng(1)
+        lat1, lat2 = rng.uniform(-60, 70, (2, 200))
+        lon1, lon2 = rng.uniform(-30, 60, (2, 200))
+        distances = calculate_distances(lat1, lon1, lat2, lon2)
+        for i in range(200):
+            self.assertAlmostEqual(distances[i], calculate_distance(lat1[i], lon1[i], lat2[i], lon2[i]), places=9)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+import itertools
+import math
+import unittest
+from dataclasses import fields
+
+import numpy as np
+
+from Cost_comparison import ModeShiftAnalyzer, RouteAnalysis, solve_mode_knapsack
+
+
+def same(a, b):
+    if a is None or b is None or isinstance(a, str):
+        return a == b
+    return math.isclose(a, b, rel_tol=1e-12)
+
+
+class TestModeShiftAnalyzer(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.analyzer = ModeShiftAnalyzer()
+
+    def test_frame_matches_analyze_route(self):
+        expected = [self.analyzer.analyze_route(row) for _, row in self.analyzer.routes_df.iterrows()]
+        expected = [route for route in expected if route]
+        detailed = self.analyzer.analyze_all_routes()['detailed_routes']
+
+        self.assertEqual(len(detailed), len(expected))
+        for route, reference in zip(detailed, expected):
+            for field in fields(RouteAnalysis):
+                self.assertTrue(same(getattr(route, field.name), getattr(reference, field.name)),
+                                f"{field.name}: {getattr(route, field.name)} != {getattr(reference, field.name)}")
+
+    def test_sweep_matches_per_threshold_analysis(self):
+        thresholds = [50.0, 200.0, 800.0, 5000.0]
+        sweep = self.analyzer.sweep_min_distance(thresholds)
+        for row, threshold in zip(sweep.itertuples(), thresholds):
+            summary = ModeShiftAnalyzer(min_distance=threshold).analyze_all_routes()
+            self.assertEqual(row.total_routes, summary['total_routes'])
+            self.assertEqual(row.rail_viable, summary['rail_viable'])
+            self.assertEqual(row.bus_viable, summary['bus_viable'])
+            self.assertAlmostEqual(row.total_air_emissions, summary['total_air_emissions'], places=6)
+            self.assertAlmostEqual(row.potential_rail_savings, summary['potential_rail_savings'], places=6)
+            self.assertAlmostEqual(row.potential_bus_savings, summary['potential_bus_savings'], places=6)
+
+
+class TestModeKnapsack(unittest.TestCase):
+    def test_matches_brute_force(self):
+        rng = np.random.default_rng(3)
+        for _ in range(20):
+            weights = rng.integers(0, 8, size=(7, 2))
+            values = rng.normal(1.0, 2.0, size=(7, 2))
+            values[rng.random((7, 2)) < 0.2] = -np.inf
+            budget = int(rng.integers(0, 25))
+
+            best = 0.0
+            for picks in itertools.product(range(3), repeat=7):
+                chosen = [(i, j - 1) for i, j in enumerate(picks) if j]
+                if sum(weights[i, j] for i, j in chosen) <= budget:
+                    best = max(best, sum(values[i, j] for i, j in chosen))
+
+            choice = solve_mode_knapsack(weights, values, budget)
+            chosen = [(i, j - 1) for i, j in enumerate(choice) if j]
+            self.assertLessEqual(sum(weights[i, j] for i, j in chosen), budget)
+            self.assertAlmostEqual(sum(values[i, j] for i, j in chosen), best)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,44 @@
+import importlib.util
+import shutil
+import tempfile
+import unittest
+
+import pandas as pd
+
+from src.utils.emissions_exporter import EmissionsExporter
+
+
+@unittest.skipUnless(importlib.util.find_spec('pyarrow'), "pyarrow is not installed")
+class TestEmissionsExporter(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.output_dir = tempfile.mkdtemp()
+        cls.exporter = EmissionsExporter('data/routes.db')
+        cls.expected = cls.exporter.read_match_emissions()
+        cls.exporter.export_parquet(cls.output_dir)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.output_dir)
+
+    def assert_same_rows(self, loaded, expected):
+        columns = [column for column in expected.columns if column != 'competition']
+        loaded = loaded.sort_values('id').reset_index(drop=True)
+        expected = expected.sort_values('id').reset_index(drop=True)
+        pd.testing.assert_frame_equal(loaded[columns], expected[columns], check_dtype=False)
+        self.assertEqual(loaded['competition'].astype(str).tolist(), expected['competition'].tolist())
+
+    def test_round_trip(self):
+        self.assert_same_rows(self.exporter.load_parquet(output_dir=self.output_dir), self.expected)
+
+    def test_partition_and_column_selection(self):
+        competition = self.expected['competition'].iloc[0]
+        loaded = self.exporter.load_parquet(columns=['id', 'total_emissions', 'competition'],
+                                            competitions=[competition], output_dir=self.output_dir)
+        expected = self.expected[self.expected['competition'] == competition][['id', 'total_emissions', 'competition']]
+        self.assertEqual(list(loaded.columns), ['id', 'total_emissions', 'competition'])
+        self.assert_same_rows(loaded, expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
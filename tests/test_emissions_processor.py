@@ -0,0 +1,49 @@
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+from contextlib import closing
+
+from emissions_processor import MATCH_COLUMNS, EmissionsProcessor
+
+# Enough routes for several parallel chunks while keeping the serial run short
+ROUTE_LIMIT = 150
+
+
+def emissions_rows(db_path):
+    with closing(sqlite3.connect(db_path)) as conn:
+        return conn.execute(f"SELECT id, {', '.join(MATCH_COLUMNS)} FROM match_emissions ORDER BY id").fetchall()
+
+
+class TestParallelEmissionsProcessor(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.temp_dir, 'routes.db')
+        shutil.copy('data/routes.db', self.db_path)
+        with closing(sqlite3.connect(self.db_path)) as conn:
+            conn.execute("DELETE FROM routes WHERE id NOT IN (SELECT id FROM routes ORDER BY id LIMIT ?)",
+                         (ROUTE_LIMIT,))
+            conn.commit()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def run_processor(self, **kwargs):
+        with closing(sqlite3.connect(self.db_path)) as conn:
+            conn.execute("DELETE FROM match_emissions")
+            conn.execute("DELETE FROM sqlite_sequence WHERE name = 'match_emissions'")
+            conn.commit()
+        summary = EmissionsProcessor(self.db_path).process_all_matches(progress_interval=3600, **kwargs)
+        self.assertIsNotNone(summary)
+        return emissions_rows(self.db_path)
+
+    def test_parallel_matches_serial(self):
+        serial = self.run_processor()
+        parallel = self.run_processor(parallel=True, workers=2, chunk_size=40, batch_size=60)
+        self.assertEqual(len(serial), ROUTE_LIMIT)
+        self.assertEqual(parallel, serial)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+import math
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from src.utils.carbon_pricing.financial_analysis import (
+    CONVENTIONAL_EMISSION_FACTOR, SAF_EMISSION_FACTOR, npv_components, npv_geometric, rank_break_even,
+    solve_break_even
+)
+
+
+def npv_loop(base_cost, growth, discount_rate, years):
+    return sum(base_cost * (1 + growth) ** t / (1 + discount_rate) ** t for t in range(years))
+
+
+def gap(t, saf_price, conventional_price, saf_growth, conventional_growth, carbon_price, carbon_growth):
+    carbon = carbon_price * (1 + carbon_growth) ** t
+    return (saf_price * (1 + saf_growth) ** t + SAF_EMISSION_FACTOR * carbon
+            - conventional_price * (1 + conventional_growth) ** t - CONVENTIONAL_EMISSION_FACTOR * carbon)
+
+
+class TestNpv(unittest.TestCase):
+    def test_matches_loop(self):
+        for growth, discount_rate in [(0.03, 0.05), (0.10, 0.02), (-0.05, 0.07), (0.05, 0.05), (0.0, 0.0)]:
+            for years in (1, 10, 30):
+                self.assertAlmostEqual(float(npv_geometric(1000.0, growth, discount_rate, years)),
+                                       npv_loop(1000.0, growth, discount_rate, years), places=6)
+
+    def test_broadcasts(self):
+        base = np.array([[100.0], [250.0]])
+        growth = np.array([0.02, 0.05, 0.08])
+        result = npv_geometric(base, growth, 0.05, 12)
+        self.assertEqual(result.shape, (2, 3))
+        for i in range(2):
+            for j in range(3):
+                self.assertAlmostEqual(result[i, j], npv_loop(base[i, 0], growth[j], 0.05, 12), places=6)
+
+    def test_components_sum(self):
+        total = npv_components({'fuel': 500.0, 'carbon': 200.0}, {'fuel': 0.04, 'carbon': 0.08}, 0.06, 10)
+        self.assertAlmostEqual(float(total), npv_loop(500.0, 0.04, 0.06, 10) + npv_loop(200.0, 0.08, 0.06, 10),
+                               places=6)
+
+
+class TestBreakEven(unittest.TestCase):
+    CASES = [
+        # saf_price, conventional_price, saf_growth, conventional_growth, carbon_price, carbon_growth
+        (2.50, 1.20, -0.03, 0.05, 88.0, 0.08),
+        (2.50, 1.20, 0.03, 0.05, 0.0, 0.0),
+        (1.00, 1.20, 0.00, 0.00, 0.0, 0.0),
+        (3.00, 1.00, -0.10, 0.10, 150.0, 0.15),
+        (2.00, 1.90, 0.01, 0.01, 60.0, 0.02)
+    ]
+
+    def test_matches_brute_force_scan(self):
+        horizon = 30
+        for case in self.CASES:
+            result = solve_break_even(*case, horizon=horizon)
+            year = next((t for t in range(horizon) if gap(t, *case) < 0), -1)
+            self.assertEqual(int(result['year']), year, case)
+            if year == -1:
+                self.assertTrue(math.isnan(result['crossing']))
+                self.assertTrue(math.isnan(result['saf_cost']))
+                continue
+
+            # First point of a fine scan before the break-even year where SAF is cheaper
+            grid = np.linspace(max(year - 1, 0), year, 100_001)
+            crossing = grid[np.argmax([gap(t, *case) < 0 for t in grid])]
+            self.assertAlmostEqual(float(result['crossing']), crossing, places=4)
+            self.assertAlmostEqual(float(result['saf_cost']),
+                                   case[0] * (1 + case[2]) ** year + SAF_EMISSION_FACTOR * case[4] * (1 + case[5]) ** year)
+
+    def test_vectorized_matches_scalar_calls(self):
+        carbon_prices = np.array([0.0, 50.0, 88.0, 200.0])
+        result = solve_break_even(2.5, 1.2, -0.03, 0.05, carbon_prices, 0.08)
+        for i, carbon_price in enumerate(carbon_prices):
+            single = solve_break_even(2.5, 1.2, -0.03, 0.05, carbon_price, 0.08)
+            self.assertEqual(result['year'][i], single['year'])
+            np.testing.assert_equal(result['crossing'][i], single['crossing'])
+
+    def test_rank_break_even(self):
+        fixtures = pd.DataFrame({'match': ['a', 'b', 'c'], 'carbon_price': [0.0, 200.0, 88.0]})
+        ranked = rank_break_even(fixtures, 2.5, 1.2, -0.03, 0.05, carbon_growth=0.08)
+        self.assertEqual(ranked['match'].tolist(), ['b', 'c', 'a'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+import unittest
+
+import numpy as np
+
+from src.utils.carbon_pricing.enhanced_calculator import EnhancedCarbonPricingCalculator
+from src.utils.carbon_pricing.forecast import CarbonCostForecaster, ForecastScenario, project_components
+
+SCENARIOS = [
+    ForecastScenario('Base', ets_prices={2024: 88.46, 2025: 95.0}, ets_growth=0.05),
+    ForecastScenario('High', ets_base_price=100.0, ets_growth=0.10, saf_blend=0.05,
+                     conventional_escalation=0.08, saf_price=3.0)
+]
+
+
+def scalar_forecast(scenario, base_year, year, emissions, fuel_usage, ets_applies):
+    """One flight, year and scenario, computed the way the original per-year loop did."""
+    offset = year - base_year
+    ets_price = scenario.ets_prices.get(year, scenario.ets_base_price * (1 + scenario.ets_growth) ** offset)
+    saf_requirement = scenario.saf_blend * (1 + scenario.saf_blend_growth) ** offset
+    conventional = fuel_usage * (1 - saf_requirement) * scenario.conventional_price * \
+        (1 + scenario.conventional_escalation) ** offset
+    saf = fuel_usage * saf_requirement * scenario.saf_price * (1 + scenario.saf_escalation) ** offset
+    carbon = emissions * ets_price if ets_applies else 0.0
+    return ets_price, conventional, saf, carbon, conventional + saf + carbon
+
+
+class TestCarbonCostForecaster(unittest.TestCase):
+    def test_tensors_match_scalar_loop(self):
+        emissions = np.array([12.5, 40.0, 3.2])
+        fuel = np.array([5000.0, 16000.0, 1300.0])
+        ets_applies = np.array([True, False, True])
+        forecaster = CarbonCostForecaster(SCENARIOS, base_year=2024, years=5)
+        tensors = forecaster.forecast(emissions, fuel, ets_applies)
+
+        self.assertEqual(tensors['total_cost'].shape, (3, 5, 2))
+        for f in range(3):
+            for y, year in enumerate(forecaster.calendar_years):
+                for s, scenario in enumerate(SCENARIOS):
+                    ets_price, conventional, saf, carbon, total = scalar_forecast(
+                        scenario, 2024, year, emissions[f], fuel[f], ets_applies[f])
+                    self.assertAlmostEqual(tensors['eu_ets_price'][y, s], ets_price)
+                    self.assertAlmostEqual(tensors['conventional_fuel_cost'][f, y, s], conventional)
+                    self.assertAlmostEqual(tensors['saf_fuel_cost'][f, y, s], saf)
+                    self.assertAlmostEqual(tensors['carbon_cost'][f, y, s], carbon)
+                    self.assertAlmostEqual(tensors['total_cost'][f, y, s], total)
+
+    def test_project_components(self):
+        base_costs = {'fuel': np.array([100.0, 250.0]), 'crew': 40.0}
+        rates = {'low': {'fuel': 0.02, 'crew': 0.01}, 'high': {'fuel': 0.10, 'crew': 0.03}}
+        projections = project_components(base_costs, rates, years=4)
+
+        for s, scenario in enumerate(rates.values()):
+            for year in range(4):
+                for f, fuel in enumerate(base_costs['fuel']):
+                    expected_fuel = fuel * (1 + scenario['fuel']) ** year
+                    expected_crew = 40.0 * (1 + scenario['crew']) ** year
+                    self.assertAlmostEqual(projections['fuel'][f, year, s], expected_fuel)
+                    self.assertAlmostEqual(projections['total'][f, year, s], expected_fuel + expected_crew)
+
+    def test_calculator_forecast_matches_original_formula(self):
+        calculator = EnhancedCarbonPricingCalculator()
+        forecast = calculator.calculate_carbon_costs('DE', 'FR', 20.0, 8000.0)['forecast']
+        blend = calculator.FUEL_PARAMS['saf']['blend_requirement']
+        for year, values in forecast.items():
+            offset = year - 2024
+            saf_requirement = blend * 1.25 ** offset
+            ets_price = calculator.EU_ETS_FORECAST[year]
+            self.assertAlmostEqual(values['eu_ets_price'], ets_price)
+            self.assertAlmostEqual(values['saf_requirement'], saf_requirement)
+            self.assertAlmostEqual(values['conventional_fuel_cost'], 8000.0 * (1 - saf_requirement) *
+                                   calculator.FUEL_PARAMS['conventional']['price'] * 1.05 ** offset)
+            self.assertAlmostEqual(values['saf_fuel_cost'], 8000.0 * saf_requirement *
+                                   calculator.FUEL_PARAMS['saf']['price'] * 1.03 ** offset)
+            self.assertAlmostEqual(values['carbon_cost'], 20.0 * ets_price)
+
+
+if __name__ == '__main__':
+    unittest.main()
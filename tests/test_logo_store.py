@@ -0,0 +1,124 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from PIL import Image
+
+from src.utils.logo_store import STATIC_URL, LogoStore
+
+
+class LogoStoreTestCase(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.logo_dir = os.path.join(self.temp_dir, 'logos')
+        self.league_dir = os.path.join(self.logo_dir, 'France - Ligue 1')
+        os.makedirs(self.league_dir)
+        self.write_logo('Paris Saint-Germain.png', (200, 100), 'blue')
+        self.write_logo('AS Saint-Étienne.png', (120, 120), 'green')
+        self.write_logo('Olympique Lyon.png', (80, 160), 'red')
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def write_logo(self, name, size, color):
+        path = os.path.join(self.league_dir, name)
+        Image.new('RGBA', size, color).save(path)
+        return path
+
+    def store(self):
+        return LogoStore(self.logo_dir, os.path.join(self.temp_dir, 'thumbnails'),
+                         os.path.join(self.temp_dir, 'static'))
+
+
+class TestLogoStore(LogoStoreTestCase):
+    def test_resolve_and_find_normalize(self):
+        store = self.store()
+        expected = os.path.join(self.league_dir, 'AS Saint-Étienne.png')
+        self.assertEqual(store.resolve('France - Ligue 1/AS Saint-Étienne.png'), expected)
+        self.assertEqual(store.resolve('France%20-%20Ligue%201/AS%20Saint-%C3%89tienne.png'), expected)
+        # Decomposed accent and different case
+        self.assertEqual(store.resolve('france - ligue 1/as saint-e\u0301tienne.png'), expected)
+        self.assertEqual(store.find('as saint-étienne'), expected)
+        self.assertIsNone(store.resolve('France - Ligue 1/Missing.png'))
+        self.assertIsNone(store.find('Missing'))
+
+    def test_thumbnail_size_and_cache(self):
+        store = self.store()
+        source = store.find('Paris Saint-Germain')
+        path = store.thumbnail_path(source, 60)
+        with Image.open(path) as img:
+            self.assertEqual(img.size, (60, 30))
+        self.assertEqual(store.load_thumbnail(source, 60).size, (60, 30))
+
+        # A second call reuses the file; a changed logo gets a new thumbnail
+        mtime = os.stat(path).st_mtime_ns
+        self.assertEqual(store.thumbnail_path(source, 60), path)
+        self.assertEqual(os.stat(path).st_mtime_ns, mtime)
+        Image.new('RGBA', (100, 100), 'black').save(source)
+        os.utime(source, ns=(mtime + 10 ** 9, mtime + 10 ** 9))
+        changed = store.thumbnail_path(source, 60)
+        self.assertNotEqual(changed, path)
+        with Image.open(changed) as img:
+            self.assertEqual(img.size, (60, 60))
+
+    def test_build_thumbnails(self):
+        store = self.store()
+        self.assertEqual(store.build_thumbnails((40, 80)), 3)
+        self.assertEqual(len(os.listdir(store.thumbnail_dir)), 6)
+
+
+class TestLogoAtlas(LogoStoreTestCase):
+    def sources(self, store):
+        return {
+            'PSG': store.find('Paris Saint-Germain'),
+            'Saint-Etienne': store.find('AS Saint-Étienne'),
+            'Lyon': store.find('Olympique Lyon'),
+            # Same file as PSG, so it shares the slot
+            'Paris SG': store.find('Paris Saint-Germain')
+        }
+
+    def test_slots_hold_thumbnails(self):
+        store = self.store()
+        sources = self.sources(store)
+        index = store.build_atlas(sources, 60)
+
+        self.assertEqual(index['logos']['PSG'], index['logos']['Paris SG'])
+        self.assertEqual(os.path.dirname(index['image']), store.static_dir)
+        self.assertEqual(index['url'], f"{STATIC_URL}/{os.path.basename(index['image'])}")
+        with Image.open(index['image']) as sheet:
+            self.assertEqual(list(sheet.size), index['size'])
+            for key, (x, y, width, height) in index['logos'].items():
+                thumbnail = store.load_thumbnail(sources[key], 60).convert('RGBA')
+                self.assertEqual((width, height), thumbnail.size)
+                self.assertEqual(sheet.crop((x, y, x + width, y + height)).tobytes(), thumbnail.tobytes(), key)
+
+        # Slots never overlap
+        boxes = list({tuple(box) for box in index['logos'].values()})
+        for i, (x1, y1, w1, h1) in enumerate(boxes):
+            for x2, y2, w2, h2 in boxes[i + 1:]:
+                self.assertTrue(x1 + w1 <= x2 or x2 + w2 <= x1 or y1 + h1 <= y2 or y2 + h2 <= y1)
+
+    def test_load_reuses_then_rebuilds_on_change(self):
+        store = self.store()
+        sources = self.sources(store)
+        first = store.load_atlas(sources, 60)
+        self.assertEqual(store.load_atlas(sources, 60), first)
+
+        # New logo content gives a new sheet URL, and the old sheet is removed
+        Image.new('RGBA', (90, 90), 'yellow').save(sources['Lyon'])
+        stat = os.stat(sources['Lyon'])
+        os.utime(sources['Lyon'], ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        second = store.load_atlas(sources, 60)
+        self.assertNotEqual(second['url'], first['url'])
+        self.assertFalse(os.path.exists(first['image']))
+        self.assertEqual(os.listdir(store.static_dir), [os.path.basename(second['image'])])
+
+        # A missing sheet is rebuilt under the same URL
+        os.remove(second['image'])
+        self.assertEqual(store.load_atlas(sources, 60)['url'], second['url'])
+        self.assertTrue(os.path.exists(second['image']))
+
+
+if __name__ == '__main__':
+    unittest.main()
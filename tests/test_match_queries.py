@@ -0,0 +1,137 @@
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+from contextlib import closing
+
+import numpy as np
+import pandas as pd
+
+from src.utils.match_queries import (
+    competition_summary, count_matches, ensure_match_indexes, list_away_teams, list_competitions, list_home_teams,
+    list_matches
+)
+
+
+def pandas_summary(conn):
+    """The per-competition aggregate computed with a pandas merge and groupby."""
+    routes = pd.read_sql_query("SELECT home_team, away_team, Competition FROM routes", conn)
+    emissions = pd.read_sql_query("SELECT home_team, away_team, distance_km, total_emissions FROM match_emissions",
+                                  conn)
+    merged = routes.dropna(subset=['Competition']).merge(emissions, on=['home_team', 'away_team'], how='left')
+    grouped = merged.groupby('Competition', sort=True)
+    summary = pd.DataFrame({
+        'Matches': grouped.size(),
+        'Matches With Emissions': grouped['total_emissions'].count(),
+        'Total Distance (km)': grouped['distance_km'].sum(),
+        'Total Emissions (tons)': 2 * grouped['total_emissions'].sum()
+    })
+    covered = summary['Matches With Emissions'].where(summary['Matches With Emissions'] > 0)
+    summary['Avg Distance (km)'] = summary['Total Distance (km)'] / covered
+    summary['Avg Emissions (tons)'] = summary['Total Emissions (tons)'] / covered
+    return summary
+
+
+class TestCompetitionSummary(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        db_path = os.path.join(self.temp_dir, 'routes.db')
+        shutil.copy('data/routes.db', db_path)
+        self.conn = sqlite3.connect(db_path)
+
+    def tearDown(self):
+        self.conn.close()
+        shutil.rmtree(self.temp_dir)
+
+    def assert_matches_pandas(self):
+        summary = competition_summary(self.conn).set_index('Competition')
+        expected = pandas_summary(self.conn)
+        self.assertEqual(summary.index.tolist(), expected.index.tolist())
+        for column in expected.columns:
+            np.testing.assert_allclose(summary[column].to_numpy(dtype=float), expected[column].to_numpy(dtype=float),
+                                       rtol=1e-12, err_msg=column)
+        return summary
+
+    def test_full_coverage(self):
+        summary = self.assert_matches_pandas()
+        self.assertTrue((summary['Matches With Emissions'] > 0).all())
+
+    def test_partial_coverage(self):
+        # Drop every other emissions row and all rows for one competition
+        competition = self.conn.execute("SELECT MIN(Competition) FROM routes").fetchone()[0]
+        self.conn.execute("DELETE FROM match_emissions WHERE id % 2 = 0")
+        self.conn.execute("""
+            DELETE FROM match_emissions WHERE (home_team, away_team) IN (
+                SELECT home_team, away_team FROM routes WHERE Competition = ?)
+        """, (competition,))
+        self.conn.commit()
+
+        summary = self.assert_matches_pandas()
+        self.assertLess(summary['Matches With Emissions'].sum(), summary['Matches'].sum())
+        self.assertEqual(summary.loc[competition, 'Matches With Emissions'], 0)
+        self.assertTrue(np.isnan(summary.loc[competition, 'Avg Emissions (tons)']))
+
+
+class TestMatchListing(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.conn = sqlite3.connect('data/routes.db')
+        cls.routes = pd.read_sql_query("SELECT id, home_team, away_team, Competition FROM routes ORDER BY id",
+                                       cls.conn)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.conn.close()
+
+    def filtered(self, competition=None, home_team=None, away_team=None):
+        routes = self.routes
+        for column, value in (('Competition', competition), ('home_team', home_team), ('away_team', away_team)):
+            if value is not None:
+                routes = routes[routes[column] == value]
+        return routes
+
+    def test_filters_and_pages_match_pandas(self):
+        competition = self.routes['Competition'].dropna().iloc[0]
+        home_team = self.filtered(competition)['home_team'].iloc[0]
+        away_team = self.filtered(competition, home_team)['away_team'].iloc[0]
+        for filters in ({}, {'competition': competition}, {'competition': competition, 'home_team': home_team},
+                        {'home_team': home_team}, {'away_team': away_team},
+                        {'competition': competition, 'home_team': home_team, 'away_team': away_team},
+                        {'home_team': 'No Such Team'}):
+            expected = self.filtered(**filters)
+            self.assertEqual(count_matches(self.conn, **filters), len(expected), filters)
+            for offset in (0, 20, len(expected) - 5):
+                page = list_matches(self.conn, limit=20, offset=max(offset, 0), **filters)
+                reference = expected.iloc[max(offset, 0):max(offset, 0) + 20]
+                self.assertEqual(page['id'].tolist(), reference['id'].tolist(), filters)
+                self.assertEqual(page['Home Team'].tolist(), reference['home_team'].tolist())
+                self.assertEqual(page['Away Team'].tolist(), reference['away_team'].tolist())
+
+    def test_option_lists(self):
+        competition = self.routes['Competition'].dropna().iloc[0]
+        home_team = self.routes['home_team'].iloc[0]
+        self.assertEqual(list_competitions(self.conn), sorted(self.routes['Competition'].dropna().unique()))
+        self.assertEqual(list_home_teams(self.conn), sorted(self.routes['home_team'].unique()))
+        self.assertEqual(list_home_teams(self.conn, competition),
+                         sorted(self.filtered(competition)['home_team'].unique()))
+        self.assertEqual(list_away_teams(self.conn, home_team),
+                         sorted(self.filtered(home_team=home_team)['away_team'].unique()))
+
+    def test_listing_uses_indexes(self):
+        temp_dir = tempfile.mkdtemp()
+        try:
+            db_path = os.path.join(temp_dir, 'routes.db')
+            shutil.copy('data/routes.db', db_path)
+            with closing(sqlite3.connect(db_path)) as conn:
+                ensure_match_indexes(conn)
+                for column in ('Competition', 'home_team', 'away_team'):
+                    plan = ' '.join(row[-1] for row in conn.execute(
+                        f"EXPLAIN QUERY PLAN SELECT COUNT(*) FROM routes WHERE {column} = ?", ('x',)))
+                    self.assertIn('INDEX', plan, column)
+        finally:
+            shutil.rmtree(temp_dir)
+
+
+if __name__ == '__main__':
+    unittest.main()
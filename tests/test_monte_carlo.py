@@ -0,0 +1,55 @@
+import unittest
+
+import numpy as np
+
+from src.utils.carbon_pricing.monte_carlo import DEFAULT_CORRELATION, DEFAULT_FACTORS, CostMonteCarlo
+
+BASE_COSTS = {'fuel': np.array([1000.0, 2500.0]), 'saf': 300.0, 'ets': 800.0}
+
+
+class TestCostMonteCarlo(unittest.TestCase):
+    def test_summary_matches_per_path_loop(self):
+        simulation = CostMonteCarlo(years=4, seed=7)
+        result = simulation.run(BASE_COSTS, fixed_cost=500.0, n_paths=400)
+
+        multipliers = np.concatenate(list(simulation.price_multipliers(400)))
+        season_base = {name: np.sum(cost) for name, cost in BASE_COSTS.items()}
+        totals = np.array([[500.0 + sum(season_base[name] * multipliers[path, year, i]
+                                        for i, name in enumerate(simulation.factor_names))
+                            for path in range(400)]
+                           for year in range(4)])
+
+        np.testing.assert_allclose(result['mean'], totals.mean(axis=1))
+        for q, values in result['quantiles'].items():
+            np.testing.assert_allclose(values, np.quantile(totals, q, axis=1))
+        self.assertEqual(result['histogram']['counts'].sum(), 400)
+
+    def test_seed_determinism(self):
+        first = CostMonteCarlo(seed=3).run(BASE_COSTS, n_paths=1000)
+        second = CostMonteCarlo(seed=3).run(BASE_COSTS, n_paths=1000)
+        other = CostMonteCarlo(seed=4).run(BASE_COSTS, n_paths=1000)
+        np.testing.assert_array_equal(first['mean'], second['mean'])
+        self.assertFalse(np.array_equal(first['mean'], other['mean']))
+
+    def test_multiplier_moments(self):
+        simulation = CostMonteCarlo(years=3, seed=11)
+        multipliers = np.concatenate(list(simulation.price_multipliers(200_000)))
+        for i, name in enumerate(simulation.factor_names):
+            expected = (1 + DEFAULT_FACTORS[name]['drift']) ** np.arange(1, 4)
+            np.testing.assert_allclose(multipliers[:, :, i].mean(axis=0), expected, rtol=0.01)
+
+        # First-year log returns carry the configured shock correlation
+        correlation = np.corrcoef(np.log(multipliers[:, 0, :]).T)
+        np.testing.assert_allclose(correlation, DEFAULT_CORRELATION, atol=0.01)
+
+    def test_invalid_inputs(self):
+        with self.assertRaises(ValueError):
+            CostMonteCarlo().run({'charter': 100.0}, n_paths=10)
+        with self.assertRaises(ValueError):
+            CostMonteCarlo(correlation=np.eye(2))
+        with self.assertRaises(ValueError):
+            CostMonteCarlo(correlation=[[1.0, 2.0, 0.0], [2.0, 1.0, 0.0], [0.0, 0.0, 1.0]])
+
+
+if __name__ == '__main__':
+    unittest.main()
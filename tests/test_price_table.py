@@ -0,0 +1,63 @@
+import unittest
+
+import numpy as np
+
+from src.config.constants import CARBON_PRICES_EUR, EU_ETS_FORECAST, EU_ETS_PRICE, EUR_TO_GBP
+from src.data.team_data import TEAM_COUNTRIES
+from src.utils.carbon_pricing.enhanced_calculator import EnhancedCarbonPricingCalculator
+from src.utils.carbon_pricing.price_table import get_price_table
+from src.utils.calculations import get_carbon_price
+
+
+class TestPriceTableYears(unittest.TestCase):
+    def setUp(self):
+        self.table = get_price_table()
+        self.last_year = max(EU_ETS_FORECAST)
+
+    def test_forecast_years(self):
+        for year, price in EU_ETS_FORECAST.items():
+            self.assertEqual(self.table.ets_price(year), price)
+            self.assertAlmostEqual(self.table.price('DE', 'FR', year), price + self.table.national_tax('DE'))
+
+    def test_later_years_use_last_forecast_year(self):
+        for year in (self.last_year + 1, self.last_year + 10):
+            self.assertEqual(self.table.ets_price(year), EU_ETS_FORECAST[self.last_year])
+            self.assertEqual(self.table.price('SE', 'FR', year), self.table.price('SE', 'FR', self.last_year))
+
+    def test_earlier_years_raise(self):
+        first_year = min(EU_ETS_FORECAST)
+        with self.assertRaisesRegex(ValueError, str(first_year)):
+            self.table.price('DE', 'FR', first_year - 1)
+        with self.assertRaises(ValueError):
+            EnhancedCarbonPricingCalculator().calculate_carbon_costs_batch(['DE'], ['FR'], [1.0], [1.0], year=2000)
+
+
+class TestPricingEquivalence(unittest.TestCase):
+    def test_batch_matches_scalar(self):
+        calculator = EnhancedCarbonPricingCalculator()
+        countries = sorted(set(TEAM_COUNTRIES.values()) | {'XX'})
+        origins = np.repeat(countries, len(countries))
+        destinations = np.tile(countries, len(countries))
+        emissions = np.linspace(1.0, 50.0, len(origins))
+        fuel = emissions * 400
+
+        batch = calculator.calculate_carbon_costs_batch(origins, destinations, emissions, fuel)
+        for i in range(len(origins)):
+            costs = calculator.calculate_carbon_costs(origins[i], destinations[i], emissions[i], fuel[i])
+            current = costs['current_costs']
+            self.assertAlmostEqual(batch['eu_ets'][i], current['eu_ets'])
+            self.assertAlmostEqual(batch['national'][i], current['national'])
+            self.assertAlmostEqual(batch['total'][i], current['total'])
+
+    def test_get_carbon_price(self):
+        teams = sorted(TEAM_COUNTRIES)[::7]
+        for away in teams:
+            for home in teams:
+                expected = CARBON_PRICES_EUR.get(TEAM_COUNTRIES[away], EU_ETS_PRICE)
+                if TEAM_COUNTRIES[home] == 'GB':
+                    expected *= EUR_TO_GBP
+                self.assertAlmostEqual(get_carbon_price(away, home), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import json
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+
+from src.utils.run_metrics import RunMetrics
+
+
+class TestRunMetrics(unittest.TestCase):
+    def test_stages_accumulate(self):
+        metrics = RunMetrics()
+        with metrics.stage('load'):
+            pass
+        metrics.add_stage_time('compute', 1.5, calls=10)
+        metrics.add_stage_time('compute', 0.5, calls=5)
+
+        stages = metrics.summary()['stages']
+        self.assertEqual(stages['compute'], {'seconds': 2.0, 'calls': 15})
+        self.assertEqual(stages['load']['calls'], 1)
+        self.assertGreaterEqual(stages['load']['seconds'], 0)
+
+    def test_stage_time_kept_when_block_raises(self):
+        metrics = RunMetrics()
+        with self.assertRaises(RuntimeError):
+            with metrics.stage('write'):
+                raise RuntimeError
+        self.assertEqual(metrics.stage_calls['write'], 1)
+
+    def test_latency_percentiles_and_failures(self):
+        metrics = RunMetrics(total=100)
+        for i in range(1, 101):
+            metrics.record_match(i / 1000, success=i % 10 != 0)
+        metrics.add_rows(90)
+
+        summary = metrics.summary(mode='serial')
+        self.assertEqual(summary['mode'], 'serial')
+        self.assertEqual((summary['matches'], summary['rows_written'], summary['failed']), (100, 90, 10))
+        latency = summary['match_latency_ms']
+        self.assertAlmostEqual(latency['p50'], 50.5)
+        self.assertAlmostEqual(latency['max'], 100.0)
+        self.assertAlmostEqual(latency['mean'], 50.5)
+
+    def test_empty_run(self):
+        self.assertEqual(RunMetrics().summary()['match_latency_ms'], {})
+
+    def test_emit_summary_prints_json(self):
+        metrics = RunMetrics(total=3)
+        metrics.add_rows(3)
+        output = StringIO()
+        with redirect_stdout(output):
+            summary = metrics.emit_summary(workers=2)
+        self.assertEqual(json.loads(output.getvalue()), summary)
+
+    def test_progress_lines(self):
+        metrics = RunMetrics(total=10, progress_interval=0)
+        output = StringIO()
+        with redirect_stdout(output):
+            metrics.add_rows(4)
+        self.assertIn("Progress: 4/10 rows", output.getvalue())
+
+        silent = RunMetrics(total=10)
+        output = StringIO()
+        with redirect_stdout(output):
+            silent.add_rows(4)
+        self.assertEqual(output.getvalue(), "")
+
+
+if __name__ == '__main__':
+    unittest.main()
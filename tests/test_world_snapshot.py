@@ -0,0 +1,112 @@
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+from contextlib import closing
+
+import numpy as np
+
+from src.config.constants import DEFAULT_CARBON_PRICE
+from src.data.team_data import get_airport_coordinates, get_team_airport
+from src.data.world_snapshot import (
+    build_snapshot, load_world_snapshot, open_world_snapshot, snapshot_path_for, source_fingerprint
+)
+from src.utils.calculations import calculate_distance, get_carbon_price
+
+
+def scalar_distance(home_team, away_team):
+    home = get_airport_coordinates(get_team_airport(home_team))
+    away = get_airport_coordinates(get_team_airport(away_team))
+    if not home or not away:
+        return None
+    return calculate_distance(home['lat'], home['lon'], away['lat'], away['lon'])
+
+
+class WorldSnapshotTestCase(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.temp_dir, 'routes.db')
+        shutil.copy('data/routes.db', self.db_path)
+        open_world_snapshot.cache_clear()
+
+    def tearDown(self):
+        open_world_snapshot.cache_clear()
+        shutil.rmtree(self.temp_dir)
+
+    def execute(self, sql, params=()):
+        with closing(sqlite3.connect(self.db_path)) as conn:
+            rows = conn.execute(sql, params).fetchall()
+            conn.commit()
+        return rows
+
+
+class TestSnapshotLookups(WorldSnapshotTestCase):
+    def setUp(self):
+        super().setUp()
+        self.snapshot = build_snapshot(snapshot_path_for(self.db_path), self.db_path)
+        self.routes = self.execute("""
+            SELECT home_team, away_team, driving_duration, transit_duration, driving_distance, transit_distance
+            FROM routes
+        """)
+
+    def test_distances_and_prices_match_scalar(self):
+        home_teams = [row[0] for row in self.routes] + ['No Such Team']
+        away_teams = [row[1] for row in self.routes] + [self.routes[0][1]]
+        home_ids = self.snapshot.team_ids(home_teams)
+        away_ids = self.snapshot.team_ids(away_teams)
+        distances = self.snapshot.distances(home_ids, away_ids)
+        known = (home_ids >= 0) & (away_ids >= 0)
+        prices = self.snapshot.carbon_prices(away_ids[known], home_ids[known], DEFAULT_CARBON_PRICE)
+
+        for i, (home_team, away_team) in enumerate(zip(home_teams, away_teams)):
+            expected = scalar_distance(home_team, away_team)
+            if expected is None:
+                self.assertTrue(np.isnan(distances[i]), (home_team, away_team))
+            else:
+                self.assertEqual(distances[i], expected, (home_team, away_team))
+            self.assertEqual(self.snapshot.distance(home_team, away_team), expected)
+        for price, home_team, away_team in zip(prices, np.array(home_teams)[known], np.array(away_teams)[known]):
+            self.assertEqual(price, get_carbon_price(away_team, home_team), (home_team, away_team))
+
+    def test_routes_and_salaries_match_tables(self):
+        for home_team, away_team, *values in self.routes:
+            expected = tuple(None if value is None else int(value) for value in values)
+            self.assertEqual(self.snapshot.route(home_team, away_team), expected)
+        self.assertIsNone(self.snapshot.route('No Such Team', self.routes[0][1]))
+
+        for team, in self.execute("SELECT DISTINCT team FROM team_salaries WHERE team IS NOT NULL"):
+            salary = self.execute("SELECT gross_per_minute FROM team_salaries WHERE team = ? LIMIT 1", (team,))[0][0]
+            self.assertEqual(self.snapshot.salary(team), salary, team)
+        self.assertIsNone(self.snapshot.salary('No Such Team'))
+
+
+class TestSnapshotFreshness(WorldSnapshotTestCase):
+    def test_fingerprint_ignores_unread_tables_and_indexes(self):
+        fingerprint = source_fingerprint(self.db_path)
+        self.execute("UPDATE match_emissions SET total_emissions = total_emissions + 1")
+        self.execute("CREATE INDEX IF NOT EXISTS idx_test_routes_competition ON routes (Competition)")
+        self.assertEqual(source_fingerprint(self.db_path), fingerprint)
+
+        self.execute("UPDATE routes SET driving_duration = driving_duration + 60 WHERE id = "
+                     "(SELECT MIN(id) FROM routes WHERE driving_duration IS NOT NULL)")
+        self.assertNotEqual(source_fingerprint(self.db_path), fingerprint)
+
+    def test_stale_snapshot_raises_without_rebuild(self):
+        with self.assertRaises(RuntimeError):
+            load_world_snapshot(self.db_path, rebuild=False)
+
+        snapshot = load_world_snapshot(self.db_path)
+        self.assertEqual(snapshot.fingerprint, source_fingerprint(self.db_path))
+        self.assertIs(load_world_snapshot(self.db_path, rebuild=False), snapshot)
+
+        self.execute("DELETE FROM routes WHERE id = (SELECT MAX(id) FROM routes)")
+        with self.assertRaises(RuntimeError):
+            load_world_snapshot(self.db_path, rebuild=False)
+        rebuilt = load_world_snapshot(self.db_path)
+        self.assertEqual(rebuilt.fingerprint, source_fingerprint(self.db_path))
+        self.assertEqual(len(rebuilt.route_home), len(self.execute("SELECT id FROM routes")))
+
+
+if __name__ == '__main__':
+    unittest.main()